@@ -0,0 +1,231 @@
+"""Benchmark the storage provider operations.
+
+Runs save_file, get_file, is_file, and delete_file against LocalStorageProvider and (when moto
+is installed) S3StorageProvider backed by an in-process moto S3 stand-in, over a grid of
+object sizes and concurrency levels. For each operation the throughput (ops/s and MB/s), the
+latency (p50 and p99), and the peak Python heap allocations of the operation (heap MB, traced
+with tracemalloc, so each grid cell is measured on its own) are reported. The heap peak is not
+the RSS of the process, it excludes memory allocated outside of the Python allocator (e.g.,
+by OpenSSL). Tracing the allocations slows down the operations, use --no-memory for the most
+accurate throughput and latency.
+
+.. code-block:: bash
+
+    > python benchmarks/bench_providers.py
+    > python benchmarks/bench_providers.py --providers local --sizes 4KiB,1MiB --concurrency 1,16
+    > python benchmarks/bench_providers.py --json > bench.json
+
+The S3 results measure the client side of the provider (boto3 request handling, transfer
+manager, threading) since moto does not add network latency, so they are useful to catch
+regressions in the provider, not to predict S3 latency.
+"""
+# standard library
+import argparse
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+# allow running the benchmark from a source checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# first-party
+# pylint: disable=wrong-import-position
+from falcon_provider_storage.local import LocalStorageProvider  # noqa: E402
+from falcon_provider_storage.s3 import S3StorageProvider  # noqa: E402
+from falcon_provider_storage.utils import StorageProviderABC  # noqa: E402
+
+OPERATIONS = ('save_file', 'get_file', 'is_file', 'delete_file')
+UNITS = {'B': 1, 'KIB': 1024, 'MIB': 1024**2, 'GIB': 1024**3}
+
+
+def parse_size(size: str) -> int:
+    """Return the size in bytes of a human readable size (e.g., 64KiB)."""
+    size = size.strip().upper()
+    for unit, multiplier in sorted(UNITS.items(), key=lambda item: -len(item[0])):
+        if size.endswith(unit):
+            return int(float(size[: -len(unit)]) * multiplier)
+    return int(size)
+
+
+def percentile(latencies: list[float], percent: float) -> float:
+    """Return the percentile of the sorted latencies."""
+    index = min(len(latencies) - 1, max(0, round(percent / 100 * len(latencies)) - 1))
+    return latencies[index]
+
+
+def timed(func: Callable, args: tuple, expected: object = None) -> float:
+    """Return the duration in seconds of the function call.
+
+    Raises:
+        RuntimeError: Raised if the result is not the expected result (e.g., a delete_file
+            that did not delete the file), so the benchmark never times no-ops.
+    """
+    start = time.perf_counter()
+    result = func(*args)
+    duration = time.perf_counter() - start
+    if expected is not None and result != expected:
+        raise RuntimeError(f'{func.__name__}{args} returned {result!r}, expected {expected!r}.')
+    return duration
+
+
+def operation_calls(
+    provider: StorageProviderABC, operation: str, keys: list[str], payload: bytes
+) -> list[tuple[Callable, tuple, object]]:
+    """Return the calls (method, arguments, and expected result) of the operation for each key."""
+    if operation == 'save_file':
+        return [(provider.save_file, (io.BytesIO(payload), key), None) for key in keys]
+    if operation == 'delete_file':
+        # delete_file takes the path in the bucket (e.g., the path returned by save_file)
+        return [(provider.delete_file, (provider.storage_path(key),), True) for key in keys]
+    if operation == 'is_file':
+        return [(provider.is_file, (key,), True) for key in keys]
+    return [(getattr(provider, operation), (key,), None) for key in keys]
+
+
+def run_operation(
+    provider: StorageProviderABC,
+    operation: str,
+    keys: list[str],
+    payload: bytes,
+    concurrency: int,
+    memory: bool = True,
+) -> dict:
+    """Run the operation for each key and return the throughput, latency, and memory results."""
+    calls = operation_calls(provider, operation, keys, payload)
+    if memory:
+        # only the allocations of this grid cell are traced (not the payload or earlier cells)
+        tracemalloc.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = sorted(executor.map(lambda call: timed(*call), calls))
+    elapsed = time.perf_counter() - start
+    peak_heap = None
+    if memory:
+        peak_heap = tracemalloc.get_traced_memory()[1] / 1024**2
+        tracemalloc.stop()
+
+    transferred = len(payload) * len(keys) if operation in ('get_file', 'save_file') else 0
+    return {
+        'operation': operation,
+        'ops': len(keys),
+        'ops_per_sec': len(keys) / elapsed,
+        'mb_per_sec': transferred / elapsed / 1024**2,
+        'p50_ms': percentile(latencies, 50) * 1000,
+        'p99_ms': percentile(latencies, 99) * 1000,
+        'mean_ms': statistics.fmean(latencies) * 1000,
+        'peak_heap_mb': peak_heap,
+    }
+
+
+def run_grid(
+    name: str,
+    provider: StorageProviderABC,
+    sizes: list[int],
+    concurrency_levels: list[int],
+    ops: int,
+    operations: list[str],
+    memory: bool = True,
+) -> list[dict]:
+    """Run the operations for each object size and concurrency level."""
+    results = []
+    for size in sizes:
+        payload = os.urandom(size)
+        for concurrency in concurrency_levels:
+            keys = [f'bench/{size}/{concurrency}/{index}.bin' for index in range(ops)]
+            for operation in operations:
+                result = run_operation(provider, operation, keys, payload, concurrency, memory)
+                result.update({'provider': name, 'size': size, 'concurrency': concurrency})
+                results.append(result)
+    return results
+
+
+def print_table(results: list[dict]):
+    """Print the results as a table."""
+    print(
+        f'{"provider":<8} {"operation":<12} {"size":>9} {"conc":>5} {"ops/s":>10} '
+        f'{"MB/s":>9} {"p50 ms":>8} {"p99 ms":>8} {"heap MB":>9}'
+    )
+    for result in results:
+        peak_heap = result['peak_heap_mb']
+        print(
+            f'{result["provider"]:<8} {result["operation"]:<12} {result["size"]:>9} '
+            f'{result["concurrency"]:>5} {result["ops_per_sec"]:>10.1f} '
+            f'{result["mb_per_sec"]:>9.2f} {result["p50_ms"]:>8.3f} {result["p99_ms"]:>8.3f} '
+            f'{"-" if peak_heap is None else f"{peak_heap:.1f}":>9}'
+        )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Return the parsed command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', maxsplit=1)[0])
+    parser.add_argument('--providers', default='local,s3', help='Comma separated providers.')
+    parser.add_argument('--sizes', default='1KiB,64KiB,1MiB', help='Comma separated sizes.')
+    parser.add_argument('--concurrency', default='1,8,32', help='Comma separated thread counts.')
+    parser.add_argument('--ops', default=200, type=int, help='Operations per grid cell.')
+    parser.add_argument('--operations', default=','.join(OPERATIONS), help='Operations to run.')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON.')
+    parser.add_argument(
+        '--no-memory', action='store_false', dest='memory', help='Do not trace heap allocations.'
+    )
+    args = parser.parse_args(argv)
+
+    args.sizes = [parse_size(size) for size in args.sizes.split(',')]
+    args.concurrency = [int(level) for level in args.concurrency.split(',')]
+    args.operations = [operation for operation in args.operations.split(',') if operation]
+    args.providers = [provider for provider in args.providers.split(',') if provider]
+    return args
+
+
+def run_local(args: argparse.Namespace) -> list[dict]:
+    """Run the benchmarks of the local provider in a temporary directory."""
+    with tempfile.TemporaryDirectory(prefix='bench-storage-') as directory:
+        provider = LocalStorageProvider(bucket=directory)
+        return run_grid(
+            'local', provider, args.sizes, args.concurrency, args.ops, args.operations, args.memory
+        )
+
+
+def run_s3(args: argparse.Namespace) -> list[dict]:
+    """Run the benchmarks of the S3 provider against moto, if installed."""
+    try:
+        # third-party
+        from moto import mock_aws  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        print('Skipping s3 benchmarks, moto is not installed.', file=sys.stderr)
+        return []
+
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    with mock_aws():
+        provider = S3StorageProvider('benchmark', 'testing', 'testing')
+        provider.client.create_bucket(Bucket='benchmark')
+        return run_grid(
+            's3', provider, args.sizes, args.concurrency, args.ops, args.operations, args.memory
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks."""
+    args = parse_args(argv)
+
+    results = []
+    if 'local' in args.providers:
+        results.extend(run_local(args))
+    if 's3' in args.providers:
+        results.extend(run_s3(args))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""Benchmark the S3StorageProvider startup time and connection usage.
+
+Compares the provider (a single boto3 session and client) with the previous setup of a
+boto3 client plus a separate boto3 resource (which creates a second client, on the default
+session, with its own connection pool). For each setup the construction time (median of
+--runs), the number of botocore clients created, and the number of sockets open after running
+is_file, get_file, and delete_file are reported.
+
+.. code-block:: bash
+
+    > python benchmarks/bench_s3_startup.py
+    > python benchmarks/bench_s3_startup.py --endpoint-url http://localhost:9000 --bucket test
+
+Without --endpoint-url an in-process moto S3 stand-in is used, which does not open sockets,
+so the socket counts are only meaningful against a real S3 compatible endpoint.
+"""
+# standard library
+import argparse
+import gc
+import os
+import statistics
+import sys
+import time
+import weakref
+from collections.abc import Callable
+
+# allow running the benchmark from a source checkout without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# first-party
+# pylint: disable=wrong-import-position
+from falcon_provider_storage.s3 import S3StorageProvider  # noqa: E402
+
+
+def open_sockets() -> int | None:
+    """Return the number of sockets open by the process (Linux only)."""
+    if not os.path.isdir('/proc/self/fd'):  # pragma: no cover
+        return None
+
+    count = 0
+    for fd in os.listdir('/proc/self/fd'):
+        try:
+            count += os.readlink(f'/proc/self/fd/{fd}').startswith('socket:')
+        except OSError:
+            continue
+    return count
+
+
+def botocore_clients() -> int:
+    """Return the number of live botocore clients."""
+    # third-party
+    from botocore.client import BaseClient  # pylint: disable=import-outside-toplevel
+
+    gc.collect()
+    return sum(
+        isinstance(obj, BaseClient) and not isinstance(obj, weakref.ProxyTypes)
+        for obj in gc.get_objects()
+    )
+
+
+def legacy_setup(args: argparse.Namespace) -> tuple[Callable, Callable, Callable]:
+    """Return the is_file, get_file, and delete_file calls of the client plus resource setup."""
+    # third-party
+    import boto3  # pylint: disable=import-outside-toplevel
+
+    client = boto3.client(
+        's3',
+        aws_access_key_id=args.aws_access_key_id,
+        aws_secret_access_key=args.aws_secret_access_key,
+        endpoint_url=args.endpoint_url,
+    )
+    resource = boto3.resource('s3', endpoint_url=args.endpoint_url)
+    return (
+        lambda key: resource.Object(args.bucket, key).load(),
+        lambda key: client.get_object(Bucket=args.bucket, Key=key)['Body'].read(),
+        lambda key: resource.Object(args.bucket, key).delete(),
+    )
+
+
+def provider_setup(args: argparse.Namespace) -> tuple[Callable, Callable, Callable]:
+    """Return the is_file, get_file, and delete_file calls of the provider."""
+    provider = S3StorageProvider(
+        args.bucket,
+        args.aws_access_key_id,
+        args.aws_secret_access_key,
+        endpoint_url=args.endpoint_url,
+    )
+    return provider.is_file, provider.get_file, provider.delete_file
+
+
+def startup_time(setup: Callable, args: argparse.Namespace) -> float:
+    """Return the median duration in seconds of the setup over --runs."""
+    durations = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        setup(args)
+        durations.append(time.perf_counter() - start)
+    gc.collect()
+    return statistics.median(durations)
+
+
+def connection_usage(
+    setup: Callable, args: argparse.Namespace, client: object
+) -> tuple[int, int | None]:
+    """Return the clients created by the setup and the sockets opened running the operations."""
+    clients_before = botocore_clients()
+    sockets_before = open_sockets()
+    is_file, get_file, delete_file = setup(args)
+    clients = botocore_clients() - clients_before
+
+    for index in range(args.ops):
+        key = f'bench-startup/{index}.bin'
+        client.put_object(Bucket=args.bucket, Key=key, Body=b'x' * 1024)
+        is_file(key)
+        get_file(key)
+        delete_file(key)
+
+    if sockets_before is None:  # pragma: no cover
+        return clients, None
+    return clients, open_sockets() - sockets_before
+
+
+def measure(name: str, setup: Callable, args: argparse.Namespace, client: object) -> dict:
+    """Return the startup time, clients, and sockets of the setup."""
+    startup = startup_time(setup, args)
+    clients, sockets = connection_usage(setup, args, client)
+    return {
+        'setup': name,
+        'startup_ms': startup * 1000,
+        'clients': clients,
+        'sockets': sockets,
+    }
+
+
+def run(args: argparse.Namespace) -> list[dict]:
+    """Run the benchmark for both setups."""
+    # third-party
+    import boto3  # pylint: disable=import-outside-toplevel
+
+    client = boto3.client(
+        's3',
+        aws_access_key_id=args.aws_access_key_id,
+        aws_secret_access_key=args.aws_secret_access_key,
+        endpoint_url=args.endpoint_url,
+    )
+    if args.create_bucket:
+        client.create_bucket(Bucket=args.bucket)
+
+    return [
+        measure('client + resource', legacy_setup, args, client),
+        measure('provider', provider_setup, args, client),
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n', maxsplit=1)[0])
+    parser.add_argument('--endpoint-url', help='The S3 compatible endpoint (default: moto).')
+    parser.add_argument('--bucket', default='benchmark', help='The bucket name.')
+    parser.add_argument('--runs', default=20, type=int, help='Startup runs per setup.')
+    parser.add_argument('--ops', default=20, type=int, help='Operations after startup.')
+    args = parser.parse_args(argv)
+    args.aws_access_key_id = os.getenv('AWS_ACCESS_KEY_ID', 'testing')
+    args.aws_secret_access_key = os.getenv('AWS_SECRET_ACCESS_KEY', 'testing')
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+    if args.endpoint_url:
+        args.create_bucket = False
+        results = run(args)
+    else:
+        try:
+            # third-party
+            from moto import mock_aws  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            print('moto is not installed, use --endpoint-url.', file=sys.stderr)
+            return 1
+
+        args.create_bucket = True
+        with mock_aws():
+            results = run(args)
+
+    print(f'{"setup":<18} {"startup ms":>10} {"clients":>8} {"sockets":>8}')
+    for result in results:
+        sockets = 'n/a' if result['sockets'] is None else result['sockets']
+        print(
+            f'{result["setup"]:<18} {result["startup_ms"]:>10.2f} {result["clients"]:>8} '
+            f'{sockets:>8}'
+        )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,8 +1,25 @@
 """Falcon storage module."""
 # flake8: noqa
+# standard library
+from typing import TYPE_CHECKING
+
 # first-party
-from falcon_provider_storage.utils import (
-    LocalStorageProvider,
-    S3StorageProvider,
-    StorageProviderABC,
-)
+from falcon_provider_storage.utils import FileInfo, StorageProviderABC, _lazy_provider
+
+# the storage providers are loaded on first access, so local only deployments never import boto3
+if TYPE_CHECKING:  # pragma: no cover
+    # first-party
+    from falcon_provider_storage.local import LocalStorageProvider
+    from falcon_provider_storage.s3 import S3StorageProvider
+
+__all__ = ['FileInfo', 'LocalStorageProvider', 'S3StorageProvider', 'StorageProviderABC']
+
+
+def __getattr__(name: str) -> object:
+    """Return the lazily loaded storage provider classes."""
+    return _lazy_provider(__name__, name)
+
+
+def __dir__() -> list[str]:
+    """Return the public names of the module, including the lazily loaded providers."""
+    return sorted(set(globals()) | set(__all__))
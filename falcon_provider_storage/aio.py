@@ -0,0 +1,304 @@
+"""Async (ASGI) Storage Provider Module"""
+# standard library
+import asyncio
+import functools
+import inspect
+import itertools
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
+
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_storage.local import LocalStorageProvider
+from falcon_provider_storage.utils import FileInfo, StorageProviderABC
+
+
+class AsyncFileReader:
+    """Async file-like object for a blocking file, for use as ``resp.stream`` in ASGI apps.
+
+    Args:
+        fh: The blocking file-like object (e.g., an open file or a botocore StreamingBody).
+        executor: The thread pool used to run the blocking reads.
+    """
+
+    def __init__(self, fh: BinaryIO, executor: ThreadPoolExecutor):
+        """Initialize class properties."""
+        self.executor = executor
+        self.fh = fh
+
+    async def close(self):
+        """Close the underlying file."""
+        await asyncio.get_running_loop().run_in_executor(self.executor, self.fh.close)
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes without blocking the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, self.fh.read, size)
+
+
+class SyncStreamReader:
+    """Blocking file-like object for an async stream (e.g., ``part.stream`` of an ASGI upload).
+
+    The reads are scheduled on the event loop, so the async stream can be consumed by a
+    blocking provider running in a worker thread without buffering the whole stream in memory.
+    This object must not be read from the event loop thread.
+
+    Args:
+        stream: The async stream with an awaitable read method.
+        loop: The event loop that owns the stream.
+    """
+
+    def __init__(self, stream: object, loop: asyncio.AbstractEventLoop):
+        """Initialize class properties."""
+        self.loop = loop
+        self.stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes from the async stream."""
+        return asyncio.run_coroutine_threadsafe(self.stream.read(size), self.loop).result()
+
+
+class AsyncStorageProviderABC(ABC):
+    """Base Async Storage Provider Module
+
+    Args:
+        bucket (str): The base directory/bucket where files should be written.
+    """
+
+    # the provider methods made available on the resource by the hooks and middleware
+    resource_methods = StorageProviderABC.resource_methods
+
+    def __init__(self, bucket: str):  # pragma: no cover
+        """Initialize class properties."""
+        self.bucket = bucket
+
+    @abstractmethod
+    async def delete_file(self, path: str, **kwargs):  # pragma: no cover
+        """Delete file from storage."""
+        raise NotImplementedError('This method must be implemented in child class.')
+
+    @abstractmethod
+    async def get_file(self, path: str, **kwargs):  # pragma: no cover
+        """Return file from storage (or an async file-like object when stream=True)."""
+        raise NotImplementedError('This method must be implemented in child class.')
+
+    @abstractmethod
+    async def is_file(self, path: str):  # pragma: no cover
+        """Return True if file exist, else False."""
+        raise NotImplementedError('This method must be implemented in child class.')
+
+    @abstractmethod
+    async def save_file(self, contents: bytes, path: str, **kwargs):  # pragma: no cover
+        """Write file to storage."""
+        raise NotImplementedError('This method must be implemented in child class.')
+
+
+class AsyncStorageProvider(AsyncStorageProviderABC):
+    """Async Storage Provider that runs a (blocking) storage provider in a thread pool.
+
+    Each storage call is run in a dedicated thread pool, so the event loop is never blocked
+    and a single worker can keep up to max_workers storage operations in flight.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        provider = AsyncStorageProvider(LocalStorageProvider(bucket='storage'))
+        contents = await provider.get_file('file.txt')
+
+    Args:
+        provider: The storage provider (e.g., LocalStorageProvider, S3StorageProvider).
+        max_workers: The maximum number of threads used to run storage operations.
+    """
+
+    def __init__(self, provider: StorageProviderABC, max_workers: int = 64):
+        """Initialize class properties."""
+        super().__init__(provider.bucket)
+        self.max_workers = max_workers
+        self.provider = provider
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._executor_pid: int | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Return the thread pool used to run storage operations, creating it on first use.
+
+        The thread pool is recreated in a forked child process, since the threads of the parent
+        process do not survive the fork.
+        """
+        if self._executor_pid != os.getpid():
+            with self._executor_lock:
+                if self._executor_pid != os.getpid():
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix='async-storage'
+                    )
+                    self._executor_pid = os.getpid()
+        return self._executor
+
+    async def _run(self, method: Callable, *args, **kwargs) -> object:
+        """Run the blocking provider method in the thread pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, functools.partial(method, *args, **kwargs)
+        )
+
+    def add_listener(self, listener: Callable):
+        """Add a listener receiving the timing and outcome of each storage operation."""
+        self.provider.add_listener(listener)
+
+    def remove_listener(self, listener: Callable):
+        """Remove a listener added with add_listener."""
+        self.provider.remove_listener(listener)
+
+    async def check_not_modified(
+        self, req: falcon.Request, resp: falcon.Response, path: str
+    ) -> bool:
+        """Answer a conditional GET request with 304 Not Modified when the file is unchanged."""
+        return await self._run(self.provider.check_not_modified, req, resp, path)
+
+    async def delete_file(self, path: str, **kwargs) -> bool:
+        """Delete a file."""
+        return await self._run(self.provider.delete_file, path, **kwargs)
+
+    async def delete_files(self, paths: list[str]) -> dict[str, bool]:
+        """Delete multiple files."""
+        return await self._run(self.provider.delete_files, paths)
+
+    async def get_file(self, path: str, **kwargs) -> bytes | str | AsyncFileReader:
+        """Return file from storage.
+
+        When stream is True an AsyncFileReader is returned, which can be assigned directly to
+        ``resp.stream`` of an ASGI response.
+        """
+        contents = await self._run(self.provider.get_file, path, **kwargs)
+        if kwargs.get('stream', False) is True:
+            return AsyncFileReader(contents, self.executor)
+        return contents
+
+    async def get_file_range(
+        self, path: str, start: int, end: int | None = None, **kwargs
+    ) -> tuple[bytes | AsyncFileReader, tuple[int, int, int]]:
+        """Return a byte range of a file from storage."""
+        contents, content_range = await self._run(
+            self.provider.get_file_range, path, start, end, **kwargs
+        )
+        if kwargs.get('stream', False) is True:
+            return AsyncFileReader(contents, self.executor), content_range
+        return contents, content_range
+
+    async def get_files(self, paths: Iterable[str], **kwargs) -> list:
+        """Return multiple files from storage, fetched concurrently.
+
+        Returns:
+            list: The file contents in the order of paths.
+        """
+        return await asyncio.gather(*(self.get_file(path, **kwargs) for path in paths))
+
+    async def is_file(self, path: str) -> bool:
+        """Return True if file exists, else False."""
+        return await self._run(self.provider.is_file, path)
+
+    async def list_files(
+        self, prefix: str = '', recursive: bool = True, page_size: int = 1000
+    ) -> AsyncIterator[FileInfo]:
+        """Yield the metadata of the files in storage.
+
+        The files are fetched from the provider in batches of page_size in the thread pool.
+        """
+        files = self.provider.list_files(prefix, recursive, page_size)
+        while True:
+            page = await self._run(list, itertools.islice(files, page_size))
+            if not page:
+                break
+            for file_info in page:
+                yield file_info
+
+    async def save_file(self, contents: bytes | str | object, path: str, **kwargs) -> str:
+        """Write file to storage.
+
+        Async streams (e.g., ``part.stream`` of an ASGI multipart upload) are read on the event
+        loop as the provider writes them, so the upload is never buffered in memory.
+        """
+        if inspect.iscoroutinefunction(getattr(contents, 'read', None)):
+            contents = SyncStreamReader(contents, asyncio.get_running_loop())
+        return await self._run(self.provider.save_file, contents, path, **kwargs)
+
+    async def save_files(self, items: Iterable[tuple[object, str]], **kwargs) -> list:
+        """Write multiple (contents, path) files to storage concurrently.
+
+        Returns:
+            list: The save_file results in the order of items.
+        """
+        return await asyncio.gather(
+            *(self.save_file(contents, path, **kwargs) for contents, path in items)
+        )
+
+    async def send_file(self, resp: falcon.Response, path: str, **kwargs):
+        """Stream file from storage as the body of the falcon (ASGI) response."""
+        await self._run(self.provider.send_file, resp, path, **kwargs)
+        if resp.stream is not None:
+            resp.stream = AsyncFileReader(resp.stream, self.executor)
+
+    async def stat_file(self, path: str) -> FileInfo:
+        """Return the metadata of a file in storage."""
+        return await self._run(self.provider.stat_file, path)
+
+
+class AsyncLocalStorageProvider(AsyncStorageProvider):
+    """Async Local Storage Provider Module
+
+    Args:
+        bucket: The base directory/bucket where files should be written.
+        max_workers: The maximum number of threads used to run storage operations.
+        **kwargs: Additional LocalStorageProvider arguments (e.g., atomic, fsync).
+    """
+
+    def __init__(self, bucket: str, max_workers: int = 64, **kwargs):
+        """Initialize class properties."""
+        super().__init__(LocalStorageProvider(bucket, **kwargs), max_workers)
+
+
+class AsyncS3StorageProvider(AsyncStorageProvider):
+    """Async S3 Storage Provider Module
+
+    The botocore client is thread-safe, so a single client (and connection pool) is shared by
+    all of the threads running storage operations.
+
+    Args:
+        bucket: The base directory/bucket where files should be written.
+        aws_access_key_id: The AWS access key Id.
+        aws_secret_access_key: The AWS secret key.
+        max_workers: The maximum number of threads used to run storage operations.
+        **kwargs: Additional S3StorageProvider arguments (e.g., max_concurrency).
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        aws_access_key_id: str,
+        aws_secret_access_key: str,
+        max_workers: int = 64,
+        **kwargs,
+    ):
+        """Initialize class properties."""
+        # first-party
+        from falcon_provider_storage.s3 import (  # pylint: disable=import-outside-toplevel
+            S3StorageProvider,
+        )
+
+        # the async storage threads send requests in addition to the provider's own threads
+        kwargs.setdefault(
+            'max_pool_connections',
+            max_workers
+            + kwargs.get('max_workers', 8)
+            + (kwargs.get('max_concurrency') or S3StorageProvider.default_max_concurrency),
+        )
+        super().__init__(
+            S3StorageProvider(bucket, aws_access_key_id, aws_secret_access_key, **kwargs),
+            max_workers,
+        )
@@ -0,0 +1,561 @@
+"""Caching Storage Provider Module"""
+# standard library
+import contextlib
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import BinaryIO, TextIO
+
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_storage.local import LocalStorageProvider
+from falcon_provider_storage.singleflight import SingleFlight
+from falcon_provider_storage.utils import StorageProviderABC, StorageProviderWrapper
+
+
+class CachingStorageProvider(StorageProviderWrapper):
+    """In-memory LRU read cache in front of any storage provider.
+
+    Files returned by get_file are kept in memory, bounded by the total size of the cached
+    files and by the size of each file, with an optional TTL. Files written or deleted through
+    this provider are removed from the cache. Only binary reads (the default mode) are cached.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        s3_provider = S3StorageProvider(bucket, aws_access_key_id, aws_secret_access_key)
+        provider = CachingStorageProvider(s3_provider, max_bytes=256 * 1024 * 1024, ttl=300)
+
+    Args:
+        provider: The storage provider to cache (e.g., S3StorageProvider).
+        max_bytes: The maximum total size in bytes of all cached files.
+        max_item_bytes: The maximum size in bytes of a single cached file.
+        ttl: The number of seconds a file is cached, or None to cache until evicted.
+    """
+
+    def __init__(
+        self,
+        provider: StorageProviderABC,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_item_bytes: int = 1024 * 1024,
+        ttl: float | None = None,
+    ):
+        """Initialize class properties."""
+        super().__init__(provider)
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+        self.ttl = ttl
+
+        # cache stats
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        self._invalidations = 0
+        self._lock = threading.Lock()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached files."""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Return the total size in bytes of all cached files."""
+        return self._size
+
+    def _cache_get(self, path: str) -> bytes | None:
+        """Return the cached contents of the file, or None on a cache miss."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                contents, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(path)
+                    self.hits += 1
+                    return contents
+                self._remove(path)
+            self.misses += 1
+        return None
+
+    def _cache_set(self, path: str, contents: bytes, invalidations: int):
+        """Add the file contents to the cache, evicting the least recently used files.
+
+        Args:
+            path: The path of the file.
+            contents: The contents of the file.
+            invalidations: The invalidation count from before the file was fetched, the file is
+                not cached if any file was written or deleted while it was being fetched.
+        """
+        if len(contents) > self.max_item_bytes:
+            return
+
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if invalidations != self._invalidations:
+                return
+
+            self._remove(path)
+            self._entries[path] = (contents, expires)
+            self._size += len(contents)
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    @staticmethod
+    def _is_cacheable(**kwargs) -> bool:
+        """Return True if the file read can be served from the cache."""
+        return kwargs.get('mode', 'rb') == 'rb'
+
+    def _remove(self, path: str):
+        """Remove a file from the cache, the lock must be held by the caller."""
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._size -= len(entry[0])
+
+    def clear(self):
+        """Remove all files from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._invalidations += 1
+            self._size = 0
+
+    def invalidate(self, *paths: str):
+        """Remove the files from the cache.
+
+        Args:
+            *paths: The paths of the files to remove.
+        """
+        with self._lock:
+            for path in paths:
+                self._remove(path)
+            self._invalidations += 1
+
+    def delete_file(self, path: str, **kwargs) -> bool:
+        """Delete file from storage and remove it from the cache.
+
+        Args:
+            path: The path of the file as accepted by the wrapped provider delete_file (see
+                storage_path).
+            **kwargs: Additional arguments passed to the wrapped provider delete_file.
+        """
+        try:
+            return self.provider.delete_file(path, **kwargs)
+        finally:
+            self.invalidate(self._storage_key(path))
+
+    def delete_files(self, paths: list[str]) -> dict[str, bool]:
+        """Delete multiple files from storage and remove them from the cache."""
+        try:
+            return self.provider.delete_files(paths)
+        finally:
+            self.invalidate(*[self._storage_key(path) for path in paths])
+
+    def get_file(self, path: str, **kwargs) -> bytes | str | BinaryIO | TextIO:
+        """Return file from the cache, or from storage on a cache miss.
+
+        Streamed reads (stream=True) are served from the cache on a cache hit, but are streamed
+        from storage without being cached on a cache miss, so large files are never buffered.
+
+        Args:
+            path: The path of the file to return.
+            **kwargs: Additional arguments passed to the wrapped provider get_file.
+        """
+        if not self._is_cacheable(**kwargs):
+            return self.provider.get_file(path, **kwargs)
+
+        contents = self._cache_get(path)
+        if contents is not None:
+            if kwargs.get('stream', False) is True:
+                return io.BytesIO(contents)
+            return contents
+
+        if kwargs.get('stream', False) is True:
+            return self.provider.get_file(path, **kwargs)
+
+        invalidations = self._invalidations
+        contents = self.provider.get_file(path, **kwargs)
+        self._cache_set(path, contents, invalidations)
+        return contents
+
+    def get_file_range(
+        self, path: str, start: int, end: int | None = None, **kwargs
+    ) -> tuple[bytes | BinaryIO, tuple[int, int, int]]:
+        """Return a byte range of a file from the cache, or from storage on a cache miss.
+
+        Ranges are read from storage on a cache miss, without caching the file.
+        """
+        contents = self._cache_get(path)
+        if contents is None:
+            return self.provider.get_file_range(path, start, end, **kwargs)
+
+        first, last = self._resolve_range(start, end, len(contents))
+        content_range = (first, last, len(contents))
+        if kwargs.get('stream', False) is True:
+            return io.BytesIO(contents[first : last + 1]), content_range
+        return contents[first : last + 1], content_range
+
+    def save_file(self, contents: bytes | str | BinaryIO, path: str, **kwargs) -> str:
+        """Write file to storage and remove it from the cache."""
+        try:
+            return self.provider.save_file(contents, path, **kwargs)
+        finally:
+            self.invalidate(path)
+
+
+class ExistenceCacheStorageProvider(StorageProviderWrapper):
+    """Cache of is_file results in front of any storage provider.
+
+    Both positive and negative is_file results are cached, each with a short TTL, so repeated
+    lookups of the same path (e.g., an is_file check before every get_file) do not each send a
+    HEAD request to S3. Files written or deleted through this provider are removed from the
+    cache.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        s3_provider = S3StorageProvider(bucket, aws_access_key_id, aws_secret_access_key)
+        provider = ExistenceCacheStorageProvider(s3_provider, ttl=30, negative_ttl=5)
+
+    Args:
+        provider: The storage provider to cache (e.g., S3StorageProvider).
+        ttl: The number of seconds a file that exists is cached.
+        negative_ttl: The number of seconds a file that does not exist is cached.
+        max_entries: The maximum number of cached paths.
+    """
+
+    def __init__(
+        self,
+        provider: StorageProviderABC,
+        ttl: float = 10,
+        negative_ttl: float = 2,
+        max_entries: int = 10000,
+    ):
+        """Initialize class properties."""
+        super().__init__(provider)
+        self.max_entries = max_entries
+        self.negative_ttl = negative_ttl
+        self.ttl = ttl
+
+        # cache stats
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict[str, tuple[bool, float]] = OrderedDict()
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached paths."""
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all paths from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._invalidations += 1
+
+    def invalidate(self, *paths: str):
+        """Remove the paths from the cache.
+
+        Args:
+            *paths: The paths to remove.
+        """
+        with self._lock:
+            for path in paths:
+                self._entries.pop(path, None)
+            self._invalidations += 1
+
+    def delete_file(self, path: str, **kwargs) -> bool:
+        """Delete file from storage and remove it from the cache.
+
+        Args:
+            path: The path of the file as accepted by the wrapped provider delete_file (see
+                storage_path).
+            **kwargs: Additional arguments passed to the wrapped provider delete_file.
+        """
+        try:
+            return self.provider.delete_file(path, **kwargs)
+        finally:
+            self.invalidate(self._storage_key(path))
+
+    def delete_files(self, paths: list[str]) -> dict[str, bool]:
+        """Delete multiple files from storage and remove them from the cache."""
+        try:
+            return self.provider.delete_files(paths)
+        finally:
+            self.invalidate(*[self._storage_key(path) for path in paths])
+
+    def is_file(self, path: str) -> bool:
+        """Return True if file exists, else False, from the cache when possible."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                exists, expires = entry
+                if expires > time.monotonic():
+                    self._entries.move_to_end(path)
+                    self.hits += 1
+                    return exists
+                del self._entries[path]
+            self.misses += 1
+            invalidations = self._invalidations
+
+        exists = self.provider.is_file(path)
+        expires = time.monotonic() + (self.ttl if exists else self.negative_ttl)
+        with self._lock:
+            # the result could be stale if any file was written or deleted during the lookup
+            if invalidations == self._invalidations:
+                self._entries[path] = (exists, expires)
+                self._entries.move_to_end(path)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return exists
+
+    def save_file(self, contents: bytes | str | BinaryIO, path: str, **kwargs) -> str:
+        """Write file to storage and remove it from the cache."""
+        try:
+            return self.provider.save_file(contents, path, **kwargs)
+        finally:
+            self.invalidate(path)
+
+
+class TieredStorageProvider(StorageProviderWrapper):
+    """Local disk read-through cache in front of a (remote) storage provider.
+
+    On a cache miss the file is downloaded from the provider (e.g., S3StorageProvider) and
+    written to the local cache directory, and the file is then read from local disk. The
+    cache directory is bounded by max_bytes, evicting the least recently used files. Concurrent
+    cache misses for the same file wait on a single download.
+
+    Files served with send_file are sent from the local cache, so WSGI servers can use
+    ``os.sendfile`` (see LocalStorageProvider.send_file).
+
+    The index of the cached files is kept in memory by each process, so when several worker
+    processes (e.g., gunicorn workers) share a cache directory each worker enforces max_bytes
+    on its own and the directory can grow up to max_bytes per worker. Use a cache directory
+    per worker, or divide the size budget by the number of workers.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        s3_provider = S3StorageProvider(bucket, aws_access_key_id, aws_secret_access_key)
+        provider = TieredStorageProvider(
+            s3_provider, LocalStorageProvider('/var/cache/storage'), max_bytes=10 * 1024**3
+        )
+
+    Args:
+        provider: The storage provider to cache (e.g., S3StorageProvider).
+        cache: The local storage provider used as the cache directory.
+        max_bytes: The maximum total size in bytes of the files in the cache directory.
+    """
+
+    def __init__(
+        self,
+        provider: StorageProviderABC,
+        cache: LocalStorageProvider,
+        max_bytes: int = 1024 * 1024 * 1024,
+    ):
+        """Initialize class properties."""
+        super().__init__(provider)
+        self.cache = cache
+        self.max_bytes = max_bytes
+
+        self.single_flight = SingleFlight()
+
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._invalidations = 0
+        self._lock = threading.Lock()
+        self._size = 0
+        self._load_index()
+
+    def __len__(self) -> int:
+        """Return the number of cached files."""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Return the total size in bytes of all cached files."""
+        return self._size
+
+    def _cache_path(self, path: str) -> str | None:
+        """Return the full path of the file in the cache, or None if it is outside the cache."""
+        cache_root = os.path.abspath(self.cache.bucket)
+        cache_path = os.path.abspath(os.path.join(cache_root, path))
+        if os.path.commonpath([cache_root, cache_path]) != cache_root or cache_path == cache_root:
+            return None
+        return cache_path
+
+    def _download(self, path: str) -> bool:
+        """Download the file to the cache, waiting on any in-flight download of the same file.
+
+        Return:
+            bool: False if the file can not be cached.
+        """
+        cache_path = self._cache_path(path)
+        if cache_path is None:
+            return False
+
+        with self._lock:
+            if path in self._entries and os.path.isfile(cache_path):
+                self._entries.move_to_end(path)
+                return True
+
+        self.single_flight.do(path, self._fetch, path, cache_path)
+        return True
+
+    def _fetch(self, path: str, cache_path: str):
+        """Download the file from the provider and add it to the cache.
+
+        The downloaded file is discarded if any file was written or deleted while it was being
+        downloaded, since it could be the contents from before the write.
+        """
+        with self._lock:
+            # another thread could have downloaded the file before this download started
+            if path in self._entries and os.path.isfile(cache_path):
+                return
+            invalidations = self._invalidations
+
+        contents = self.provider.get_file(path, stream=True)
+        try:
+            self.cache.save_file(contents, path, atomic=True)
+        finally:
+            contents.close()
+
+        with self._lock:
+            if invalidations != self._invalidations:
+                # the file is read from the provider (see _read)
+                with contextlib.suppress(OSError):
+                    os.remove(cache_path)
+                return
+
+            self._remove(path)
+            self._entries[path] = os.path.getsize(cache_path)
+            self._size += self._entries[path]
+            self._evict(path)
+
+    def _evict(self, keep: str):
+        """Remove the least recently used files until the cache is within max_bytes.
+
+        The lock must be held by the caller.
+
+        Args:
+            keep: The path of the file that was just cached, which is never evicted.
+        """
+        for path in list(self._entries):
+            if self._size <= self.max_bytes:
+                break
+            if path != keep:
+                self._remove(path)
+
+    def _load_index(self):
+        """Load the files already in the cache directory, ordered by access time (LRU)."""
+        entries = []
+        for root, _, files in os.walk(self.cache.bucket):
+            for name in files:
+                if name.startswith('.') and name.endswith('.tmp'):
+                    # incomplete atomic write
+                    continue
+
+                file_path = os.path.join(root, name)
+                stat = os.stat(file_path)
+                path = os.path.relpath(file_path, self.cache.bucket).replace(os.sep, '/')
+                entries.append((stat.st_atime, path, stat.st_size))
+
+        for _, path, size in sorted(entries):
+            self._entries[path] = size
+            self._size += size
+        with self._lock:
+            self._evict(keep=None)
+
+    def _remove(self, path: str):
+        """Remove a file from the cache, the lock must be held by the caller."""
+        size = self._entries.pop(path, None)
+        if size is not None:
+            self._size -= size
+            with contextlib.suppress(OSError):
+                os.remove(self._cache_path(path))
+
+    def invalidate(self, *paths: str):
+        """Remove the files from the cache.
+
+        Args:
+            *paths: The paths of the files to remove.
+        """
+        with self._lock:
+            for path in paths:
+                self._remove(path)
+            self._invalidations += 1
+
+    def delete_file(self, path: str, **kwargs) -> bool:
+        """Delete file from storage and remove it from the cache.
+
+        Args:
+            path: The path of the file as accepted by the wrapped provider delete_file (see
+                storage_path).
+            **kwargs: Additional arguments passed to the wrapped provider delete_file.
+        """
+        try:
+            return self.provider.delete_file(path, **kwargs)
+        finally:
+            self.invalidate(self._storage_key(path))
+
+    def delete_files(self, paths: list[str]) -> dict[str, bool]:
+        """Delete multiple files from storage and remove them from the cache."""
+        try:
+            return self.provider.delete_files(paths)
+        finally:
+            self.invalidate(*[self._storage_key(path) for path in paths])
+
+    def _read(self, method: str, path: str, *args, **kwargs) -> object:
+        """Call a read method of the cache, downloading the file on a cache miss.
+
+        The file can be removed from the cache directory (evicted, or invalidated by a save or
+        delete) after it was downloaded and before the cache opens it, in which case the file
+        is read from the provider instead.
+
+        Args:
+            method: The name of the read method (e.g., get_file).
+            path: The path of the file.
+            *args: The arguments of the read method.
+            **kwargs: The keyword arguments of the read method.
+        """
+        if self._download(path):
+            try:
+                return getattr(self.cache, method)(*args, **kwargs)
+            except falcon.HTTPInternalServerError:
+                if os.path.isfile(self._cache_path(path)):
+                    raise
+        return getattr(self.provider, method)(*args, **kwargs)
+
+    def get_file(self, path: str, **kwargs) -> bytes | str | BinaryIO | TextIO:
+        """Return file from the cache directory, downloading it on a cache miss."""
+        return self._read('get_file', path, path, **kwargs)
+
+    def get_file_range(
+        self, path: str, start: int, end: int | None = None, **kwargs
+    ) -> tuple[bytes | BinaryIO, tuple[int, int, int]]:
+        """Return a byte range of a file from the cache directory, downloading it on a miss."""
+        return self._read('get_file_range', path, path, start, end, **kwargs)
+
+    def is_file(self, path: str) -> bool:
+        """Return True if file exists, else False."""
+        if path in self._entries:
+            return True
+        return self.provider.is_file(path)
+
+    def save_file(self, contents: bytes | str | BinaryIO, path: str, **kwargs) -> str:
+        """Write file to storage and remove it from the cache."""
+        try:
+            return self.provider.save_file(contents, path, **kwargs)
+        finally:
+            self.invalidate(path)
+
+    def send_file(self, resp: falcon.Response, path: str, **kwargs):
+        """Stream file from the cache directory, downloading it on a cache miss."""
+        return self._read('send_file', path, resp, path, **kwargs)
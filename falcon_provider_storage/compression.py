@@ -0,0 +1,387 @@
+"""Compressing Storage Provider Module"""
+# standard library
+import gzip
+import io
+import mimetypes
+import os
+import zlib
+from typing import BinaryIO, TextIO
+
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_storage.utils import StorageProviderABC, StorageProviderWrapper
+
+
+class CompressingReader:
+    """File-like object that compresses a file as it is read.
+
+    The compressor is any object with the compress and flush methods of zlib.compressobj, so
+    the file is compressed in chunks of buffer_size without holding the whole file in memory.
+
+    Args:
+        fh: The file-like object to compress.
+        compressor: The compressor (e.g., zlib.compressobj).
+        buffer_size: The number of bytes read from the file at a time.
+    """
+
+    def __init__(self, fh: BinaryIO | TextIO, compressor: object, buffer_size: int = 65536):
+        """Initialize class properties."""
+        self.buffer = bytearray()
+        self.buffer_size = buffer_size
+        self.compressor = compressor
+        self.eof = False
+        self.fh = fh
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes of compressed data."""
+        while not self.eof and (size is None or size < 0 or len(self.buffer) < size):
+            chunk = self.fh.read(self.buffer_size)
+            if not chunk:
+                self.buffer += self.compressor.flush()
+                self.eof = True
+            else:
+                if isinstance(chunk, str):
+                    chunk = chunk.encode()
+                self.buffer += self.compressor.compress(chunk)
+
+        if size is None or size < 0:
+            size = len(self.buffer)
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
+class DecompressingReader(io.BufferedIOBase):
+    """File-like object that reads a decompressing reader and closes the stored file with it.
+
+    The gzip and zstd readers do not close the file they read from, so the reader and the
+    stored file (e.g., an open local file or a S3 streaming body) are closed together.
+
+    Args:
+        reader: The decompressing reader (e.g., gzip.GzipFile).
+        fh: The file-like object of the stored (compressed) file.
+    """
+
+    def __init__(self, reader: BinaryIO, fh: BinaryIO):
+        """Initialize class properties."""
+        super().__init__()
+        self.fh = fh
+        self.reader = reader
+
+    def close(self):
+        """Close the reader and the stored file."""
+        if self.closed:
+            return
+        try:
+            self.reader.close()
+        finally:
+            try:
+                self.fh.close()
+            finally:
+                super().close()
+
+    def read(self, size: int | None = -1) -> bytes:
+        """Read up to size bytes of decompressed data."""
+        return self.reader.read(-1 if size is None else size)
+
+    def read1(self, size: int | None = -1) -> bytes:
+        """Read up to size bytes of decompressed data."""
+        return self.read(size)
+
+    def readable(self) -> bool:
+        """Return True, the reader is readable."""
+        return True
+
+
+class CompressingStorageProvider(StorageProviderWrapper):
+    """Compress files with compressible content types in front of any storage provider.
+
+    Files are compressed as they are written, so the compressed copy is produced once and both
+    the storage and the transfer of the file use the compressed size. Whether a file is
+    compressed is decided by the content type guessed from its path (e.g., .json, .csv, .log),
+    so reads do not need any extra request to find out how a file is stored. Files written
+    before the wrapper was added (or with a different algorithm) must be rewritten.
+
+    get_file returns the original contents. send_file sends the stored compressed bytes with
+    the Content-Encoding header when the Accept-Encoding header of the request allows it, and
+    otherwise streams the decompressed contents.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        s3_provider = S3StorageProvider(bucket, aws_access_key_id, aws_secret_access_key)
+        provider = CompressingStorageProvider(s3_provider, algorithm='zstd', level=6)
+
+    Args:
+        provider: The storage provider used to store the files (e.g., S3StorageProvider).
+        algorithm: The compression algorithm, either "gzip" or "zstd" (requires zstandard).
+        level: The compression level, defaults to 6 for gzip and 3 for zstd.
+        content_types: The compressible content types, entries ending in "/" match all types
+            with the prefix (e.g., "text/").
+        buffer_size: The number of bytes compressed at a time.
+    """
+
+    algorithms = ('gzip', 'zstd')
+    content_types = (
+        'application/javascript',
+        'application/json',
+        'application/x-ndjson',
+        'application/xml',
+        'image/svg+xml',
+        'text/',
+    )
+    default_levels = {'gzip': 6, 'zstd': 3}
+    # extensions of common text payloads that are not in the mimetypes database
+    extra_types = {'.log': 'text/plain', '.ndjson': 'application/x-ndjson'}
+
+    def __init__(
+        self,
+        provider: StorageProviderABC,
+        algorithm: str = 'gzip',
+        level: int | None = None,
+        content_types: tuple[str, ...] | None = None,
+        buffer_size: int = 65536,
+    ):
+        """Initialize class properties."""
+        super().__init__(provider)
+        if algorithm not in self.algorithms:
+            raise ValueError(f'Invalid algorithm ({algorithm}), must be one of {self.algorithms}.')
+
+        self.algorithm = algorithm
+        self.buffer_size = buffer_size
+        self.level = self.default_levels[algorithm] if level is None else level
+        if content_types is not None:
+            self.content_types = tuple(content_types)
+
+        self.zstandard = None
+        if algorithm == 'zstd':
+            try:
+                # third-party
+                import zstandard  # pylint: disable=import-outside-toplevel
+            except ImportError as ex:  # pragma: no cover
+                raise ImportError(
+                    'The zstd algorithm requires zstandard to be installed '
+                    'try "pip install falcon-provider-storage[zstd]".'
+                ) from ex
+            self.zstandard = zstandard
+
+    def _accepts_encoding(self, req: falcon.Request | None) -> bool:
+        """Return True if the Accept-Encoding header of the request allows the algorithm."""
+        if req is None:
+            return False
+
+        qvalues = {}
+        for coding in (req.get_header('Accept-Encoding') or '').split(','):
+            name, _, params = coding.partition(';')
+            qvalue = 1.0
+            for param in params.split(';'):
+                key, _, value = param.partition('=')
+                if key.strip().lower() == 'q':
+                    try:
+                        qvalue = float(value)
+                    except ValueError:
+                        qvalue = 0.0
+            qvalues[name.strip().lower()] = qvalue
+
+        names = ('gzip', 'x-gzip') if self.algorithm == 'gzip' else ('zstd',)
+        for name in names:
+            if name in qvalues:
+                return qvalues[name] > 0
+        return qvalues.get('*', 0) > 0
+
+    def _compressor(self) -> object:
+        """Return a new compressor for the algorithm."""
+        if self.algorithm == 'zstd':
+            return self.zstandard.ZstdCompressor(level=self.level).compressobj()
+        # wbits of 16 + 15 writes a gzip header and trailer
+        return zlib.compressobj(self.level, zlib.DEFLATED, 31)
+
+    def _content_type(self, path: str) -> str | None:
+        """Return the content type of a file guessed from its path."""
+        content_type, encoding = mimetypes.guess_type(path)
+        if encoding is not None:
+            # already compressed (e.g., .json.gz)
+            return None
+        if content_type is None:
+            content_type = self.extra_types.get(os.path.splitext(path)[1].lower())
+        return content_type
+
+    def _decompress(self, data: bytes) -> bytes:
+        """Return the decompressed data."""
+        if self.algorithm == 'zstd':
+            # the streaming compressor does not write the content size required by decompress
+            return self.zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        return gzip.decompress(data)
+
+    def _decompressing_reader(self, fh: BinaryIO) -> BinaryIO:
+        """Return a file-like object that decompresses the file as it is read."""
+        if self.algorithm == 'zstd':
+            reader = self.zstandard.ZstdDecompressor().stream_reader(fh, closefd=False)
+        else:
+            reader = gzip.GzipFile(fileobj=fh, mode='rb')
+        return DecompressingReader(reader, fh)
+
+    def is_compressible(self, path: str) -> bool:
+        """Return True if the file is stored compressed.
+
+        Args:
+            path: The path of the file.
+        """
+        content_type = self._content_type(path)
+        if content_type is None:
+            return False
+        return any(
+            content_type.startswith(pattern) if pattern.endswith('/') else content_type == pattern
+            for pattern in self.content_types
+        )
+
+    def get_file(self, path: str, **kwargs) -> bytes | str | BinaryIO | TextIO:
+        """Return the decompressed file from storage.
+
+        Args:
+            path: The path of the file to return.
+            mode (str | kwargs): The read mode for the file.
+            stream (bool | kwargs): If True, return a file-like object that decompresses the
+                file as it is read.
+            **kwargs: Additional arguments passed to the wrapped provider get_file.
+        """
+        if not self.is_compressible(path):
+            return self.provider.get_file(path, **kwargs)
+
+        text = 'b' not in kwargs.get('mode', 'rb')
+        kwargs['mode'] = 'rb'
+        if kwargs.get('stream', False) is True:
+            reader = self._decompressing_reader(self.provider.get_file(path, **kwargs))
+            return io.TextIOWrapper(reader, encoding='utf-8') if text else reader
+
+        contents = self._decompress(self.provider.get_file(path, **kwargs))
+        return contents.decode() if text else contents
+
+    def get_file_range(
+        self, path: str, start: int, end: int | None = None, **kwargs
+    ) -> tuple[bytes | BinaryIO, tuple[int, int, int]]:
+        """Return a byte range of the decompressed file from storage.
+
+        The offsets of the original contents do not map to offsets in the compressed file, so
+        the whole file is read and decompressed to return a range of a compressed file.
+        """
+        if not self.is_compressible(path):
+            return self.provider.get_file_range(path, start, end, **kwargs)
+
+        contents = self.get_file(path)
+        first, last = self._resolve_range(start, end, len(contents))
+        data = contents[first : last + 1]
+        if kwargs.get('stream', False) is True:
+            data = io.BytesIO(data)
+        return data, (first, last, len(contents))
+
+    def save_file(self, contents: bytes | str | BinaryIO | TextIO, path: str, **kwargs) -> str:
+        """Write the file to storage, compressing files with compressible content types.
+
+        File-like contents are compressed as they are read by the wrapped provider, so large
+        files are never held in memory.
+
+        Args:
+            contents: The contents of the file (bytes, str, or a file-like object).
+            path: The path to write the file.
+            **kwargs: Additional arguments passed to the wrapped provider save_file.
+        """
+        if not self.is_compressible(path):
+            return self.provider.save_file(contents, path, **kwargs)
+
+        if isinstance(contents, (bytes, str)):
+            if isinstance(contents, str):
+                contents = contents.encode()
+            compressor = self._compressor()
+            compressed = io.BytesIO(compressor.compress(contents) + compressor.flush())
+        else:
+            compressed = CompressingReader(contents, self._compressor(), self.buffer_size)
+        # the compressed contents are bytes, even for contents saved in text mode
+        kwargs['mode'] = 'wb'
+        return self.provider.save_file(compressed, path, **kwargs)
+
+    def send_file(self, resp: falcon.Response, path: str, **kwargs):
+        """Stream file from storage as the body of the falcon response.
+
+        When the request accepts the encoding the stored compressed bytes are sent with the
+        Content-Encoding header (including Range requests, which apply to the compressed
+        bytes), otherwise the file is decompressed as it is sent. The Vary header is set
+        to Accept-Encoding in both cases. The two representations have different bytes, so the
+        ETag of the compressed representation has the algorithm appended (e.g., "<etag>-gzip").
+
+        Args:
+            resp: The falcon resp object.
+            path: The path of the file to send.
+            content_type (str | kwargs): The response content-type, defaults to a type guessed
+                from the file extension.
+            req (falcon.Request | kwargs): The falcon req object, used for Accept-Encoding,
+                conditional, and Range requests.
+        """
+        if not self.is_compressible(path):
+            return self.provider.send_file(resp, path, **kwargs)
+
+        req: falcon.Request | None = kwargs.get('req')
+        content_type = kwargs.get('content_type') or self._content_type(path)
+        resp.append_header('Vary', 'Accept-Encoding')
+
+        if self._accepts_encoding(req):
+            return self._send_encoded(resp, path, **{**kwargs, 'content_type': content_type})
+
+        if req is not None and self.check_not_modified(req, resp, path):
+            return None
+
+        resp.content_type = content_type
+        resp.stream = self.get_file(path, stream=True)
+        return None
+
+    def _encoded_etag(self, etag: str) -> str:
+        """Return the ETag of the compressed representation of a file with the (stored) ETag."""
+        etag = etag.strip('"')
+        return f'{etag}-{self.algorithm}'
+
+    def _send_encoded(self, resp: falcon.Response, path: str, **kwargs):
+        """Send the stored compressed bytes of a file with the Content-Encoding header.
+
+        An If-None-Match request header is evaluated against the ETag of the compressed
+        representation, since the wrapped provider only knows the ETag of the stored file.
+
+        Raises:
+            falcon.HTTPStatus: Raised with a 304 status when the wrapped provider answers a
+                conditional (If-Modified-Since) request with an exception (e.g.,
+                S3StorageProvider), with the ETag header of the compressed representation.
+        """
+        req: falcon.Request = kwargs['req']
+        if req.if_none_match is not None:
+            file_info = self.provider.stat_file(path)
+            etag = self._encoded_etag(file_info.etag)
+            if self._is_not_modified(req, etag, file_info.mtime):
+                resp.etag = etag
+                resp.last_modified = file_info.mtime
+                resp.status = falcon.HTTP_304
+                return
+
+            # the stored ETag of the file could match, and If-Modified-Since is ignored when
+            # If-None-Match is present (RFC 7232), so the file is sent unconditionally
+            env = {
+                key: value
+                for key, value in req.env.items()
+                if key not in ('HTTP_IF_NONE_MATCH', 'HTTP_IF_MODIFIED_SINCE')
+            }
+            kwargs['req'] = type(req)(env, options=req.options)
+
+        try:
+            self.provider.send_file(resp, path, **kwargs)
+        except falcon.HTTPStatus as status:
+            headers = dict(status.headers or {})
+            if headers.get('ETag'):
+                headers['ETag'] = f'"{self._encoded_etag(headers["ETag"])}"'
+            status.headers = headers
+            raise
+
+        if resp.etag:
+            resp.etag = self._encoded_etag(resp.etag)
+        if resp.status not in (falcon.HTTP_304, 304):
+            resp.set_header('Content-Encoding', self.algorithm)
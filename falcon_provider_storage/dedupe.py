@@ -0,0 +1,360 @@
+"""Content-addressed (deduplicating) Storage Provider Module"""
+# standard library
+import hashlib
+import io
+import mimetypes
+import string
+import tempfile
+import time
+from collections.abc import Iterator
+from typing import BinaryIO, TextIO
+
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_storage.utils import FileInfo, StorageProviderABC, StorageProviderWrapper
+
+
+class DeduplicatingStorageProvider(StorageProviderWrapper):
+    """Content-addressed storage in front of any storage provider.
+
+    The contents of each file are stored once, as a blob named after the digest of the contents
+    (``blobs/<digest[:2]>/<digest>``), and each path is a small ref file (``refs/<path>``)
+    containing the digest of its contents. The digest is computed while the upload is spooled
+    to a temporary file (in memory up to spool_size), and the upload of the blob is skipped
+    when a blob with the same digest already exists.
+
+    Deleting a file only deletes the ref, since the blob can be shared by other paths. Blobs
+    that are no longer referenced are deleted by collect_garbage, which writes a marker file
+    while it runs so that a save_file reusing a blob waits for the collection to finish.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        s3_provider = S3StorageProvider(bucket, aws_access_key_id, aws_secret_access_key)
+        provider = DeduplicatingStorageProvider(s3_provider)
+
+    Args:
+        provider: The storage provider used to store the blobs and refs (e.g., S3StorageProvider).
+        algorithm: The hashlib algorithm used to compute the digest.
+        blob_prefix: The path prefix of the blobs.
+        ref_prefix: The path prefix of the refs.
+        spool_size: The size in bytes up to which an upload is spooled in memory.
+        buffer_size: The chunk size used to read the upload while computing the digest.
+        collect_marker: The path of the marker file written while collect_garbage runs.
+        collect_timeout: The time in seconds after which a save_file stops waiting for a
+            collection, which should be longer than any collection (e.g., a stale marker left
+            by a collection that crashed).
+    """
+
+    # the interval in seconds at which save_file checks the marker of a running collection
+    marker_poll_interval = 0.1
+
+    def __init__(
+        self,
+        provider: StorageProviderABC,
+        algorithm: str = 'sha256',
+        blob_prefix: str = 'blobs/',
+        ref_prefix: str = 'refs/',
+        spool_size: int = 8 * 1024 * 1024,
+        buffer_size: int = 65536,
+        collect_marker: str = 'collect_garbage.marker',
+        collect_timeout: float = 600,
+    ):
+        """Initialize class properties."""
+        super().__init__(provider)
+        self.algorithm = algorithm
+        self.blob_prefix = blob_prefix
+        self.buffer_size = buffer_size
+        self.collect_marker = collect_marker
+        self.collect_timeout = collect_timeout
+        self.ref_prefix = ref_prefix
+        self.spool_size = spool_size
+
+        # the length of a hex digest of the algorithm
+        self.digest_length = hashlib.new(algorithm).digest_size * 2
+
+    def _blob_key(self, digest: str) -> str:
+        """Return the path of the blob with the digest."""
+        return f'{self.blob_prefix}{digest[:2]}/{digest}'
+
+    def _ref_key(self, path: str) -> str:
+        """Return the path of the ref of a file."""
+        return f'{self.ref_prefix}{path}'
+
+    def _ref_path(self, path: str) -> str:
+        """Return the path of the ref of a file as accepted by delete_file."""
+        return self.provider.storage_path(self._ref_key(path))
+
+    def _is_digest(self, digest: object) -> bool:
+        """Return True if the value is a valid (lower case hex) digest."""
+        return (
+            isinstance(digest, str)
+            and len(digest) == self.digest_length
+            and all(c in string.hexdigits[:16] for c in digest)
+        )
+
+    def digest(self, path: str) -> str:
+        """Return the digest of the contents of a file.
+
+        Args:
+            path: The path of the file.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised if the ref of the file is invalid.
+        """
+        digest = self.provider.get_file(self._ref_key(path))
+        if isinstance(digest, bytes):
+            digest = digest.decode()
+        digest = digest.strip()
+        if not self._is_digest(digest):  # pragma: no cover
+            raise falcon.HTTPInternalServerError(
+                # code=code(),
+                description=f'File ({path}) has an invalid ref.',
+                title='Internal Server Error',
+            )
+        return digest
+
+    def collect_garbage(self, min_age: float = 3600) -> list[str]:
+        """Delete the blobs that are not referenced by any file.
+
+        Blobs modified within min_age seconds are kept, so uploads in progress (a new blob
+        whose ref is not written yet) are not affected. Blobs that are reused by save_file are
+        not modified, so before the unreferenced blobs are deleted the collect_marker file is
+        written and the refs are listed again. A save_file that reuses a blob checks for the
+        marker after writing its ref, and waits for the collection to finish (up to
+        collect_timeout) before checking that the blob still exists, uploading it again if it
+        was deleted. A ref written after the second listing is therefore never left without
+        its blob, even when save_file runs in another process.
+
+        Args:
+            min_age: The minimum age in seconds of a blob before it can be deleted.
+
+        Return:
+            list: The paths of the deleted blobs.
+        """
+        referenced = self._referenced()
+
+        cutoff = time.time() - min_age
+        unreferenced = [
+            file_info.key
+            for file_info in self.provider.list_files(self.blob_prefix)
+            if file_info.key.rsplit('/', 1)[-1] not in referenced
+            and (file_info.mtime is None or file_info.mtime.timestamp() < cutoff)
+        ]
+        if not unreferenced:
+            return unreferenced
+
+        self.provider.save_file(io.BytesIO(b''), self.collect_marker)
+        try:
+            # refs written while the blobs were listed (e.g., by a save_file that found the blob)
+            referenced = self._referenced()
+            unreferenced = [key for key in unreferenced if key.rsplit('/', 1)[-1] not in referenced]
+            if unreferenced:
+                self.provider.delete_files(
+                    [self.provider.storage_path(key) for key in unreferenced]
+                )
+        finally:
+            self.provider.delete_file(self.provider.storage_path(self.collect_marker))
+        return unreferenced
+
+    def delete_file(self, path: str, **kwargs) -> bool:
+        """Delete the file (ref) from storage, the blob is deleted by collect_garbage."""
+        return self.provider.delete_file(self._ref_path(path), **kwargs)
+
+    def delete_files(self, paths: list[str]) -> dict[str, bool]:
+        """Delete multiple files (refs) from storage."""
+        results = self.provider.delete_files([self._ref_path(path) for path in paths])
+        return {path: results.get(self._ref_path(path), False) for path in paths}
+
+    def get_file(self, path: str, **kwargs) -> bytes | str | BinaryIO | TextIO:
+        """Return file from storage."""
+        return self.provider.get_file(self._blob_key(self.digest(path)), **kwargs)
+
+    def get_file_range(
+        self, path: str, start: int, end: int | None = None, **kwargs
+    ) -> tuple[bytes | BinaryIO, tuple[int, int, int]]:
+        """Return a byte range of a file from storage."""
+        return self.provider.get_file_range(self._blob_key(self.digest(path)), start, end, **kwargs)
+
+    def is_file(self, path: str) -> bool:
+        """Return True if file exists, else False."""
+        return self.provider.is_file(self._ref_key(path))
+
+    def list_files(
+        self, prefix: str = '', recursive: bool = True, page_size: int = 1000
+    ) -> Iterator[FileInfo]:
+        """Yield the metadata of the files in storage.
+
+        The metadata of each file is read from its blob, which requires reading the ref and
+        the metadata of the blob for each file.
+        """
+        for file_info in self._refs(prefix, recursive, page_size):
+            yield self.stat_file(self._path(file_info.key))
+
+    def _path(self, ref_key: str) -> str:
+        """Return the path of a file from the path of its ref."""
+        return ref_key[len(self.ref_prefix) :]
+
+    def _refs(
+        self, prefix: str = '', recursive: bool = True, page_size: int = 1000
+    ) -> Iterator[FileInfo]:
+        """Yield the metadata of the refs."""
+        return self.provider.list_files(self._ref_key(prefix), recursive, page_size)
+
+    def save_file(self, contents: bytes | str | BinaryIO, path: str, **kwargs) -> str:
+        """Write file to storage, skipping the upload when the contents are already stored.
+
+        Args:
+            contents: The contents of the file (bytes, str, or a file-like object).
+            path: The path to write the file.
+            digest (str | kwargs): The digest of the contents, if known to the caller. When a
+                blob with the digest exists the contents are not read. The digest must come
+                from a trusted source, since it links the path to any existing blob.
+            **kwargs: Additional arguments passed to the wrapped provider save_file.
+
+        Return:
+            str: The path of the file.
+
+        Raises:
+            falcon.HTTPBadRequest: Raised if the digest is invalid or does not match the
+                contents.
+        """
+        expected_digest = kwargs.pop('digest', None)
+        if expected_digest is not None:
+            expected_digest = expected_digest.lower()
+            if not self._is_digest(expected_digest):
+                raise falcon.HTTPBadRequest(
+                    # code=code(),
+                    description=f'Invalid {self.algorithm} digest.',
+                    title='Bad Request',
+                )
+            if self._link(path, expected_digest):
+                return path
+
+        spooled, digest = self._spool(contents)
+        with spooled:
+            if expected_digest is not None and expected_digest != digest:
+                raise falcon.HTTPBadRequest(
+                    # code=code(),
+                    description=f'The {self.algorithm} digest does not match the contents.',
+                    title='Bad Request',
+                )
+
+            if not self._link(path, digest):
+                self.provider.save_file(spooled, self._blob_key(digest), **kwargs)
+                self._save_ref(path, digest)
+        return path
+
+    def _link(self, path: str, digest: str) -> bool:
+        """Write the ref of a file to an existing blob, return False if the blob does not exist.
+
+        A concurrent collect_garbage could delete the (unreferenced) blob after the existence
+        check. If the collection listed the refs before the ref was written, its marker is
+        present after the ref is written, so the running collection is waited for before the
+        blob is checked again.
+        """
+        blob_key = self._blob_key(digest)
+        if not self.provider.is_file(blob_key):
+            return False
+        self._save_ref(path, digest)
+        self._wait_for_collection()
+        return self.provider.is_file(blob_key)
+
+    def _wait_for_collection(self):
+        """Wait for a running collect_garbage to finish, up to collect_timeout seconds."""
+        deadline = time.monotonic() + self.collect_timeout
+        while self.provider.is_file(self.collect_marker) and time.monotonic() < deadline:
+            time.sleep(self.marker_poll_interval)
+
+    def _spool(self, contents: bytes | str | BinaryIO | TextIO) -> tuple[BinaryIO, str]:
+        """Return the contents as a file positioned at the start, and the digest of the contents.
+
+        File-like contents are spooled to a temporary file (in memory up to spool_size) while
+        the digest is computed, so the contents are read once.
+        """
+        if isinstance(contents, str):
+            contents = contents.encode()
+
+        hasher = hashlib.new(self.algorithm)
+        if isinstance(contents, bytes):
+            hasher.update(contents)
+            return io.BytesIO(contents), hasher.hexdigest()
+
+        # closed by save_file
+        spooled = tempfile.SpooledTemporaryFile(  # pylint: disable=consider-using-with
+            max_size=self.spool_size
+        )
+        while True:
+            chunk = contents.read(self.buffer_size)
+            if not chunk:
+                break
+            if isinstance(chunk, str):
+                chunk = chunk.encode()
+            hasher.update(chunk)
+            spooled.write(chunk)
+        spooled.seek(0)
+        return spooled, hasher.hexdigest()
+
+    def _referenced(self) -> set[str]:
+        """Return the digests referenced by any file."""
+        return {self.digest(self._path(file_info.key)) for file_info in self._refs()}
+
+    def _save_ref(self, path: str, digest: str):
+        """Write the ref of a file."""
+        self.provider.save_file(io.BytesIO(digest.encode()), self._ref_key(path))
+
+    def send_file(self, resp: falcon.Response, path: str, **kwargs):
+        """Stream file from storage as the body of the falcon response.
+
+        The ETag is the digest of the contents, as returned by stat_file, and an If-None-Match
+        request header is evaluated against the digest without reading the blob. The blob
+        paths have no extension, so the content type defaults to the type guessed from the
+        path of the file.
+
+        Raises:
+            falcon.HTTPStatus: Raised with a 304 status when the wrapped provider answers a
+                conditional (If-Modified-Since) request with an exception (e.g.,
+                S3StorageProvider), with the ETag header set to the digest.
+        """
+        digest = self.digest(path)
+        req: falcon.Request | None = kwargs.get('req')
+        # If-None-Match takes precedence, so the modification time of the blob is not needed
+        if req is not None and req.if_none_match is not None:
+            if self._is_not_modified(req, digest, None):
+                resp.etag = digest
+                resp.status = falcon.HTTP_304
+                return
+
+        content_type = kwargs.get('content_type') or mimetypes.guess_type(path)[0]
+        if content_type is not None:
+            kwargs['content_type'] = content_type
+        try:
+            self.provider.send_file(resp, self._blob_key(digest), **kwargs)
+        except falcon.HTTPStatus as status:
+            status.headers = {**(status.headers or {}), 'ETag': f'"{digest}"'}
+            raise
+        resp.etag = digest
+
+    def stat_file(self, path: str) -> FileInfo:
+        """Return the metadata of a file in storage.
+
+        The ETag is the digest of the contents, so it is the same for all paths with identical
+        contents. The content type is guessed from the path of the file, falling back to the
+        content type of the blob.
+        """
+        digest = self.digest(path)
+        blob_info = self.provider.stat_file(self._blob_key(digest))
+        return FileInfo(
+            path,
+            blob_info.size,
+            blob_info.mtime,
+            digest,
+            mimetypes.guess_type(path)[0] or blob_info.content_type,
+        )
+
+    def storage_path(self, path: str) -> str:
+        """Return the path of a file as accepted by delete_file, which is the path of the file."""
+        return path
@@ -3,11 +3,46 @@
 import falcon
 
 # first-party
-from falcon_provider_storage.utils import LocalStorageProvider, S3StorageProvider
+from falcon_provider_storage.aio import (
+    AsyncLocalStorageProvider,
+    AsyncS3StorageProvider,
+    AsyncStorageProviderABC,
+)
+from falcon_provider_storage.local import LocalStorageProvider
+from falcon_provider_storage.middleware import StorageMiddleware, bind_storage
+from falcon_provider_storage.registry import provider_registry
+from falcon_provider_storage.utils import StorageProviderABC
+
+
+def _bind(
+    req: falcon.Request,
+    resource: object,
+    provider: StorageProviderABC | AsyncStorageProviderABC,
+    binding: str,
+):
+    """Make the provider available to the responder with the binding of the hook.
+
+    With the "resource" binding the storage methods are bound to the resource (a no-op when
+    already bound to the provider), with the "context" binding the provider is set on
+    ``req.context.storage`` and the resource is not modified.
+    """
+    if binding == 'context':
+        req.context.storage = provider
+    elif binding == 'resource':
+        bind_storage(resource, provider)
+    else:
+        raise ValueError(
+            f'Invalid binding ({binding}), must be one of {StorageMiddleware.bindings}.'
+        )
 
 
 def local_storage(
-    req: falcon.Request, resp: falcon.Response, resource, params: dict, bucket: str
+    req: falcon.Request,
+    resp: falcon.Response,
+    resource,
+    params: dict,
+    bucket: str,
+    binding: str = 'resource',
 ):  # pylint: disable=unused-argument
     """Provide an instance of REDIS client to method via resource.
 
@@ -25,14 +60,14 @@ def local_storage(
         resource: The falcon resp object.
         params: List of query params.
         bucket: The base directory/bucket where files should be written.
+        binding: How the provider is made available, either "resource" (the storage methods
+            are bound to the resource) or "context" (``req.context.storage``).
     """
-    provider = LocalStorageProvider(bucket)
+    # reuse the process-wide provider for this bucket
+    provider = provider_registry.get(LocalStorageProvider, bucket)
 
-    # insert storage methods into resource
-    resource.delete_file = provider.delete_file
-    resource.get_file = provider.get_file
-    resource.is_file = provider.is_file
-    resource.save_file = provider.save_file
+    # insert storage methods into resource or the request context
+    _bind(req, resource, provider, binding)
 
 
 def s3_storage(
@@ -43,6 +78,7 @@ def s3_storage(
     bucket: str,
     aws_access_key_id: str,
     aws_secret_access_key: str,
+    binding: str = 'resource',
 ):  # pylint: disable=unused-argument
     """Provide an instance of REDIS client to method via resource.
 
@@ -62,11 +98,94 @@ def s3_storage(
         bucket: The base directory/bucket where files should be written.
         aws_access_key_id: The AWS access key Id.
         aws_secret_access_key: The AWS secret key.
+        binding: How the provider is made available, either "resource" (the storage methods
+            are bound to the resource) or "context" (``req.context.storage``).
+    """
+    # first-party
+    from falcon_provider_storage.s3 import (  # pylint: disable=import-outside-toplevel
+        S3StorageProvider,
+    )
+
+    # reuse the process-wide provider (and boto3 client) for this bucket and credentials
+    provider = provider_registry.get(
+        S3StorageProvider, bucket, aws_access_key_id, aws_secret_access_key
+    )
+
+    # insert storage methods into resource or the request context
+    _bind(req, resource, provider, binding)
+
+
+async def async_local_storage(
+    req: falcon.Request,
+    resp: falcon.Response,
+    resource,
+    params: dict,
+    bucket: str,
+    binding: str = 'resource',
+):  # pylint: disable=unused-argument
+    """Provide an instance of async local storage provider to method via resource (ASGI).
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        @falcon.before(async_local_storage, bucket)
+        async def on_get(self, req, resp):
+            filename = req.get_param('filename')
+            resp.data = await self.get_file(filename)
+
+    Args:
+        req: The falcon req object.
+        resp: The falcon resp object.
+        resource: The falcon resp object.
+        params: List of query params.
+        bucket: The base directory/bucket where files should be written.
+        binding: How the provider is made available, either "resource" (the storage methods
+            are bound to the resource) or "context" (``req.context.storage``).
+    """
+    # reuse the process-wide provider for this bucket
+    provider = provider_registry.get(AsyncLocalStorageProvider, bucket)
+
+    # insert storage methods into resource or the request context
+    _bind(req, resource, provider, binding)
+
+
+async def async_s3_storage(
+    req: falcon.Request,
+    resp: falcon.Response,
+    resource,
+    params: dict,
+    bucket: str,
+    aws_access_key_id: str,
+    aws_secret_access_key: str,
+    binding: str = 'resource',
+):  # pylint: disable=unused-argument
+    """Provide an instance of async S3 storage provider to method via resource (ASGI).
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        @falcon.before(async_s3_storage, BUCKET, AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY)
+        async def on_get(self, req, resp):
+            filename = req.get_param('filename')
+            resp.data = await self.get_file(filename)
+
+    Args:
+        req: The falcon req object.
+        resp: The falcon resp object.
+        resource: The falcon resp object.
+        params: List of query params.
+        bucket: The base directory/bucket where files should be written.
+        aws_access_key_id: The AWS access key Id.
+        aws_secret_access_key: The AWS secret key.
+        binding: How the provider is made available, either "resource" (the storage methods
+            are bound to the resource) or "context" (``req.context.storage``).
     """
-    provider = S3StorageProvider(bucket, aws_access_key_id, aws_secret_access_key)
+    # reuse the process-wide provider (and boto3 client) for this bucket and credentials
+    provider = provider_registry.get(
+        AsyncS3StorageProvider, bucket, aws_access_key_id, aws_secret_access_key
+    )
 
-    # insert storage methods into resource
-    resource.delete_file = provider.delete_file
-    resource.get_file = provider.get_file
-    resource.is_file = provider.is_file
-    resource.save_file = provider.save_file
+    # insert storage methods into resource or the request context
+    _bind(req, resource, provider, binding)
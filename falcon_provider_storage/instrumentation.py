@@ -0,0 +1,305 @@
+"""Falcon storage provider instrumentation module."""
+# standard library
+import functools
+import logging
+import time
+from collections.abc import Callable
+from typing import BinaryIO
+
+# third-party
+import falcon
+
+
+class StorageEvent:
+    """The timing and outcome of a single storage provider operation.
+
+    Args:
+        operation: The name of the provider method (e.g., get_file).
+        provider: The name of the provider class (e.g., S3StorageProvider).
+        bucket: The base directory/bucket of the provider.
+        path: The path of the file, or None for operations on multiple files.
+        bytes_transferred: The number of bytes read or written, or None if unknown (e.g.,
+            streamed reads, which are consumed after the operation returns).
+        duration: The duration of the operation in seconds.
+        outcome: The outcome of the operation (success, not_modified, or error).
+        error: The exception raised by the operation, if any.
+    """
+
+    __slots__ = (
+        'bucket',
+        'bytes_transferred',
+        'duration',
+        'error',
+        'operation',
+        'outcome',
+        'path',
+        'provider',
+    )
+
+    def __init__(
+        self,
+        operation: str,
+        provider: str,
+        bucket: str,
+        path: str | None,
+        bytes_transferred: int | None,
+        duration: float,
+        outcome: str,
+        error: BaseException | None = None,
+    ):
+        """Initialize class properties."""
+        self.bucket = bucket
+        self.bytes_transferred = bytes_transferred
+        self.duration = duration
+        self.error = error
+        self.operation = operation
+        self.outcome = outcome
+        self.path = path
+        self.provider = provider
+
+    def __repr__(self) -> str:
+        """Return the representation of the event."""
+        return (
+            f'{self.__class__.__name__}(operation={self.operation!r}, provider={self.provider!r}, '
+            f'bucket={self.bucket!r}, path={self.path!r}, '
+            f'bytes_transferred={self.bytes_transferred!r}, duration={self.duration!r}, '
+            f'outcome={self.outcome!r})'
+        )
+
+
+class CountingReader:
+    """File-like object that counts the bytes read from a file.
+
+    All other attributes (e.g., seek, tell) are looked up on the wrapped file, so the reader
+    can be passed to code that checks for a seekable file (e.g., the S3 transfer manager).
+
+    Args:
+        fh: The file-like object to read.
+    """
+
+    def __init__(self, fh: BinaryIO):
+        """Initialize class properties."""
+        self.bytes_read = 0
+        self.fh = fh
+
+    def __getattr__(self, name: str) -> object:
+        """Return attributes that are not defined on the reader from the wrapped file."""
+        return getattr(self.fh, name)
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes from the file."""
+        data = self.fh.read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def _bytes_transferred(operation: str, args: tuple, result: object) -> int | None:
+    """Return the number of bytes transferred by an operation, if known."""
+    if operation == 'get_file' and isinstance(result, (bytes, str)):
+        return len(result)
+    if operation == 'get_file_range' and isinstance(result[0], (bytes, str)):
+        return len(result[0])
+    if operation == 'save_file':
+        contents = args[0]
+        if isinstance(contents, CountingReader):
+            return contents.bytes_read
+        if isinstance(contents, (bytes, str)):
+            return len(contents)
+    if operation == 'send_file':
+        return args[0].content_length
+    return None
+
+
+def _instrumented_args(operation: str, args: tuple, kwargs: dict) -> tuple[tuple, str | None]:
+    """Return the arguments of an operation (with a counted upload) and the path of the file."""
+    path = kwargs.get('path')
+    if operation == 'save_file':
+        if args and not isinstance(args[0], (bytes, str)):
+            # count the bytes of file-like uploads as they are read
+            args = (CountingReader(args[0]), *args[1:])
+        if len(args) > 1:
+            path = args[1]
+    elif operation == 'send_file':
+        if len(args) > 1:
+            path = args[1]
+    elif args and isinstance(args[0], str):
+        path = args[0]
+    return args, path
+
+
+def _notify(listeners: list[Callable], event: StorageEvent):
+    """Send the event to each listener."""
+    for listener in listeners:
+        try:
+            listener(event)
+        except Exception:  # pylint: disable=broad-except
+            # a failing listener must never fail the storage operation
+            logging.getLogger(__name__).exception('Storage listener failed.')
+
+
+def instrument(method: Callable) -> Callable:
+    """Report the timing and outcome of a provider method to the provider listeners.
+
+    When the provider has no listeners the method is called directly, so the overhead of an
+    instrumented method is a single attribute lookup.
+
+    Args:
+        method: The provider method (e.g., get_file).
+    """
+    operation = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs) -> object:
+        listeners = self.listeners
+        if not listeners:
+            return method(self, *args, **kwargs)
+
+        args, path = _instrumented_args(operation, args, kwargs)
+        error = None
+        outcome = 'error'
+        result = None
+        start = time.perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+            outcome = 'success'
+            if operation == 'send_file' and args[0].status in (falcon.HTTP_304, 304):
+                outcome = 'not_modified'
+            return result
+        except falcon.HTTPStatus as ex:
+            if ex.status in (falcon.HTTP_304, 304):
+                outcome = 'not_modified'
+            error = ex
+            raise
+        except BaseException as ex:
+            error = ex
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            bytes_transferred = None
+            if outcome == 'success':
+                bytes_transferred = _bytes_transferred(operation, args, result)
+
+            _notify(
+                listeners,
+                StorageEvent(
+                    operation,
+                    self.__class__.__name__,
+                    self.bucket,
+                    path,
+                    bytes_transferred,
+                    duration,
+                    outcome,
+                    error,
+                ),
+            )
+
+    return wrapper
+
+
+class LoggingListener:
+    """Storage listener that logs each storage operation.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        provider = S3StorageProvider(bucket, aws_access_key_id, aws_secret_access_key)
+        provider.add_listener(LoggingListener(logging.getLogger('storage')))
+
+    Args:
+        logger: The logger, defaults to the falcon_provider_storage logger.
+        level: The log level of successful operations, errors are logged as warnings.
+    """
+
+    def __init__(self, logger: logging.Logger | None = None, level: int = logging.DEBUG):
+        """Initialize class properties."""
+        self.level = level
+        self.logger = logger or logging.getLogger('falcon_provider_storage')
+
+    def __call__(self, event: StorageEvent):
+        """Log the storage event."""
+        level = logging.WARNING if event.outcome == 'error' else self.level
+        if not self.logger.isEnabledFor(level):
+            return
+
+        self.logger.log(
+            level,
+            'storage %s provider=%s bucket=%s path=%s bytes=%s duration=%.6f outcome=%s',
+            event.operation,
+            event.provider,
+            event.bucket,
+            event.path,
+            event.bytes_transferred,
+            event.duration,
+            event.outcome,
+        )
+
+
+class PrometheusListener:
+    """Storage listener that records Prometheus counters and histograms.
+
+    The following metrics are recorded, labeled by operation, provider, and bucket:
+
+    * ``<namespace>_operations_total`` - the number of operations (also labeled by outcome).
+    * ``<namespace>_bytes_total`` - the number of bytes transferred.
+    * ``<namespace>_operation_duration_seconds`` - the duration of each operation.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        provider = S3StorageProvider(bucket, aws_access_key_id, aws_secret_access_key)
+        provider.add_listener(PrometheusListener())
+
+    Args:
+        namespace: The prefix of the metric names.
+        registry: The prometheus_client registry, defaults to the global registry.
+        buckets: The histogram buckets in seconds, defaults to the prometheus_client buckets.
+    """
+
+    def __init__(
+        self,
+        namespace: str = 'storage',
+        registry: object | None = None,
+        buckets: tuple[float, ...] | None = None,
+    ):
+        """Initialize class properties."""
+        try:
+            # third-party
+            import prometheus_client  # pylint: disable=import-outside-toplevel
+        except ImportError as ex:  # pragma: no cover
+            raise ImportError(
+                'PrometheusListener requires prometheus_client to be installed '
+                'try "pip install falcon-provider-storage[prometheus]".'
+            ) from ex
+
+        registry = registry or prometheus_client.REGISTRY
+        labels = ('operation', 'provider', 'bucket')
+        histogram_options = {'buckets': buckets} if buckets else {}
+        self.bytes_total = prometheus_client.Counter(
+            f'{namespace}_bytes',
+            'The number of bytes transferred by storage operations.',
+            labels,
+            registry=registry,
+        )
+        self.duration = prometheus_client.Histogram(
+            f'{namespace}_operation_duration_seconds',
+            'The duration of storage operations.',
+            labels,
+            registry=registry,
+            **histogram_options,
+        )
+        self.operations_total = prometheus_client.Counter(
+            f'{namespace}_operations',
+            'The number of storage operations.',
+            (*labels, 'outcome'),
+            registry=registry,
+        )
+
+    def __call__(self, event: StorageEvent):
+        """Record the storage event."""
+        labels = (event.operation, event.provider, event.bucket)
+        self.duration.labels(*labels).observe(event.duration)
+        self.operations_total.labels(*labels, event.outcome).inc()
+        if event.bytes_transferred:
+            self.bytes_total.labels(*labels).inc(event.bytes_transferred)
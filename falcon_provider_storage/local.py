@@ -0,0 +1,496 @@
+"""Local Storage Provider Module"""
+# standard library
+import contextlib
+import mimetypes
+import os
+import shutil
+import uuid
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from typing import BinaryIO, TextIO
+
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_storage.instrumentation import instrument
+from falcon_provider_storage.utils import FileInfo, RangeReader, StorageProviderABC
+
+
+class LocalStorageProvider(StorageProviderABC):
+    """Local Storage Provider Module
+
+    Args:
+        bucket (str): The base directory/bucket where files should be written.
+        buffer_size (int): The size of the chunks used to copy uploaded file contents to disk.
+        atomic (bool): If True, files are written to a temporary file in the same directory and
+            then renamed into place, so readers never see a partially written file.
+        fsync (str): The durability policy for written files, one of "none" (default), "file"
+            (fsync the file), or "directory" (fsync the file and its parent directory).
+        max_workers (int): The maximum number of threads used for bulk operations.
+    """
+
+    fsync_policies = ('none', 'file', 'directory')
+
+    def __init__(
+        self,
+        bucket: str,
+        buffer_size: int = 65536,
+        atomic: bool = False,
+        fsync: str = 'none',
+        max_workers: int = 8,
+    ):
+        """Initialize class properties."""
+        super().__init__(bucket, max_workers)
+        self.atomic = atomic
+        self.buffer_size = buffer_size
+        self.fsync = self._fsync_policy(fsync)
+
+        if not os.access(self.bucket, os.W_OK):  # pragma: no cover
+            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
+                # code=code(),
+                description='App does not have write access to storage bucket.',
+                title='Internal Server Error',
+            )
+
+    @instrument
+    def delete_file(self, path: str) -> bool:
+        """Delete a file.
+
+        Args:
+            path: The path of the file to delete.
+
+        Return:
+            str: True if the file was delete.
+        """
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+        except PermissionError:  # pragma: no cover
+            return False
+
+    @instrument
+    def delete_files(self, paths: list[str]) -> dict[str, bool]:
+        """Delete multiple files.
+
+        The files are deleted in parallel using the provider thread pool, which is bounded by
+        max_workers.
+
+        Args:
+            paths: The paths of the files to delete.
+
+        Return:
+            dict: A mapping of each path to True if the file was deleted.
+        """
+        paths = list(dict.fromkeys(paths))
+        return dict(zip(paths, self.executor.map(self.delete_file, paths)))
+
+    def storage_path(self, path: str) -> str:
+        """Return the path of a file as accepted by delete_file (the path in the bucket).
+
+        Args:
+            path: The path of the file relative to the bucket (as used by get_file).
+        """
+        return os.path.join(self.bucket, path)
+
+    # pylint: disable=consider-using-with,unspecified-encoding
+    @instrument
+    def get_file(self, path: str, **kwargs) -> bytes | str | BinaryIO | TextIO:
+        """Return file from storage.
+
+        When stream is True the open file object is returned instead of the file contents, so
+        that it can be passed directly to ``resp.stream`` and sent in chunks without buffering
+        the whole file in memory. The caller (or falcon) is responsible for closing the file.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            resp.stream = self.get_file(filename, stream=True)
+
+        Args:
+            path: The path of the file to return.
+            mode (str | kwargs): The read mode for the file.
+            stream (bool | kwargs): If True, return the open file object.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the file download.
+        """
+        fully_qualified_path = os.path.join(self.bucket, path)
+        try:
+            fh = open(fully_qualified_path, kwargs.get('mode', 'rb'))
+            if kwargs.get('stream', False) is True:
+                return fh
+            with fh:
+                return fh.read()
+        except OSError:
+            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
+                # code=code(),
+                description=f'File ({path}) could not be accessed.',
+                title='Internal Server Error',
+            )
+
+    # pylint: disable=consider-using-with
+    @instrument
+    def get_file_range(
+        self, path: str, start: int, end: int | None = None, **kwargs
+    ) -> tuple[bytes | BinaryIO, tuple[int, int, int]]:
+        """Return a byte range of a file from storage.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            contents, (first, last, size) = self.get_file_range(filename, 0, 1023)
+
+        Args:
+            path: The path of the file to return.
+            start: The first byte position, or a negative value for a suffix range (last N bytes).
+            end: The last byte position (inclusive), or None/-1 to read to the end of the file.
+            stream (bool | kwargs): If True, return a file-like object limited to the range.
+
+        Returns:
+            tuple: The range contents and a (first, last, size) tuple for the Content-Range header.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the file access.
+            falcon.HTTPRangeNotSatisfiable: Raised when the range is outside of the file.
+        """
+        fully_qualified_path = os.path.join(self.bucket, path)
+        try:
+            fh = open(fully_qualified_path, 'rb')
+        except OSError:
+            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
+                # code=code(),
+                description=f'File ({path}) could not be accessed.',
+                title='Internal Server Error',
+            )
+
+        try:
+            size = os.fstat(fh.fileno()).st_size
+            first, last = self._resolve_range(start, end, size)
+            fh.seek(first)
+        except Exception:
+            fh.close()
+            raise
+
+        if kwargs.get('stream', False) is True:
+            return RangeReader(fh, last - first + 1), (first, last, size)
+        with fh:
+            return fh.read(last - first + 1), (first, last, size)
+
+    @instrument
+    def is_file(self, path: str) -> bool:
+        """Return True if file exists, else False.
+
+        Args:
+            path: The path of the file to return.
+        """
+        fully_qualified_path = os.path.join(self.bucket, path)
+        return os.path.isfile(fully_qualified_path)
+
+    def list_files(
+        self, prefix: str = '', recursive: bool = True, page_size: int = 1000
+    ) -> Iterator[FileInfo]:
+        """Yield the metadata of the files in storage.
+
+        The bucket directory is walked lazily with os.scandir, only descending into the
+        directories that can contain keys matching the prefix. Keys always use "/" as the
+        separator, and files are yielded in no particular order.
+
+        Args:
+            prefix: Only files with keys starting with the prefix are listed.
+            recursive: If False, files in sub-directories of the prefix are not listed.
+            page_size: Unused, directories are read incrementally.
+
+        Return:
+            Iterator[FileInfo]: The metadata of each file.
+        """
+        for key, entry in self._walk(prefix, recursive):
+            if not key.startswith(prefix) or (not recursive and '/' in key[len(prefix) :]):
+                continue
+
+            if entry.name.startswith('.') and entry.name.endswith('.tmp'):
+                # incomplete atomic write
+                continue
+
+            try:
+                stat = entry.stat()
+            except OSError:  # pragma: no cover
+                # the file was removed during the listing
+                continue
+
+            yield FileInfo(
+                key=key,
+                size=stat.st_size,
+                mtime=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+                etag=self._etag(stat),
+                content_type=mimetypes.guess_type(entry.name)[0],
+            )
+
+    def _walk(self, prefix: str, recursive: bool) -> Iterator[tuple[str, os.DirEntry]]:
+        """Yield the key and directory entry of the files in the directories that can match.
+
+        Symlinked directories are not followed, so a symlink loop or a symlink to a directory
+        outside of the bucket is never walked.
+        """
+        directories = ['']
+        while directories:
+            directory = directories.pop()
+            try:
+                entries = os.scandir(os.path.join(self.bucket, directory))
+            except OSError:
+                continue
+
+            with entries:
+                for entry in entries:
+                    key = f'{directory}{entry.name}'
+                    if entry.is_dir(follow_symlinks=False):
+                        # descend into directories on the way to the prefix, and into
+                        # directories inside the prefix only when listing recursively
+                        if prefix.startswith(f'{key}/') or (
+                            recursive and f'{key}/'.startswith(prefix)
+                        ):
+                            directories.append(f'{key}/')
+                    elif entry.is_file():
+                        yield key, entry
+
+    # pylint: disable=consider-using-with
+    @instrument
+    def send_file(self, resp: falcon.Response, path: str, **kwargs):
+        """Stream file from storage as the body of the falcon response.
+
+        The open file is handed to falcon along with the file size, so WSGI servers that
+        provide ``wsgi.file_wrapper`` (e.g., gunicorn, uWSGI) can send the file with
+        ``os.sendfile`` instead of copying the file contents through Python.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            def on_get(self, req, resp):
+                self.send_file(resp, req.get_param('filename'), req=req)
+
+        When the falcon req object is provided, conditional requests (If-None-Match and
+        If-Modified-Since) for an unchanged file are answered with 304 Not Modified, and a
+        request with a Range header is answered with a 206 Partial Content response containing
+        only the requested bytes.
+
+        Args:
+            resp: The falcon resp object.
+            path: The path of the file to send.
+            content_type (str | kwargs): The response content-type, defaults to a type guessed
+                from the file extension.
+            req (falcon.Request | kwargs): The falcon req object, used for conditional and Range
+                requests.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the file access.
+            falcon.HTTPRangeNotSatisfiable: Raised when the requested range is outside of the file.
+        """
+        req: falcon.Request | None = kwargs.get('req')
+        fully_qualified_path = os.path.join(self.bucket, path)
+        try:
+            fh = open(fully_qualified_path, 'rb')
+            stat = os.fstat(fh.fileno())
+        except OSError:
+            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
+                # code=code(),
+                description=f'File ({path}) could not be accessed.',
+                title='Internal Server Error',
+            )
+
+        etag = self._etag(stat)
+        last_modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+        resp.accept_ranges = 'bytes'
+        resp.etag = etag
+        resp.last_modified = last_modified
+
+        if req is not None and self._is_not_modified(req, etag, last_modified):
+            fh.close()
+            resp.status = falcon.HTTP_304
+            return
+
+        resp.content_type = (
+            kwargs.get('content_type')
+            or mimetypes.guess_type(path)[0]
+            or 'application/octet-stream'
+        )
+
+        byte_range = self._range(req)
+        if byte_range is not None:
+            try:
+                first, last = self._resolve_range(*byte_range, stat.st_size)
+                fh.seek(first)
+            except Exception:
+                fh.close()
+                raise
+
+            resp.status = falcon.HTTP_206
+            resp.content_range = (first, last, stat.st_size)
+            resp.set_stream(RangeReader(fh, last - first + 1), last - first + 1)
+            return
+
+        resp.set_stream(fh, stat.st_size)
+
+    @instrument
+    def stat_file(self, path: str) -> FileInfo:
+        """Return the metadata of a file in storage without reading the file.
+
+        The ETag is derived from the inode, size, and modification time of the file.
+
+        Args:
+            path: The path of the file.
+
+        Return:
+            FileInfo: The file key, size, mtime, etag, and content_type.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the file access.
+        """
+        fully_qualified_path = os.path.join(self.bucket, path)
+        try:
+            stat = os.stat(fully_qualified_path)
+        except OSError:
+            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
+                # code=code(),
+                description=f'File ({path}) could not be accessed.',
+                title='Internal Server Error',
+            )
+
+        return FileInfo(
+            key=path,
+            size=stat.st_size,
+            mtime=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+            etag=self._etag(stat),
+            content_type=mimetypes.guess_type(path)[0],
+        )
+
+    @staticmethod
+    def _etag(stat: os.stat_result) -> str:
+        """Return an ETag for a file based on the inode, size, and modification time."""
+        return f'{stat.st_ino:x}-{stat.st_size:x}-{stat.st_mtime_ns:x}'
+
+    @staticmethod
+    def _fsync_directory(directory: str):
+        """Flush the directory entry of a new or renamed file to disk."""
+        if os.name == 'nt':  # pragma: no cover
+            # directories can't be opened (or synced) on Windows
+            return
+
+        fd = os.open(directory or '.', os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def _fsync_policy(cls, fsync: str) -> str:
+        """Return the fsync policy.
+
+        Raises:
+            ValueError: Raised if the fsync policy is invalid.
+        """
+        if fsync not in cls.fsync_policies:
+            raise ValueError(
+                f'Invalid fsync policy ({fsync}), must be one of {cls.fsync_policies}.'
+            )
+        return fsync
+
+    # pylint: disable=unspecified-encoding
+    @instrument
+    def save_file(self, contents: bytes | str, path, **kwargs) -> str:
+        """Write file to storage.
+
+        File-like contents (e.g., ``part.stream`` of a multipart upload) are copied to disk in
+        chunks of buffer_size, so memory usage per upload stays constant regardless of the size
+        of the file.
+
+        When atomic is enabled the contents are written to a temporary file in the destination
+        directory, which is then moved into place with ``os.replace``. The atomic setting is
+        ignored for append modes.
+
+        Args:
+            contents: The contents of the file (bytes, str, or a file-like object).
+            path: The path to write the file.
+            atomic (bool | kwargs): Write the file atomically, defaults to the provider setting.
+            buffer_size (int | kwargs): The copy chunk size, defaults to the provider buffer_size.
+            fsync (str | kwargs): The durability policy, defaults to the provider setting.
+            mode (str | kwargs): The write mode, defaults to 'wb'.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the file check.
+            ValueError: Raised if the fsync policy is invalid.
+        """
+        fully_qualified_path = os.path.join(self.bucket, path)
+        fsync = self._fsync_policy(kwargs.get('fsync') or self.fsync)
+        mode = kwargs.get('mode', 'wb')
+        # append modes write in place
+        atomic = kwargs.get('atomic', self.atomic) and 'a' not in mode
+
+        try:
+            self._write(
+                contents,
+                fully_qualified_path,
+                mode,
+                atomic,
+                fsync,
+                kwargs.get('buffer_size') or self.buffer_size,
+            )
+        except OSError:  # pragma: no cover
+            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
+                # code=code(),
+                description='File could not be written.',
+                title='Internal Server Error',
+            )
+        return fully_qualified_path
+
+    def _write(
+        self,
+        contents: bytes | str | BinaryIO | TextIO,
+        fully_qualified_path: str,
+        mode: str,
+        atomic: bool,
+        fsync: str,
+        buffer_size: int,
+    ):
+        """Write the contents to the file, atomically and durably as set by atomic and fsync.
+
+        Raises:
+            OSError: Raised if the file could not be written, the temp file of an atomic write
+                is removed.
+        """
+        directory = os.path.dirname(fully_qualified_path)
+
+        # write to a temp file in the same directory so that os.replace is atomic
+        write_path = fully_qualified_path
+        if atomic:
+            write_path = os.path.join(
+                directory, f'.{os.path.basename(fully_qualified_path)}.{uuid.uuid4().hex}.tmp'
+            )
+
+        try:
+            # ensure the directory exists
+            os.makedirs(directory, exist_ok=True)
+            with open(write_path, mode) as fh:
+                if isinstance(contents, (bytes, str)):
+                    fh.write(contents)
+                else:
+                    shutil.copyfileobj(contents, fh, buffer_size)
+
+                if fsync in ('file', 'directory'):
+                    fh.flush()
+                    os.fsync(fh.fileno())
+
+            if atomic:
+                os.replace(write_path, fully_qualified_path)
+
+            if fsync == 'directory':
+                self._fsync_directory(directory)
+        except OSError:  # pragma: no cover
+            if atomic:
+                with contextlib.suppress(OSError):
+                    os.remove(write_path)
+            raise
@@ -3,28 +3,84 @@
 import falcon
 
 # first-party
+from falcon_provider_storage.aio import AsyncStorageProviderABC
 from falcon_provider_storage.utils import StorageProviderABC
 
 
+def bind_storage(
+    resource: object, provider: StorageProviderABC | AsyncStorageProviderABC
+) -> object:
+    """Bind the storage methods of the provider to the resource.
+
+    The storage methods are set on the resource once, so binding a resource at route
+    registration removes the per-request cost of the middleware and hooks. The provider is
+    available as ``resource.storage_provider``. Binding a resource that is already bound to
+    the same provider is a no-op.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        app = falcon.App()
+        app.add_route('/files', bind_storage(FilesResource(), local_provider))
+
+    Args:
+        resource: The falcon resource (or resource class).
+        provider: An instance of storage provider (e.g., LocalStorageProvider).
+
+    Return:
+        object: The resource.
+    """
+    if getattr(resource, 'storage_provider', None) is not provider:
+        for method in provider.resource_methods:
+            setattr(resource, method, getattr(provider, method))
+        resource.storage_provider = provider
+    return resource
+
+
 class StorageMiddleware:
     """Storage middleware module.
 
+    The middleware supports both WSGI (falcon.App) and ASGI (falcon.asgi.App) apps. For ASGI
+    apps an async storage provider should be used (e.g., AsyncLocalStorageProvider,
+    AsyncS3StorageProvider), so the storage methods can be awaited.
+
+    With the default "resource" binding the storage methods are bound to each resource the
+    first time it handles a request. With the "context" binding the provider is set on
+    ``req.context.storage`` instead and resources are never modified, which is safe when a
+    single resource is shared by apps with different providers.
+
     Args:
         provider (StorageProvider): An instance of storage provider (e.g., LocalStorageProvider,
-            S3StorageProvider).
+            S3StorageProvider, AsyncLocalStorageProvider, AsyncS3StorageProvider).
+        binding (str): How the provider is made available, either "resource" or "context".
     """
 
-    def __init__(self, provider: StorageProviderABC):
+    bindings = ('context', 'resource')
+
+    def __init__(
+        self, provider: StorageProviderABC | AsyncStorageProviderABC, binding: str = 'resource'
+    ):
         """Initialize class properties."""
+        self.binding = binding
         self.provider = provider
-        if not isinstance(provider, StorageProviderABC):  # pragma: no cover
+        providers = (StorageProviderABC, AsyncStorageProviderABC)
+        if not isinstance(provider, providers):  # pragma: no cover
             raise ValueError('Invalid provider provided.')
+        if binding not in self.bindings:
+            raise ValueError(f'Invalid binding ({binding}), must be one of {self.bindings}.')
 
     def process_resource(
-        self, _req: falcon.Request, _resp: falcon.Response, resource, _params: dict
+        self, req: falcon.Request, _resp: falcon.Response, resource, _params: dict
     ):  # pylint: disable=unused-argument
         """Process resource method."""
-        resource.delete_file = self.provider.delete_file
-        resource.get_file = self.provider.get_file
-        resource.is_file = self.provider.is_file
-        resource.save_file = self.provider.save_file
+        if self.binding == 'context':
+            req.context.storage = self.provider
+        elif resource is not None:
+            bind_storage(resource, self.provider)
+
+    async def process_resource_async(
+        self, req: falcon.Request, resp: falcon.Response, resource, params: dict
+    ):  # pylint: disable=unused-argument
+        """Process resource method for ASGI apps."""
+        self.process_resource(req, resp, resource, params)
@@ -0,0 +1,75 @@
+"""Falcon storage provider registry module."""
+# standard library
+import os
+import threading
+
+# first-party
+from falcon_provider_storage.utils import StorageProviderABC
+
+
+class ProviderRegistry:
+    """Process-wide registry of storage provider instances.
+
+    Providers are keyed on the provider type and the arguments used to create them (e.g., bucket
+    and credentials), so the hooks can reuse a single warm provider, and its connection pool,
+    across requests instead of building a new one per request.
+
+    The registry is cleared in a child process after a fork so that pre-forked workers (e.g.,
+    gunicorn) never share a provider, or its sockets, with the parent process.
+    """
+
+    def __init__(self):
+        """Initialize class properties."""
+        self._lock = threading.Lock()
+        self._providers: dict[tuple, StorageProviderABC] = {}
+
+    def __len__(self) -> int:
+        """Return the number of registered providers."""
+        return len(self._providers)
+
+    def _after_fork(self):
+        """Reset the registry in a forked child process.
+
+        The lock is replaced rather than released since it could have been held by another
+        thread of the parent process at the time of the fork.
+        """
+        self._lock = threading.Lock()
+        self._providers = {}
+
+    def clear(self):
+        """Remove all registered providers."""
+        with self._lock:
+            self._providers.clear()
+
+    def get(self, provider_class: type, *args, **kwargs) -> StorageProviderABC:
+        """Return a shared provider instance, creating it on first use.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            provider = provider_registry.get(S3StorageProvider, BUCKET, KEY_ID, SECRET_KEY)
+
+        Args:
+            provider_class: The storage provider class (e.g., LocalStorageProvider).
+            *args: The positional arguments passed to the provider class (must be hashable).
+            **kwargs: The keyword arguments passed to the provider class (must be hashable).
+        """
+        key = (provider_class, args, tuple(sorted(kwargs.items())))
+        provider = self._providers.get(key)
+        if provider is None:
+            with self._lock:
+                # another thread could have created the provider while waiting on the lock
+                provider = self._providers.get(key)
+                if provider is None:
+                    provider = provider_class(*args, **kwargs)
+                    self._providers[key] = provider
+        return provider
+
+
+# the process-wide registry used by the storage hooks
+provider_registry = ProviderRegistry()
+
+if hasattr(os, 'register_at_fork'):  # pragma: no branch
+    # pylint: disable=protected-access
+    os.register_at_fork(after_in_child=provider_registry._after_fork)
@@ -0,0 +1,675 @@
+"""S3 Storage Provider Module"""
+# standard library
+import io
+import os
+import threading
+from collections.abc import Iterator
+from typing import BinaryIO
+
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_storage.instrumentation import instrument
+from falcon_provider_storage.utils import FileInfo, StorageProviderABC
+
+try:
+    # third-party
+    from botocore.exceptions import BotoCoreError, ClientError
+except ImportError:  # pragma: no cover
+    # caught and handled when importing boto3 in S3 class
+    pass
+
+
+class S3StorageProvider(StorageProviderABC):
+    """S3 Storage Provider Module
+
+    Args:
+        bucket: The base directory/bucket where files should be written.
+        aws_access_key_id: The AWS access key Id.
+        aws_secret_access_key: The AWS secret key.
+        conditional_delete: If True, delete_file uses a single conditional DeleteObject request
+            (If-Match: *) instead of a HEAD request followed by a DELETE request.
+        max_workers: The maximum number of threads used for bulk operations.
+        multipart_threshold: The size in bytes at which uploads switch to multipart uploads.
+        multipart_chunksize: The size in bytes of each part of a multipart upload.
+        max_concurrency: The maximum number of threads used to upload the parts of a file.
+        use_threads: If False, the parts of a file are uploaded serially in the calling thread.
+        max_pool_connections: The maximum number of pooled connections of the botocore client,
+            defaults to the max_pool_connections of client_config, or else to the number of
+            threads that can send requests at the same time (the bulk operation threads plus
+            the upload threads).
+        endpoint_url: The URL of the S3 API (e.g., MinIO, LocalStack, or a VPC endpoint).
+        region_name: The AWS region of the bucket.
+        client_config: A botocore Config for the other client settings (e.g., retries,
+            connect_timeout, read_timeout, and tcp_keepalive).
+        session: A boto3 Session to create the client from, e.g., to share the session (and its
+            credential and endpoint data) between providers. When provided the credentials are
+            taken from the session.
+    """
+
+    # the default TransferConfig max_concurrency
+    default_max_concurrency = 10
+
+    # the maximum number of keys in a single DeleteObjects request
+    delete_batch_size = 1000
+
+    # the error codes of a conditional DeleteObject request for a file that does not exist
+    missing_error_codes = ('404', '412', 'NoSuchKey', 'PreconditionFailed')
+
+    # the boto3 sessions shared by the providers, keyed on the credentials and region
+    _sessions: dict[tuple, object] = {}
+    _sessions_lock = threading.Lock()
+
+    # the TransferConfig settings that can be overridden per save_file call
+    transfer_settings = (
+        'max_concurrency',
+        'multipart_chunksize',
+        'multipart_threshold',
+        'use_threads',
+    )
+
+    def __init__(
+        self,
+        bucket: str,
+        aws_access_key_id: str,
+        aws_secret_access_key: str,
+        conditional_delete: bool = False,
+        max_workers: int = 8,
+        multipart_threshold: int | None = None,
+        multipart_chunksize: int | None = None,
+        max_concurrency: int | None = None,
+        use_threads: bool | None = None,
+        max_pool_connections: int | None = None,
+        endpoint_url: str | None = None,
+        region_name: str | None = None,
+        client_config: object | None = None,
+        session: object | None = None,
+    ):
+        """Initialize class properties."""
+        super().__init__(bucket, max_workers)
+        self.conditional_delete = conditional_delete
+        self.transfer_options = {
+            'max_concurrency': max_concurrency,
+            'multipart_chunksize': multipart_chunksize,
+            'multipart_threshold': multipart_threshold,
+            'use_threads': use_threads,
+        }
+        self._resource = None
+        self._transfer_manager = None
+        self._transfer_manager_lock = threading.Lock()
+        self._transfer_manager_pid: int | None = None
+
+        # a single session and client (and connection pool) are used for all S3 operations
+        self.session = session or self._session(
+            aws_access_key_id, aws_secret_access_key, region_name
+        )
+        self.client_config = self._client_config(
+            client_config,
+            max_pool_connections,
+            # every bulk operation thread and every upload thread can hold a connection
+            max_workers + (max_concurrency or self.default_max_concurrency),
+        )
+        with self._sessions_lock:
+            # creating clients from a shared session is not thread-safe
+            self.client = self.session.client(
+                's3', config=self.client_config, endpoint_url=endpoint_url, region_name=region_name
+            )
+
+    @classmethod
+    def _session(
+        cls,
+        aws_access_key_id: str,
+        aws_secret_access_key: str,
+        region_name: str | None,
+    ) -> object:
+        """Return the shared boto3 Session for the credentials, creating it on first use.
+
+        Creating a Session loads the botocore service data, so a session is shared by all
+        providers with the same credentials (e.g., one provider per bucket).
+        """
+        try:
+            # third-party
+            import boto3  # pylint: disable=import-outside-toplevel
+        except ImportError:  # pragma: no cover
+            print(
+                'S3StorageProvider requires boto3 and botocore to be installed '
+                'try "pip install falcon-provider-storage[s3]".'
+            )
+            raise
+
+        key = (aws_access_key_id, aws_secret_access_key, region_name)
+        with cls._sessions_lock:
+            session = cls._sessions.get(key)
+            if session is None:
+                session = boto3.session.Session(
+                    aws_access_key_id=aws_access_key_id,
+                    aws_secret_access_key=aws_secret_access_key,
+                    region_name=region_name,
+                )
+                cls._sessions[key] = session
+        return session
+
+    @classmethod
+    def _after_fork(cls):
+        """Reset the shared sessions in a forked child process.
+
+        The lock is replaced rather than released since it could have been held by another
+        thread of the parent process at the time of the fork.
+        """
+        cls._sessions = {}
+        cls._sessions_lock = threading.Lock()
+
+    @property
+    def resource(self) -> object:
+        """Return a boto3 S3 resource sharing the client of the provider, created on first use.
+
+        The provider only uses the client, the resource is provided for backwards compatibility.
+        """
+        if self._resource is None:
+            # creating resources from a shared session is not thread-safe
+            with self._sessions_lock:
+                if self._resource is None:
+                    resource = self.session.resource('s3')
+                    resource.meta.client = self.client
+                    self._resource = resource
+        return self._resource
+
+    @staticmethod
+    def _client_config(
+        client_config: object | None,
+        max_pool_connections: int | None,
+        default_pool_connections: int,
+    ) -> object:
+        """Return the botocore Config of the client.
+
+        Args:
+            client_config: The botocore Config provided by the caller.
+            max_pool_connections: The pool size provided by the caller, overrides client_config.
+            default_pool_connections: The pool size used if the caller did not set one.
+        """
+        # third-party
+        from botocore.config import Config  # pylint: disable=import-outside-toplevel
+
+        config = Config(max_pool_connections=default_pool_connections)
+        if client_config is not None:
+            config = config.merge(client_config)
+        if max_pool_connections is not None:
+            config = config.merge(Config(max_pool_connections=max_pool_connections))
+        return config
+
+    @instrument
+    def delete_file(self, path: str, **kwargs) -> bool:
+        """Delete a file.
+
+        By default the existence of the file is checked with a HEAD request before the file is
+        deleted, since S3 returns the same response for deleting a missing key. When conditional
+        delete is enabled a single DeleteObject request with ``If-Match: *`` is sent instead, and
+        S3 rejects the request if the file does not exist, halving the number of round trips.
+
+        .. code:: javascript
+
+            {
+                'ResponseMetadata': {
+                    'RequestId': 'B..............5',
+                    'HostId': '0..........................................=',
+                    'HTTPStatusCode': 204,
+                    'HTTPHeaders': {
+                        'x-amz-id-2': '0.............................................=',
+                        'x-amz-request-id': 'B..............5',
+                        'date': 'Mon, 26 Aug 2019 21:39:22 GMT',
+                        'x-amz-version-id': 'M..............................W',
+                        'x-amz-delete-marker': 'true',
+                        'server': 'AmazonS3'
+                    },
+                    'RetryAttempts': 0
+                },
+                'DeleteMarker': True,
+                'VersionId': 'M..............................W'
+            }
+
+        Args:
+            path: The path of the file to delete.
+            conditional (bool | kwargs): Use a single conditional DeleteObject request, defaults
+                to the provider conditional_delete setting.
+
+        Return:
+            str: True if the file was delete.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the file delete,
+                other than the file not existing.
+        """
+        conditional = kwargs.get('conditional', self.conditional_delete)
+        if not conditional and not self.is_file(path):
+            return False
+
+        try:
+            if conditional:
+                self.client.delete_object(Bucket=self.bucket, Key=path, IfMatch='*')
+            else:
+                self.client.delete_object(Bucket=self.bucket, Key=path)
+            return True
+        except ClientError as e:
+            # 404 (NoSuchKey) or 412 (PreconditionFailed) when the file does not exist
+            if e.response['Error']['Code'] in self.missing_error_codes:
+                return False
+
+            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
+                # code=code(),
+                description=f'File delete failed ({e}).',
+                title='Internal Server Error',
+            )
+
+    @instrument
+    def delete_files(self, paths: list[str]) -> dict[str, bool]:
+        """Delete multiple files using DeleteObjects requests of up to 1000 keys each.
+
+        .. note::
+            S3 reports a key as deleted whether or not it existed, so unlike delete_file the
+            result for a missing key is True. The result is False for keys S3 failed to delete.
+
+        Args:
+            paths: The paths of the files to delete.
+
+        Return:
+            dict: A mapping of each path to True if the file was deleted.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised if a DeleteObjects request fails. The batches
+                sent before the failed request are deleted.
+        """
+        paths = list(dict.fromkeys(paths))
+        results = dict.fromkeys(paths, False)
+        for index in range(0, len(paths), self.delete_batch_size):
+            batch = paths[index : index + self.delete_batch_size]
+            try:
+                response: dict = self.client.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': False},
+                )
+            except ClientError as e:
+                raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
+                    # code=code(),
+                    description=f'File delete failed ({e}).',
+                    title='Internal Server Error',
+                )
+
+            for deleted in response.get('Deleted', []):
+                results[deleted['Key']] = True
+        return results
+
+    @instrument
+    def get_file(self, path: str, **kwargs) -> bytes | BinaryIO:
+        """Return file from storage.
+
+        When stream is True the botocore StreamingBody is returned instead of the file contents,
+        so that it can be passed directly to ``resp.stream`` and sent in chunks without buffering
+        the whole object in memory. The caller (or falcon) is responsible for closing the body.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            resp.stream = self.get_file(filename, stream=True)
+
+        Args:
+            path: The path of the file to return.
+            stream (bool | kwargs): If True, return the streaming body of the object.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the file download.
+        """
+        file_obj = self._get_object(path)
+        if kwargs.get('stream', False) is True:
+            return file_obj['Body']
+        return file_obj['Body'].read()
+
+    @instrument
+    def get_file_range(
+        self, path: str, start: int, end: int | None = None, **kwargs
+    ) -> tuple[bytes | BinaryIO, tuple[int, int, int]]:
+        """Return a byte range of a file from storage.
+
+        The range is passed through to S3 in the GetObject request, so only the requested bytes
+        are transferred.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            contents, (first, last, size) = self.get_file_range(filename, 0, 1023)
+
+        Args:
+            path: The path of the file to return.
+            start: The first byte position, or a negative value for a suffix range (last N bytes).
+            end: The last byte position (inclusive), or None/-1 to read to the end of the file.
+            stream (bool | kwargs): If True, return the streaming body of the range.
+
+        Returns:
+            tuple: The range contents and a (first, last, size) tuple for the Content-Range header.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the file download.
+            falcon.HTTPRangeNotSatisfiable: Raised when the range is outside of the file.
+        """
+        file_obj = self._get_object(path, start, end)
+        content_range = self._content_range(file_obj)
+        if kwargs.get('stream', False) is True:
+            return file_obj['Body'], content_range
+        return file_obj['Body'].read(), content_range
+
+    @staticmethod
+    def _content_range(file_obj: dict) -> tuple[int, int, int]:
+        """Return the (first, last, size) tuple from the ContentRange of a GetObject response."""
+        if not file_obj.get('ContentRange'):  # pragma: no cover
+            # the whole object was returned
+            size = file_obj['ContentLength']
+            return 0, size - 1, size
+
+        # e.g., "bytes 0-1023/146515"
+        byte_range, size = file_obj['ContentRange'].split(' ')[-1].split('/')
+        first, last = byte_range.split('-')
+        return int(first), int(last), int(size)
+
+    def _get_object(
+        self, path: str, start: int | None = None, end: int | None = None, **params
+    ) -> dict:
+        """Return the GetObject response for the file, optionally limited to a byte range.
+
+        Args:
+            path: The path of the file to return.
+            start: The first byte position, or a negative value for a suffix range (last N bytes).
+            end: The last byte position (inclusive), or None/-1 to read to the end of the file.
+            **params: Additional GetObject parameters (e.g., IfNoneMatch).
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the file download.
+            falcon.HTTPRangeNotSatisfiable: Raised when the range is outside of the file.
+            falcon.HTTPStatus: Raised with a 304 status when a conditional request matches.
+        """
+        params.update({'Bucket': self.bucket, 'Key': path})
+        if start is not None:
+            params['Range'] = self._range_header(start, end)
+
+        try:
+            return self.client.get_object(**params)
+        except ClientError as e:
+            raise self._get_object_error(e)  # pylint: disable=raise-missing-from
+        except Exception:
+            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
+                # code=code(),
+                description='File download failed.',
+                title='Internal Server Error',
+            )
+
+    @staticmethod
+    def _get_object_error(error: ClientError) -> falcon.HTTPError | falcon.HTTPStatus:
+        """Return the falcon error (or 304 status) to raise for a failed GetObject request."""
+        if error.response['Error']['Code'] == '304':
+            # the conditional request matched, return the validators with the 304
+            http_headers = error.response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+            headers = {}
+            if http_headers.get('etag'):
+                headers['ETag'] = http_headers['etag']
+            if http_headers.get('last-modified'):
+                headers['Last-Modified'] = http_headers['last-modified']
+            return falcon.HTTPStatus(falcon.HTTP_304, headers=headers)
+        if error.response['Error']['Code'] == 'InvalidRange':
+            return falcon.HTTPRangeNotSatisfiable(
+                int(error.response['Error'].get('ActualObjectSize', 0))
+            )
+        return falcon.HTTPInternalServerError(
+            # code=code(),
+            description='File download failed.',
+            title='Internal Server Error',
+        )
+
+    @staticmethod
+    def _range_header(start: int, end: int | None = None) -> str:
+        """Return the value of the Range header of a byte range (e.g., "bytes=0-1023")."""
+        if start < 0:
+            return f'bytes={start}'
+        if end is None or end < 0:
+            return f'bytes={start}-'
+        return f'bytes={start}-{end}'
+
+    @instrument
+    def is_file(self, path: str) -> bool:
+        """Return True if file exists, else False.
+
+        Args:
+            path: The path of the file to return.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the file check.
+        """
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=path)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] == '404':
+                return False
+
+            # pylint: disable=raise-missing-from
+            raise falcon.HTTPInternalServerError(  # pragma: no cover
+                # code=code(),
+                description='File download failed.',
+                title='Internal Server Error',
+            )
+        except TypeError:  # pragma: no cover
+            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
+                # code=code(),
+                description='File download failed.',
+                title='Internal Server Error',
+            )
+
+    def list_files(
+        self, prefix: str = '', recursive: bool = True, page_size: int = 1000
+    ) -> Iterator[FileInfo]:
+        """Yield the metadata of the files in the bucket using ListObjectsV2 requests.
+
+        Pages of up to page_size keys are requested as the iterator is consumed, so only a
+        single page is held in memory at a time. ListObjectsV2 does not return the content type,
+        so content_type is always None.
+
+        Args:
+            prefix: Only files with keys starting with the prefix are listed.
+            recursive: If False, keys containing a "/" after the prefix are not listed.
+            page_size: The number of keys requested per ListObjectsV2 request (max 1000).
+
+        Return:
+            Iterator[FileInfo]: The metadata of each file.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the listing.
+        """
+        params = {
+            'Bucket': self.bucket,
+            'PaginationConfig': {'PageSize': page_size},
+            'Prefix': prefix,
+        }
+        if not recursive:
+            params['Delimiter'] = '/'
+
+        try:
+            for page in self.client.get_paginator('list_objects_v2').paginate(**params):
+                for file_obj in page.get('Contents', []):
+                    yield FileInfo(
+                        key=file_obj['Key'],
+                        size=file_obj.get('Size'),
+                        mtime=file_obj.get('LastModified'),
+                        etag=file_obj.get('ETag', '').strip('"'),
+                    )
+        except ClientError:
+            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
+                # code=code(),
+                description='File listing failed.',
+                title='Internal Server Error',
+            )
+
+    @instrument
+    def send_file(self, resp: falcon.Response, path: str, **kwargs):
+        """Stream file from storage as the body of the falcon response.
+
+        When the falcon req object is provided, the conditional request headers (If-None-Match
+        and If-Modified-Since) are passed through to S3, so an unchanged file is answered with
+        304 Not Modified in a single round trip, and a request with a Range header is answered
+        with a 206 Partial Content response containing only the requested bytes.
+
+        Args:
+            resp: The falcon resp object.
+            path: The path of the file to send.
+            content_type (str | kwargs): The response content-type, defaults to the content-type
+                of the S3 object.
+            req (falcon.Request | kwargs): The falcon req object, used for conditional and Range
+                requests.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the file download.
+            falcon.HTTPRangeNotSatisfiable: Raised when the requested range is outside of the file.
+            falcon.HTTPStatus: Raised with a 304 status when the file has not been modified.
+        """
+        req: falcon.Request | None = kwargs.get('req')
+        params = {}
+        if req is not None and req.method in ('GET', 'HEAD'):
+            # If-None-Match takes precedence over If-Modified-Since (RFC 7232)
+            if req.get_header('If-None-Match'):
+                params['IfNoneMatch'] = req.get_header('If-None-Match')
+            elif req.if_modified_since is not None:
+                params['IfModifiedSince'] = req.if_modified_since
+
+        resp.accept_ranges = 'bytes'
+        byte_range = self._range(req)
+        if byte_range is not None:
+            file_obj = self._get_object(path, *byte_range, **params)
+            resp.status = falcon.HTTP_206
+            resp.content_range = self._content_range(file_obj)
+        else:
+            file_obj = self._get_object(path, **params)
+
+        resp.content_type = kwargs.get('content_type') or file_obj.get('ContentType')
+        resp.etag = file_obj.get('ETag', '').strip('"') or None
+        resp.last_modified = file_obj.get('LastModified')
+        resp.set_stream(file_obj['Body'], file_obj['ContentLength'])
+
+    @instrument
+    def stat_file(self, path: str) -> FileInfo:
+        """Return the metadata of a file in storage using a HEAD request.
+
+        Args:
+            path: The path of the file.
+
+        Return:
+            FileInfo: The file key, size, mtime, etag, and content_type.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the file check.
+        """
+        try:
+            file_obj: dict = self.client.head_object(Bucket=self.bucket, Key=path)
+        except Exception:
+            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
+                # code=code(),
+                description='File download failed.',
+                title='Internal Server Error',
+            )
+
+        return FileInfo(
+            key=path,
+            size=file_obj.get('ContentLength'),
+            mtime=file_obj.get('LastModified'),
+            etag=file_obj.get('ETag', '').strip('"'),
+            content_type=file_obj.get('ContentType'),
+        )
+
+    def _transfer_config(self, **kwargs) -> object:
+        """Return a TransferConfig from the provider transfer options and any overrides."""
+        # third-party
+        from boto3.s3.transfer import TransferConfig  # pylint: disable=import-outside-toplevel
+
+        options = {**self.transfer_options, **kwargs}
+        return TransferConfig(**{k: v for k, v in options.items() if v is not None})
+
+    @property
+    def transfer_manager(self) -> object:
+        """Return the transfer manager shared by all uploads, creating it on first use.
+
+        The transfer manager (and its thread pool) is recreated in a forked child process.
+        """
+        if self._transfer_manager_pid != os.getpid():
+            # third-party
+            # pylint: disable=import-outside-toplevel
+            from boto3.s3.transfer import create_transfer_manager
+
+            with self._transfer_manager_lock:
+                if self._transfer_manager_pid != os.getpid():
+                    self._transfer_manager = create_transfer_manager(
+                        self.client, self._transfer_config()
+                    )
+                    self._transfer_manager_pid = os.getpid()
+        return self._transfer_manager
+
+    @instrument
+    def save_file(self, contents: bytes | str | BinaryIO, path: str, **kwargs) -> str:
+        """Write file to storage.
+
+        Uploads use a transfer manager that is shared across calls and configured with the
+        provider transfer options. Passing any of the transfer options to this method uses a
+        dedicated transfer manager for the upload.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            self.save_file(data, filename, multipart_chunksize=64 * 1024 * 1024)
+
+        Args:
+            contents: The contents of the file (bytes, str, or a file-like object).
+            path: The path to write the file.
+            content_type (str | kwargs): The file content-type.
+            max_concurrency (int | kwargs): Override the provider max_concurrency.
+            multipart_chunksize (int | kwargs): Override the provider multipart_chunksize.
+            multipart_threshold (int | kwargs): Override the provider multipart_threshold.
+            use_threads (bool | kwargs): Override the provider use_threads.
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during the file upload.
+        """
+        # third-party
+        # pylint: disable=import-outside-toplevel
+        from boto3.s3.transfer import create_transfer_manager
+
+        if isinstance(contents, str):
+            contents = contents.encode()
+        if isinstance(contents, bytes):
+            # the transfer manager uploads file-like objects
+            contents = io.BytesIO(contents)
+
+        extra_args = {}
+        if kwargs.get('content_type') is not None:
+            extra_args['ContentType'] = kwargs.get('content_type')
+        overrides = {k: kwargs[k] for k in self.transfer_settings if kwargs.get(k) is not None}
+
+        try:
+            if overrides:
+                with create_transfer_manager(
+                    self.client, self._transfer_config(**overrides)
+                ) as manager:
+                    manager.upload(contents, self.bucket, path, extra_args=extra_args).result()
+            else:
+                self.transfer_manager.upload(
+                    contents, self.bucket, path, extra_args=extra_args
+                ).result()
+        except (BotoCoreError, ClientError, RuntimeError, TypeError, ValueError) as err:
+            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
+                # code=code(),
+                description=f'File upload failed ({err}).',
+                title='Internal Server Error',
+            )
+        return path
+
+
+if hasattr(os, 'register_at_fork'):  # pragma: no branch
+    # pylint: disable=protected-access
+    os.register_at_fork(after_in_child=S3StorageProvider._after_fork)
@@ -0,0 +1,191 @@
+"""Single-flight (request coalescing) Storage Provider Module"""
+# standard library
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from typing import BinaryIO, TextIO
+
+# first-party
+from falcon_provider_storage.aio import AsyncStorageProvider
+from falcon_provider_storage.utils import StorageProviderABC, StorageProviderWrapper
+
+
+class _Call:
+    """An in-flight call of SingleFlight.do."""
+
+    __slots__ = ('done', 'error', 'result')
+
+    def __init__(self):
+        """Initialize class properties."""
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+        self.result: object = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key (threads) into a single call.
+
+    The first thread to call do for a key runs the function, any other thread calling do for the
+    same key while the function is running waits for it and shares the result (or exception).
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        single_flight = SingleFlight()
+        contents = single_flight.do(path, provider.get_file, path)
+    """
+
+    def __init__(self):
+        """Initialize class properties."""
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of in-flight calls."""
+        return len(self._calls)
+
+    def do(self, key: Hashable, func: Callable, *args, **kwargs) -> object:
+        """Return the result of func, sharing the result with concurrent calls for the same key.
+
+        Args:
+            key: The key identifying the call (e.g., the file path).
+            func: The function to call.
+            *args: The positional arguments passed to func.
+            **kwargs: The keyword arguments passed to func.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as ex:
+            call.error = ex
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent calls for the same key (asyncio tasks) into a single call.
+
+    The call runs in its own task, so cancelling one of the waiting tasks does not cancel the
+    call for the other waiting tasks.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        single_flight = AsyncSingleFlight()
+        contents = await single_flight.do(path, provider.get_file, path)
+    """
+
+    def __init__(self):
+        """Initialize class properties."""
+        self._futures: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        """Return the number of in-flight calls."""
+        return len(self._futures)
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable], *args, **kwargs) -> object:
+        """Return the result of func, sharing the result with concurrent calls for the same key.
+
+        Args:
+            key: The key identifying the call (e.g., the file path).
+            func: The coroutine function to call.
+            *args: The positional arguments passed to func.
+            **kwargs: The keyword arguments passed to func.
+        """
+        future = self._futures.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func(*args, **kwargs))
+            self._futures[key] = future
+
+            def _done(_):
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+
+            future.add_done_callback(_done)
+        return await asyncio.shield(future)
+
+
+class SingleFlightStorageProvider(StorageProviderWrapper):
+    """Storage provider wrapper that coalesces concurrent get_file and is_file calls.
+
+    Concurrent reads of the same file (e.g., a popular file after a deploy or a cache flush)
+    result in a single read from storage, shared by all callers. Streamed reads (stream=True)
+    can not be shared and are passed through to the wrapped provider.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        s3_provider = S3StorageProvider(bucket, aws_access_key_id, aws_secret_access_key)
+        provider = SingleFlightStorageProvider(s3_provider)
+
+    Args:
+        provider: The storage provider to wrap (e.g., S3StorageProvider).
+    """
+
+    def __init__(self, provider: StorageProviderABC):
+        """Initialize class properties."""
+        super().__init__(provider)
+        self.single_flight = SingleFlight()
+
+    def get_file(self, path: str, **kwargs) -> bytes | str | BinaryIO | TextIO:
+        """Return file from storage, sharing the read with concurrent reads of the same file."""
+        if kwargs.get('stream', False) is True:
+            return self.provider.get_file(path, **kwargs)
+
+        key = ('get_file', path, tuple(sorted(kwargs.items())))
+        return self.single_flight.do(key, self.provider.get_file, path, **kwargs)
+
+    def is_file(self, path: str) -> bool:
+        """Return True if file exists, else False, sharing concurrent lookups of the same file."""
+        return self.single_flight.do(('is_file', path), self.provider.is_file, path)
+
+
+class AsyncSingleFlightStorageProvider(AsyncStorageProvider):
+    """Async storage provider that coalesces concurrent get_file and is_file calls.
+
+    .. code-block:: python
+        :linenos:
+        :lineno-start: 1
+
+        provider = AsyncSingleFlightStorageProvider(LocalStorageProvider(bucket='storage'))
+        contents = await provider.get_file('file.txt')
+
+    Args:
+        provider: The storage provider (e.g., LocalStorageProvider, S3StorageProvider).
+        max_workers: The maximum number of threads used to run storage operations.
+    """
+
+    def __init__(self, provider: StorageProviderABC, max_workers: int = 64):
+        """Initialize class properties."""
+        super().__init__(provider, max_workers)
+        self.single_flight = AsyncSingleFlight()
+
+    async def get_file(self, path: str, **kwargs) -> bytes | str | object:
+        """Return file from storage, sharing the read with concurrent reads of the same file."""
+        if kwargs.get('stream', False) is True:
+            return await super().get_file(path, **kwargs)
+
+        key = ('get_file', path, tuple(sorted(kwargs.items())))
+        return await self.single_flight.do(key, super().get_file, path, **kwargs)
+
+    async def is_file(self, path: str) -> bool:
+        """Return True if file exists, else False, sharing concurrent lookups of the same file."""
+        return await self.single_flight.do(('is_file', path), super().is_file, path)
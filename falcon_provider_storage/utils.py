@@ -1,18 +1,100 @@
-"""Storage Provider Module"""
+"""Storage Provider Module
+
+The storage providers are defined in the local and s3 modules, and are loaded lazily when
+accessed through this module (e.g., ``from falcon_provider_storage.utils import
+S3StorageProvider``), so boto3 and botocore are only imported when the S3 provider is used.
+"""
 # standard library
+import importlib
 import os
+import threading
 from abc import ABC, abstractmethod
-from typing import BinaryIO, TextIO
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed as futures_as_completed
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, BinaryIO, TextIO
 
 # third-party
 import falcon
 
-try:
-    # third-party
-    from botocore.exceptions import ClientError
-except ImportError:  # pragma: no cover
-    # caught and handled when importing boto3 in S3 class
-    pass
+# the storage providers are loaded on first access (see __getattr__)
+if TYPE_CHECKING:  # pragma: no cover
+    # first-party
+    from falcon_provider_storage.local import LocalStorageProvider
+    from falcon_provider_storage.s3 import S3StorageProvider
+
+
+class FileInfo:
+    """Metadata of a file in storage, as returned by stat_file and list_files.
+
+    The record uses __slots__ instead of a per-instance dict, so listing millions of files
+    holds a fraction of the memory of the equivalent dicts (or boto3 response dicts).
+
+    Args:
+        key: The path of the file in the bucket.
+        size: The size of the file in bytes.
+        mtime: The last modified time of the file.
+        etag: The ETag of the file.
+        content_type: The content type of the file, if known.
+    """
+
+    __slots__ = ('content_type', 'etag', 'key', 'mtime', 'size')
+
+    def __init__(
+        self,
+        key: str,
+        size: int,
+        mtime: datetime,
+        etag: str | None = None,
+        content_type: str | None = None,
+    ):
+        """Initialize class properties."""
+        self.content_type = content_type
+        self.etag = etag
+        self.key = key
+        self.mtime = mtime
+        self.size = size
+
+    def __eq__(self, other: object) -> bool:
+        """Return True if both records have the same metadata."""
+        if not isinstance(other, FileInfo):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        """Return the representation of the record."""
+        return (
+            f'{self.__class__.__name__}(key={self.key!r}, size={self.size!r}, '
+            f'mtime={self.mtime!r}, etag={self.etag!r}, content_type={self.content_type!r})'
+        )
+
+
+class RangeReader:
+    """File-like object that reads at most length bytes from the current position of a file.
+
+    Args:
+        fh: The open file, positioned at the start of the range.
+        length: The number of bytes in the range.
+    """
+
+    def __init__(self, fh: BinaryIO, length: int):
+        """Initialize class properties."""
+        self.fh = fh
+        self.remaining = length
+
+    def close(self):
+        """Close the underlying file."""
+        self.fh.close()
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes, without reading past the end of the range."""
+        if size is None or size < 0 or size > self.remaining:
+            size = self.remaining
+
+        data = self.fh.read(size)
+        self.remaining -= len(data)
+        return data
 
 
 class StorageProviderABC(ABC):
@@ -20,262 +102,439 @@ class StorageProviderABC(ABC):
 
     Args:
         bucket (str): The base directory/bucket where files should be written.
+        max_workers (int): The maximum number of threads used for bulk operations.
     """
 
-    def __init__(self, bucket: str):  # pragma: no cover
+    # the provider methods made available on the resource by the hooks and middleware
+    resource_methods = (
+        'check_not_modified',
+        'delete_file',
+        'delete_files',
+        'get_file',
+        'get_file_range',
+        'get_files',
+        'is_file',
+        'list_files',
+        'save_file',
+        'save_files',
+        'send_file',
+        'stat_file',
+    )
+
+    # the callables receiving a StorageEvent for each instrumented storage operation
+    listeners: tuple[Callable, ...] = ()
+
+    def __init__(self, bucket: str, max_workers: int = 8):  # pragma: no cover
         """Initialize class properties."""
         self.bucket = bucket
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._executor_pid: int | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Return the bounded thread pool used for bulk operations, creating it on first use.
+
+        The thread pool is recreated in a forked child process, since the threads of the parent
+        process do not survive the fork.
+        """
+        if self._executor_pid != os.getpid():
+            with self._executor_lock:
+                if self._executor_pid != os.getpid():
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix='storage'
+                    )
+                    self._executor_pid = os.getpid()
+        return self._executor
+
+    def add_listener(self, listener: Callable):
+        """Add a listener receiving the timing and outcome of each storage operation.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            provider.add_listener(LoggingListener())
+            provider.add_listener(lambda event: print(event.operation, event.duration))
+
+        Args:
+            listener: A callable that receives a StorageEvent (e.g., LoggingListener,
+                PrometheusListener).
+        """
+        # the tuple is replaced rather than mutated so it can be iterated without a lock
+        self.listeners = (*self.listeners, listener)
+
+    def remove_listener(self, listener: Callable):
+        """Remove a listener added with add_listener."""
+        self.listeners = tuple(item for item in self.listeners if item != listener)
 
     @abstractmethod
     def delete_file(self, path: str):  # pragma: no cover
         """Delete file from storage."""
         raise NotImplementedError('This method must be implemented in child class.')
 
+    def delete_files(self, paths: list[str]) -> dict[str, bool]:
+        """Delete multiple files from storage.
+
+        Child classes should override this method when the storage supports bulk deletes. A bulk
+        delete may not report whether a file existed, in which case the result for a missing
+        file is True, unlike delete_file (e.g., S3StorageProvider).
+
+        Args:
+            paths: The paths of the files to delete.
+
+        Return:
+            dict: A mapping of each path to True if the file was deleted.
+        """
+        return {path: self.delete_file(path) for path in paths}
+
+    def storage_path(self, path: str) -> str:
+        """Return the path of a file as accepted by delete_file.
+
+        The delete_file method of LocalStorageProvider expects the path returned by save_file
+        (the path in the bucket), while the other storage methods use the path relative to the
+        bucket (as returned by list_files). Wrappers that delete files by the paths of
+        list_files (e.g., garbage collection) use this method to convert the path.
+
+        Args:
+            path: The path of the file relative to the bucket (as used by get_file).
+        """
+        return path
+
     @abstractmethod
     def get_file(self, path: str, **kwargs):  # pragma: no cover
-        """Return file from storage."""
+        """Return file from storage (or a file-like object when stream=True)."""
         raise NotImplementedError('This method must be implemented in child class.')
 
+    def get_files(
+        self, paths: Iterable[str], as_completed: bool = False, **kwargs
+    ) -> list | Iterator[tuple[str, object]]:
+        """Return multiple files from storage, fetched in parallel.
+
+        The files are fetched on the provider thread pool (bounded by max_workers), so the time
+        to fetch many files approaches the time of the slowest single fetch.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            contents = self.get_files(['a.txt', 'b.txt'])
+            for path, contents in self.get_files(['a.txt', 'b.txt'], as_completed=True):
+                ...
+
+        Args:
+            paths: The paths of the files to return.
+            as_completed: If True, return an iterator of (path, contents) tuples in the order the
+                fetches complete, instead of a list of contents in the order of paths.
+            **kwargs: Additional arguments passed to get_file (e.g., mode).
+
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during a file download.
+        """
+        return self._map(lambda path: self.get_file(path, **kwargs), paths, as_completed)
+
+    def _map(
+        self, func: Callable, items: Iterable, as_completed: bool, keys: Iterable | None = None
+    ) -> list | Iterator[tuple[object, object]]:
+        """Run func for each item on the provider thread pool.
+
+        Args:
+            func: The function to run for each item.
+            items: The items to pass to func.
+            as_completed: If True, return an iterator of (key, result) tuples as they complete.
+            keys: The keys returned with each result when as_completed, defaults to the items.
+        """
+        items = list(items)
+        futures = [self.executor.submit(func, item) for item in items]
+        if not as_completed:
+            return [future.result() for future in futures]
+
+        keys = dict(zip(futures, items if keys is None else keys))
+        return ((keys[future], future.result()) for future in futures_as_completed(futures))
+
     @abstractmethod
     def is_file(self, path: str):  # pragma: no cover
         """Return True if file exist, else False."""
         raise NotImplementedError('This method must be implemented in child class.')
 
+    @abstractmethod
+    def list_files(
+        self, prefix: str = '', recursive: bool = True, page_size: int = 1000
+    ) -> Iterator[FileInfo]:  # pragma: no cover
+        """Yield the metadata (key, size, mtime, etag, and content_type) of the files in storage.
+
+        Args:
+            prefix: Only files with keys starting with the prefix are listed.
+            recursive: If False, files in "sub-directories" of the prefix are not listed.
+            page_size: The number of files fetched from storage per request.
+        """
+        raise NotImplementedError('This method must be implemented in child class.')
+
     @abstractmethod
     def save_file(self, contents: bytes, path: str, **kwargs):  # pragma: no cover
         """Write file to storage."""
         raise NotImplementedError('This method must be implemented in child class.')
 
+    def save_files(
+        self, items: Iterable[tuple[object, str]], as_completed: bool = False, **kwargs
+    ) -> list | Iterator[tuple[str, object]]:
+        """Write multiple files to storage in parallel.
 
-class LocalStorageProvider(StorageProviderABC):
-    """Local Storage Provider Module
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
 
-    Args:
-        bucket (str): The base directory/bucket where files should be written.
-    """
+            paths = self.save_files([(b'contents a', 'a.txt'), (b'contents b', 'b.txt')])
 
-    def __init__(self, bucket: str):
-        """Initialize class properties."""
-        super().__init__(bucket)
+        Args:
+            items: The (contents, path) tuples of the files to write.
+            as_completed: If True, return an iterator of (path, result) tuples in the order the
+                writes complete, instead of a list of results in the order of items.
+            **kwargs: Additional arguments passed to save_file (e.g., content_type).
 
-        if not os.access(self.bucket, os.W_OK):  # pragma: no cover
-            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
-                # code=code(),
-                description='App does not have write access to storage bucket.',
-                title='Internal Server Error',
-            )
+        Raises:
+            falcon.HTTPInternalServerError: Raised for any exception during a file upload.
+        """
+        items = list(items)
+        return self._map(
+            lambda item: self.save_file(item[0], item[1], **kwargs),
+            items,
+            as_completed,
+            keys=[path for _, path in items],
+        )
 
-    def delete_file(self, path: str) -> bool:
-        """Delete a file.
+    @staticmethod
+    def _resolve_range(start: int, end: int | None, size: int) -> tuple[int, int]:
+        """Return the first and last byte positions of a range for a file of the provided size.
 
         Args:
-            path: The path of the file to delete.
+            start: The first byte position, or a negative value for a suffix range (last N bytes).
+            end: The last byte position (inclusive), or None/-1 to read to the end of the file.
+            size: The size of the file.
 
-        Return:
-            str: True if the file was delete.
+        Raises:
+            falcon.HTTPRangeNotSatisfiable: Raised when the range is outside of the file.
         """
-        try:
-            os.remove(path)
-            return True
-        except FileNotFoundError:
-            return False
-        except PermissionError:  # pragma: no cover
-            return False
+        if start < 0:
+            first = max(size + start, 0)
+            last = size - 1
+        else:
+            first = start
+            last = size - 1 if end is None or end < 0 else min(end, size - 1)
 
-    # pylint: disable=unspecified-encoding
-    def get_file(self, path: str, **kwargs) -> bytes | str:
-        """Return file from storage.
+        if first >= size or last < first:
+            raise falcon.HTTPRangeNotSatisfiable(size)
+        return first, last
+
+    @abstractmethod
+    def get_file_range(
+        self, path: str, start: int, end: int | None = None, **kwargs
+    ):  # pragma: no cover
+        """Return a byte range of a file from storage.
 
         Args:
             path: The path of the file to return.
-            mode (str | kwargs): The read mode for the file.
+            start: The first byte position, or a negative value for a suffix range (last N bytes).
+            end: The last byte position (inclusive), or None/-1 to read to the end of the file.
+            stream (bool | kwargs): If True, return a file-like object for the range.
 
-        Raises:
-            falcon.HTTPInternalServerError: Raised for any exception during the file download.
+        Returns:
+            tuple: The range contents and a (first, last, size) tuple for the Content-Range header.
         """
-        fully_qualified_path = os.path.join(self.bucket, path)
-        try:
-            # TODO: should this just return BinaryIO | TextIO?
-            with open(fully_qualified_path, kwargs.get('mode', 'rb')) as fh:
-                return fh.read()
-        except OSError:
-            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
-                # code=code(),
-                description=f'File ({path}) could not be accessed.',
-                title='Internal Server Error',
-            )
+        raise NotImplementedError('This method must be implemented in child class.')
 
-    def is_file(self, path: str) -> bool:
-        """Return True if file exists, else False.
+    def send_file(self, resp: falcon.Response, path: str, **kwargs):  # pragma: no cover
+        """Stream file from storage as the body of the falcon response.
+
+        Child classes should override this method when the size of the file is known up front
+        so that the Content-Length header can be set.
 
         Args:
-            path: The path of the file to return.
+            resp: The falcon resp object.
+            path: The path of the file to send.
+            content_type (str | kwargs): The response content-type.
+            **kwargs: Other options of the providers (e.g., req) are ignored.
         """
-        fully_qualified_path = os.path.join(self.bucket, path)
-        return os.path.isfile(fully_qualified_path)
+        if kwargs.get('content_type'):
+            resp.content_type = kwargs['content_type']
+        resp.stream = self.get_file(path, stream=True)
 
-    # pylint: disable=unspecified-encoding
-    def save_file(self, contents: bytes | str, path, **kwargs) -> str:
-        """Write file to storage.
+    @staticmethod
+    def _is_not_modified(req: falcon.Request, etag: str, last_modified: datetime) -> bool:
+        """Return True if the conditional request headers match the current file.
+
+        If-None-Match takes precedence over If-Modified-Since (RFC 7232), and ETags are compared
+        using the weak comparison function.
+        """
+        if req.method not in ('GET', 'HEAD'):
+            return False
+
+        if_none_match = req.if_none_match
+        if if_none_match is not None:
+            return any(tag == '*' or tag.strip('"') == etag for tag in if_none_match)
+
+        if_modified_since = req.if_modified_since
+        if if_modified_since is not None:
+            if if_modified_since.tzinfo is None:
+                # falcon < 4 returns a naive datetime in UTC
+                if_modified_since = if_modified_since.replace(tzinfo=timezone.utc)
+            return last_modified.replace(microsecond=0) <= if_modified_since
+        return False
+
+    @staticmethod
+    def _range(req: falcon.Request | None) -> tuple[int, int] | None:
+        """Return the requested byte range of a Range request, else None."""
+        if req is None or req.range is None or req.range_unit != 'bytes':
+            return None
+        return req.range
+
+    def check_not_modified(self, req: falcon.Request, resp: falcon.Response, path: str) -> bool:
+        """Answer a conditional GET request with 304 Not Modified when the file is unchanged.
+
+        The ETag and Last-Modified headers are always set on the response from the file
+        metadata, so the file contents only need to be read when this method returns False.
+
+        .. code-block:: python
+            :linenos:
+            :lineno-start: 1
+
+            def on_get(self, req, resp):
+                filename = req.get_param('filename')
+                if not self.check_not_modified(req, resp, filename):
+                    resp.data = self.get_file(filename)
 
         Args:
-            contents: The contents of the file.
-            path: The path to write the file.
-            mode (str): The write mode, defaults to 'wb'.
+            req: The falcon req object.
+            resp: The falcon resp object.
+            path: The path of the file.
 
-        Raises:
-            falcon.HTTPInternalServerError: Raised for any exception during the file check.
+        Return:
+            bool: True if the response status was set to 304 Not Modified.
         """
-        fully_qualified_path = os.path.join(self.bucket, path)
-        # ensure the directory exists
-        try:
-            os.makedirs(os.path.dirname(fully_qualified_path), exist_ok=True)
-            with open(fully_qualified_path, kwargs.get('mode', 'wb')) as fh:
-                fh.write(contents.read())
-        except OSError:  # pragma: no cover
-            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
-                # code=code(),
-                description='File could not be written.',
-                title='Internal Server Error',
-            )
-        return fully_qualified_path
-
-
-class S3StorageProvider(StorageProviderABC):
-    """S3 Storage Provider Module
+        file_info = self.stat_file(path)
+        resp.etag = file_info.etag
+        resp.last_modified = file_info.mtime
+        if self._is_not_modified(req, file_info.etag, file_info.mtime):
+            resp.status = falcon.HTTP_304
+            return True
+        return False
+
+    @abstractmethod
+    def stat_file(self, path: str) -> FileInfo:  # pragma: no cover
+        """Return the metadata (size, mtime, etag, and content_type) of a file in storage."""
+        raise NotImplementedError('This method must be implemented in child class.')
+
+
+class StorageProviderWrapper(StorageProviderABC):
+    """Base class for providers that add behavior (e.g., caching) to another storage provider.
+
+    All storage methods are delegated to the wrapped provider; child classes override only the
+    methods they change. Any other attribute (e.g., client) is looked up on the wrapped provider.
 
     Args:
-        bucket: The base directory/bucket where files should be written.
-        aws_access_key_id: The AWS access key Id.
-        aws_secret_access_key: The AWS secret key.
+        provider (StorageProviderABC): The storage provider to wrap.
     """
 
-    def __init__(self, bucket: str, aws_access_key_id: str, aws_secret_access_key: str):
+    def __init__(self, provider: StorageProviderABC):
         """Initialize class properties."""
-        super().__init__(bucket)
-
-        try:
-            # third-party
-            import boto3  # pylint: disable=import-outside-toplevel
-        except ImportError:  # pragma: no cover
-            print(
-                'S3StorageProvider requires boto3 and botocore to be installed '
-                'try "pip install falcon-provider-storage[s3]".'
-            )
-            raise
-
-        # initialize the boto3 client
-        self.client = boto3.client(
-            's3', aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key
-        )
-        self.resource = boto3.resource('s3')
-
-    def delete_file(self, path: str) -> bool:
-        """Delete a file.
-
-        .. code:: javascript
-
-            {
-                'ResponseMetadata': {
-                    'RequestId': 'B..............5',
-                    'HostId': '0..........................................=',
-                    'HTTPStatusCode': 204,
-                    'HTTPHeaders': {
-                        'x-amz-id-2': '0.............................................=',
-                        'x-amz-request-id': 'B..............5',
-                        'date': 'Mon, 26 Aug 2019 21:39:22 GMT',
-                        'x-amz-version-id': 'M..............................W',
-                        'x-amz-delete-marker': 'true',
-                        'server': 'AmazonS3'
-                    },
-                    'RetryAttempts': 0
-                },
-                'DeleteMarker': True,
-                'VersionId': 'M..............................W'
-            }
+        super().__init__(provider.bucket, getattr(provider, 'max_workers', 8))
+        self.provider = provider
 
-        Args:
-            path: The path of the file to delete.
+    def __getattr__(self, name: str) -> object:
+        """Return attributes that are not defined on the wrapper from the wrapped provider."""
+        if name == 'provider':  # pragma: no cover
+            # prevent recursion before the provider is set
+            raise AttributeError(name)
+        return getattr(self.provider, name)
 
-        Return:
-            str: True if the file was delete.
-        """
-        if self.is_file(path):
-            try:
-                self.resource.Object(self.bucket, path).delete()
-                return True
-            except ClientError:  # pragma: no cover
-                return False
-        else:
-            return False
+    def add_listener(self, listener: Callable):
+        """Add a listener to the wrapped provider."""
+        self.provider.add_listener(listener)
 
-    def get_file(self, path: str, **kwargs) -> BinaryIO | TextIO:
-        """Return file from storage.
+    def remove_listener(self, listener: Callable):
+        """Remove a listener from the wrapped provider."""
+        self.provider.remove_listener(listener)
 
-        Args:
-            path: The path of the file to return.
+    def delete_file(self, path: str, **kwargs) -> bool:
+        """Delete file from storage."""
+        return self.provider.delete_file(path, **kwargs)
 
-        Raises:
-            falcon.HTTPInternalServerError: Raised for any exception during the file download.
-        """
-        try:
-            file_obj: object = self.client.get_object(Bucket=self.bucket, Key=path)
-        except Exception:
-            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
-                # code=code(),
-                description='File download failed.',
-                title='Internal Server Error',
-            )
-        return file_obj['Body'].read()
+    def delete_files(self, paths: list[str]) -> dict[str, bool]:
+        """Delete multiple files from storage."""
+        return self.provider.delete_files(paths)
+
+    def get_file(self, path: str, **kwargs) -> bytes | str | BinaryIO | TextIO:
+        """Return file from storage."""
+        return self.provider.get_file(path, **kwargs)
+
+    def get_file_range(
+        self, path: str, start: int, end: int | None = None, **kwargs
+    ) -> tuple[bytes | BinaryIO, tuple[int, int, int]]:
+        """Return a byte range of a file from storage."""
+        return self.provider.get_file_range(path, start, end, **kwargs)
 
     def is_file(self, path: str) -> bool:
-        """Return True if file exists, else False.
+        """Return True if file exists, else False."""
+        return self.provider.is_file(path)
 
-        Args:
-            path: The path of the file to return.
+    def list_files(
+        self, prefix: str = '', recursive: bool = True, page_size: int = 1000
+    ) -> Iterator[FileInfo]:
+        """Yield the metadata of the files in storage."""
+        return self.provider.list_files(prefix, recursive, page_size)
 
-        Raises:
-            falcon.HTTPInternalServerError: Raised for any exception during the file check.
-        """
-        try:
-            self.resource.Object(self.bucket, path).load()
-            return True
-        except ClientError as e:
-            if e.response['Error']['Code'] == '404':
-                return False
-
-            # pylint: disable=raise-missing-from
-            raise falcon.HTTPInternalServerError(  # pragma: no cover
-                # code=code(),
-                description='File download failed.',
-                title='Internal Server Error',
-            )
-        except TypeError:  # pragma: no cover
-            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
-                # code=code(),
-                description='File download failed.',
-                title='Internal Server Error',
-            )
-
-    def save_file(self, contents: bytes, path: str, **kwargs) -> str:
-        """Write file to storage.
+    def save_file(self, contents: bytes | str | BinaryIO, path: str, **kwargs) -> str:
+        """Write file to storage."""
+        return self.provider.save_file(contents, path, **kwargs)
 
-        Args:
-            contents: The contents of the file.
-            path: The path to write the file.
-            content_type (str | kwargs): The file content-type.
+    def send_file(self, resp: falcon.Response, path: str, **kwargs):
+        """Stream file from storage as the body of the falcon response."""
+        return self.provider.send_file(resp, path, **kwargs)
 
-        Raises:
-            falcon.HTTPInternalServerError: Raised for any exception during the file check.
+    def stat_file(self, path: str) -> FileInfo:
+        """Return the metadata of a file in storage."""
+        return self.provider.stat_file(path)
+
+    def storage_path(self, path: str) -> str:
+        """Return the path of a file as accepted by delete_file of the wrapped provider."""
+        return self.provider.storage_path(path)
+
+    def _storage_key(self, path: str) -> str:
+        """Return the path relative to the bucket of a path accepted by delete_file.
+
+        The inverse of storage_path, used to find the cached entries (keyed on the paths of
+        get_file) of the files deleted with the paths of delete_file.
         """
-        try:
-            self.client.upload_fileobj(
-                contents, self.bucket, path, ExtraArgs={'ContentType': kwargs.get('content_type')}
-            )
-        except (ClientError, TypeError) as err:
-            raise falcon.HTTPInternalServerError(  # pylint: disable=raise-missing-from
-                # code=code(),
-                description=f'File upload failed ({err}).',
-                title='Internal Server Error',
-            )
+        prefix = self.provider.storage_path('')
+        if prefix and path.startswith(prefix):
+            return path[len(prefix) :]
         return path
+
+
+# the storage providers that are loaded lazily, keyed on the name of the provider
+_lazy_providers = {
+    'LocalStorageProvider': 'falcon_provider_storage.local',
+    'S3StorageProvider': 'falcon_provider_storage.s3',
+}
+
+
+def _lazy_provider(module_name: str, name: str) -> object:
+    """Return a lazily loaded storage provider class, for the __getattr__ of a module.
+
+    Args:
+        module_name: The name of the module the attribute is looked up on.
+        name: The name of the attribute.
+
+    Raises:
+        AttributeError: Raised if the name is not a lazily loaded storage provider.
+    """
+    module = _lazy_providers.get(name)
+    if module is None:
+        raise AttributeError(f'module {module_name!r} has no attribute {name!r}')
+    return getattr(importlib.import_module(module), name)
+
+
+def __getattr__(name: str) -> object:
+    """Return the lazily loaded storage provider classes."""
+    return _lazy_provider(__name__, name)
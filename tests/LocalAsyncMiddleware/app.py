@@ -0,0 +1,74 @@
+"""Falcon ASGI app used for testing."""
+# standard library
+import os
+
+# third-party
+import falcon
+import falcon.asgi
+
+# first-party
+from falcon_provider_storage.aio import AsyncLocalStorageProvider
+from falcon_provider_storage.hook import async_local_storage
+from falcon_provider_storage.middleware import StorageMiddleware
+
+
+class AsyncLocalStorageResource1:
+    """Async Local Storage middleware testing resource."""
+
+    # pylint: disable=no-member
+    async def on_delete(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """Support DELETE method."""
+        filename: str = req.get_param('filename')
+        resp.status = falcon.HTTP_404
+        if await self.delete_file(filename):
+            resp.status = falcon.HTTP_204
+
+    # pylint: disable=no-member
+    async def on_get(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """Support GET method."""
+        filename: str = req.get_param('filename')
+        if await self.is_file(filename):  # code coverage testing of is_file
+            pass
+        if req.get_param_as_bool('send'):
+            await self.send_file(resp, filename, req=req)
+            return
+        if req.get_param_as_bool('stream'):
+            resp.stream = await self.get_file(filename, stream=True)
+            return
+        resp.text = await self.get_file(filename)
+
+    async def on_post(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """Support POST method."""
+        try:
+            form = await req.get_media()
+            # expect a single
+            async for part in form:
+                if part.name == 'file':
+                    resp.text = await self.save_file(part.stream, part.filename)
+                    break
+        except TypeError:
+            raise falcon.HTTPBadRequest(  # pylint: disable=raise-missing-from
+                # code=self.code(),
+                description='File upload must be form-data',
+                title='Bad Request',
+            )
+
+
+class AsyncLocalStorageResource2:
+    """Async Local Storage hook testing resource."""
+
+    # pylint: disable=no-member
+    @falcon.before(async_local_storage, 'storage')
+    async def on_get(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """Support GET method."""
+        resp.text = await self.get_file(req.get_param('filename'))
+
+
+# create
+_storage_directory = 'storage'
+os.makedirs(_storage_directory, exist_ok=True)
+
+local_provider = AsyncLocalStorageProvider(bucket=_storage_directory)
+app_async_local_storage_1 = falcon.asgi.App(middleware=[StorageMiddleware(provider=local_provider)])
+app_async_local_storage_1.add_route('/middleware', AsyncLocalStorageResource1())
+app_async_local_storage_1.add_route('/hook', AsyncLocalStorageResource2())
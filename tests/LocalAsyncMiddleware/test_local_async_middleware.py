@@ -0,0 +1,215 @@
+"""Test async middleware feature of falcon_provider_storage module."""
+# standard library
+import asyncio
+import binascii
+import os
+from uuid import uuid4
+
+# third-party
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_storage.aio import AsyncLocalStorageProvider
+from falcon_provider_storage.singleflight import AsyncSingleFlightStorageProvider
+from falcon_provider_storage.utils import LocalStorageProvider
+
+
+def create_multipart_formdata(fields) -> tuple[str, dict]:
+    """Create form data.
+
+    Args:
+        fields: The list of fields to create.
+
+    Returns:
+        tuple: The request body and headers
+    """
+    random: str = binascii.hexlify(os.urandom(16)).decode('ascii')
+    boundary = f'----WebKitFormBoundary{random}'
+
+    body = []
+    for field, value in fields.items():
+        body.append(f'--{boundary}\r\n')
+        if isinstance(value, dict):
+            filename: str = value.get('filename')
+            value: str = value.get('content')
+
+            body.append(
+                f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n\r\n'
+            )
+        else:
+            body.append(f'Content-Disposition: form-data; name="{field}"\r\n\r\n')
+
+        # add value
+        body.append(f'{value}\r\n')
+    body.append(f'--{boundary}--\r\n')
+
+    body = ''.join(body)
+    headers = {
+        'content-type': f'multipart/form-data; boundary={boundary}',
+    }
+    return body, headers
+
+
+def test_async_local_delete(client_async_local_storage_1, storage_directory) -> None:
+    """Testing DELETE resource
+
+    Args:
+        client_async_local_storage_1 (fixture): The test client.
+        storage_directory (fixture): The storage directory.
+    """
+    key = f'{uuid4()}'
+
+    # create file in storage to read
+    filename: str = os.path.join(storage_directory, f'{key}.txt')
+    with open(filename, 'w', encoding='utf-8') as fh:
+        fh.write('delete me')
+
+    params = {'filename': filename}
+    response: Result = client_async_local_storage_1.simulate_delete('/middleware', params=params)
+    assert response.status_code == 204
+    assert not os.path.isfile(filename), 'File was not deleted'
+
+    response: Result = client_async_local_storage_1.simulate_delete('/middleware', params=params)
+    assert response.status_code == 404
+
+
+def test_async_local_file_exists(client_async_local_storage_1, storage_directory) -> None:
+    """Testing GET resource
+
+    Args:
+        client_async_local_storage_1 (fixture): The test client.
+        storage_directory (fixture): The storage directory.
+    """
+    key = f'{uuid4()}'
+
+    # create file in storage to read
+    filename: str = os.path.join(storage_directory, f'{key}.txt')
+    with open(filename, 'w', encoding='utf-8') as fh:
+        fh.write(key)
+
+    for route, params in [
+        ('/middleware', {'filename': f'{key}.txt'}),
+        ('/middleware', {'filename': f'{key}.txt', 'stream': 'true'}),
+        ('/middleware', {'filename': f'{key}.txt', 'send': 'true'}),
+        ('/hook', {'filename': f'{key}.txt'}),
+    ]:
+        response: Result = client_async_local_storage_1.simulate_get(route, params=params)
+        assert response.status_code == 200
+        assert response.text == key
+
+
+def test_async_local_file_send_range(client_async_local_storage_1, storage_directory) -> None:
+    """Testing GET resource with a Range header
+
+    Args:
+        client_async_local_storage_1 (fixture): The test client.
+        storage_directory (fixture): The storage directory.
+    """
+    key = f'{uuid4()}'
+
+    # create file in storage to read
+    filename: str = os.path.join(storage_directory, f'{key}.txt')
+    with open(filename, 'w', encoding='utf-8') as fh:
+        fh.write(key)
+
+    params = {'filename': f'{key}.txt', 'send': 'true'}
+    response: Result = client_async_local_storage_1.simulate_get(
+        '/middleware', params=params, headers={'Range': 'bytes=0-7'}
+    )
+    assert response.status_code == 206
+    assert response.text == key[:8]
+
+
+def test_async_local_file_upload(client_async_local_storage_1, storage_directory) -> None:
+    """Testing POST resource
+
+    Args:
+        client_async_local_storage_1 (fixture): The test client.
+        storage_directory (fixture): The storage directory.
+    """
+    file_key = f'{uuid4()}'
+
+    # fields
+    fields = {'file': {'filename': f'{file_key}.txt', 'content': file_key}}
+    fields.update({'key': file_key})
+
+    # multi-part data
+    data, headers = create_multipart_formdata(fields)
+
+    response: Result = client_async_local_storage_1.simulate_post(
+        '/middleware', body=data, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.text == f'{storage_directory}{os.path.sep}{file_key}.txt'
+    with open(response.text, encoding='utf-8') as fh:
+        assert fh.read() == file_key
+
+
+def test_async_local_get_save_files(storage_directory) -> None:
+    """Testing concurrent batch get and save
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+
+    async def run() -> None:
+        """Save and then get the files."""
+        provider = AsyncLocalStorageProvider(bucket=storage_directory, max_workers=4)
+        keys = [f'{uuid4()}' for _ in range(10)]
+        await provider.save_files([(key.encode(), f'{key}.txt') for key in keys])
+        contents = await provider.get_files([f'{key}.txt' for key in keys])
+        assert contents == [key.encode() for key in keys]
+
+    asyncio.run(run())
+
+
+def test_async_local_list_files(storage_directory) -> None:
+    """Testing listing files
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+
+    async def run() -> None:
+        """Save and then list the files."""
+        prefix = f'{uuid4()}'
+        provider = AsyncLocalStorageProvider(bucket=storage_directory)
+        keys = [f'{prefix}/{uuid4()}.txt' for _ in range(5)]
+        await provider.save_files([(b'contents', key) for key in keys])
+        files = [f async for f in provider.list_files(f'{prefix}/', page_size=2)]
+        assert sorted(f.key for f in files) == sorted(keys)
+
+    asyncio.run(run())
+
+
+def test_async_local_single_flight(storage_directory) -> None:
+    """Testing coalescing of concurrent reads
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+
+    class CountingStorageProvider(LocalStorageProvider):
+        """Local storage provider that counts reads."""
+
+        calls = 0
+
+        def get_file(self, path: str, **kwargs) -> bytes:
+            """Return file from storage."""
+            self.calls += 1
+            return super().get_file(path, **kwargs)
+
+    async def run() -> None:
+        """Read the same file concurrently."""
+        key = f'{uuid4()}'
+        origin = CountingStorageProvider(bucket=storage_directory)
+        origin.save_file(key.encode(), f'{key}.txt')
+        provider = AsyncSingleFlightStorageProvider(origin)
+
+        contents = await asyncio.gather(*(provider.get_file(f'{key}.txt') for _ in range(5)))
+        assert contents == [key.encode()] * 5
+        assert origin.calls == 1
+        assert await provider.is_file(f'{key}.txt') is True
+        assert len(provider.single_flight) == 0
+
+    asyncio.run(run())
@@ -28,6 +28,9 @@ class LocalStorageResource1:
         filename: str = req.get_param('filename')
         if self.is_file(filename):  # code coverage testing of is_file
             pass
+        if req.get_param_as_bool('send'):
+            self.send_file(resp, filename, req=req)
+            return
         resp.text = self.get_file(filename)
 
     @falcon.before(local_storage, STORAGE_DIRECTORY)
@@ -51,5 +54,15 @@ class LocalStorageResource1:
         resp.text = self.save_file(data, filename)
 
 
+class LocalStorageContextResource:
+    """Local Storage hook testing resource using the context binding."""
+
+    @falcon.before(local_storage, STORAGE_DIRECTORY, binding='context')
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        resp.text = req.context.storage.get_file(req.get_param('filename'))
+
+
 app_hook_local_storage_1 = falcon.App()
 app_hook_local_storage_1.add_route('/middleware', LocalStorageResource1())
+app_hook_local_storage_1.add_route('/context', LocalStorageContextResource())
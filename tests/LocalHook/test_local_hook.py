@@ -8,6 +8,10 @@ from uuid import uuid4
 # third-party
 from falcon.testing import Result
 
+# first-party
+from falcon_provider_storage.registry import ProviderRegistry, provider_registry
+from falcon_provider_storage.utils import LocalStorageProvider
+
 
 def read_file() -> object:
     """Return file object for file upload."""
@@ -109,6 +113,100 @@ def test_local_file_exists(client_hook_local_storage_1, storage_directory) -> No
     assert response.text == key
 
 
+def test_local_file_send(client_hook_local_storage_1, storage_directory) -> None:
+    """Testing GET resource using wsgi.file_wrapper
+
+    Args:
+        client_hook_local_storage_1 (fixture): The test client.
+        storage_directory (fixture): The storage directory.
+    """
+    key = f'{uuid4()}'
+    wrapped = []
+
+    def file_wrapper(fh: object, block_size: int) -> object:
+        """Record the file passed to the WSGI server file wrapper."""
+        wrapped.append(fh)
+        return iter(lambda: fh.read(block_size), b'')
+
+    # create file in storage to read
+    filename = os.path.join(storage_directory, f'{key}.txt')
+    with open(filename, 'w', encoding='utf-8') as fh:
+        fh.write(key)
+
+    params = {'filename': f'{key}.txt', 'send': 'true'}
+    response: Result = client_hook_local_storage_1.simulate_get(
+        '/middleware', params=params, file_wrapper=file_wrapper
+    )
+    assert response.status_code == 200
+    assert response.text == key
+    assert response.headers.get('content-length') == str(len(key))
+    assert response.headers.get('content-type') == 'text/plain'
+    assert len(wrapped) == 1 and hasattr(wrapped[0], 'fileno')
+
+
+def test_local_file_send_range(client_hook_local_storage_1, storage_directory) -> None:
+    """Testing GET resource with a Range header
+
+    Args:
+        client_hook_local_storage_1 (fixture): The test client.
+        storage_directory (fixture): The storage directory.
+    """
+    key = f'{uuid4()}'
+
+    # create file in storage to read
+    filename = os.path.join(storage_directory, f'{key}.txt')
+    with open(filename, 'w', encoding='utf-8') as fh:
+        fh.write(key)
+
+    params = {'filename': f'{key}.txt', 'send': 'true'}
+    response: Result = client_hook_local_storage_1.simulate_get(
+        '/middleware', params=params, headers={'Range': 'bytes=2-9'}
+    )
+    assert response.status_code == 206
+    assert response.text == key[2:10]
+    assert response.headers.get('accept-ranges') == 'bytes'
+    assert response.headers.get('content-range') == f'bytes 2-9/{len(key)}'
+
+    # suffix range
+    response: Result = client_hook_local_storage_1.simulate_get(
+        '/middleware', params=params, headers={'Range': 'bytes=-4'}
+    )
+    assert response.status_code == 206
+    assert response.text == key[-4:]
+
+    # range outside of the file
+    response: Result = client_hook_local_storage_1.simulate_get(
+        '/middleware', params=params, headers={'Range': 'bytes=1000-'}
+    )
+    assert response.status_code == 416
+    assert response.headers.get('content-range') == f'bytes */{len(key)}'
+
+
+def test_local_file_send_not_modified(client_hook_local_storage_1, storage_directory) -> None:
+    """Testing GET resource with an If-None-Match header
+
+    Args:
+        client_hook_local_storage_1 (fixture): The test client.
+        storage_directory (fixture): The storage directory.
+    """
+    key = f'{uuid4()}'
+
+    # create file in storage to read
+    filename = os.path.join(storage_directory, f'{key}.txt')
+    with open(filename, 'w', encoding='utf-8') as fh:
+        fh.write(key)
+
+    params = {'filename': f'{key}.txt', 'send': 'true'}
+    response: Result = client_hook_local_storage_1.simulate_get('/middleware', params=params)
+    assert response.status_code == 200
+
+    response: Result = client_hook_local_storage_1.simulate_get(
+        '/middleware', params=params, headers={'If-None-Match': response.headers.get('etag')}
+    )
+    assert response.status_code == 304
+    assert response.text == ''
+
+
 def test_local_does_not_exists(client_hook_local_storage_1) -> None:
     """Testing GET resource
 
@@ -145,6 +243,52 @@ def test_local_file_upload(client_hook_local_storage_1, storage_directory) -> No
         assert False, 'Uploaded file does not exist in storage'
 
 
+def test_local_context_binding(client_hook_local_storage_1, storage_directory) -> None:
+    """Testing the context binding of the hook
+
+    Args:
+        client_hook_local_storage_1 (fixture): The test client.
+        storage_directory (fixture): The storage directory.
+    """
+    key = f'{uuid4()}'
+    with open(os.path.join(storage_directory, f'{key}.txt'), 'w', encoding='utf-8') as fh:
+        fh.write(key)
+
+    params = {'filename': f'{key}.txt'}
+    response: Result = client_hook_local_storage_1.simulate_get('/context', params=params)
+    assert response.status_code == 200
+    assert response.text == key
+
+
+def test_local_provider_registry(client_hook_local_storage_1, storage_directory) -> None:
+    """Testing the provider is reused across requests
+
+    Args:
+        client_hook_local_storage_1 (fixture): The test client.
+        storage_directory (fixture): The storage directory.
+    """
+    params = {'filename': 'non-existent-file.txt'}
+    client_hook_local_storage_1.simulate_delete('/middleware', params=params)
+    provider = provider_registry.get(LocalStorageProvider, storage_directory)
+    client_hook_local_storage_1.simulate_delete('/middleware', params=params)
+    assert provider_registry.get(LocalStorageProvider, storage_directory) is provider
+
+
+def test_local_provider_registry_after_fork(storage_directory) -> None:
+    """Testing the provider registry is reset in a forked child
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    registry = ProviderRegistry()
+    provider = registry.get(LocalStorageProvider, storage_directory)
+    assert len(registry) == 1
+
+    registry._after_fork()  # pylint: disable=protected-access
+    assert len(registry) == 0
+    assert registry.get(LocalStorageProvider, storage_directory) is not provider
+
+
 # directories are now automatically created
 # def test_local_file_upload_fail(client_hook_local_storage_1) -> None:
 #     """Testing POST resource
@@ -6,7 +6,7 @@ import os
 import falcon
 
 # first-party
-from falcon_provider_storage.middleware import StorageMiddleware
+from falcon_provider_storage.middleware import StorageMiddleware, bind_storage
 from falcon_provider_storage.utils import LocalStorageProvider
 
 
@@ -27,6 +27,11 @@ class LocalStorageResource1:
         filename = req.get_param('filename')
         if self.is_file(filename):  # code coverage testing of is_file
             pass
+        if req.get_param_as_bool('conditional') and self.check_not_modified(req, resp, filename):
+            return
+        if req.get_param_as_bool('stream'):
+            resp.stream = self.get_file(filename, stream=True)
+            return
         resp.text = self.get_file(filename)
 
     def on_post(self, req: falcon.Request, resp: falcon.Response) -> None:
@@ -49,6 +54,14 @@ class LocalStorageResource1:
         resp.text = self.save_file(data, filename)
 
 
+class LocalStorageContextResource:
+    """Local Storage middleware testing resource using the context binding."""
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        resp.text = req.context.storage.get_file(req.get_param('filename'))
+
+
 # create
 _storage_directory = 'storage'
 os.makedirs(_storage_directory, exist_ok=True)
@@ -56,3 +69,10 @@ os.makedirs(_storage_directory, exist_ok=True)
 local_provider = LocalStorageProvider(bucket=_storage_directory)
 app_local_storage_1 = falcon.App(middleware=[StorageMiddleware(provider=local_provider)])
 app_local_storage_1.add_route('/middleware', LocalStorageResource1())
+
+# the provider is available on req.context, or bound to the resource at route registration
+app_local_storage_2 = falcon.App(
+    middleware=[StorageMiddleware(provider=local_provider, binding='context')]
+)
+app_local_storage_2.add_route('/context', LocalStorageContextResource())
+app_local_storage_2.add_route('/bound', bind_storage(LocalStorageResource1(), local_provider))
@@ -0,0 +1,161 @@
+"""Test the deduplicating provider of falcon_provider_storage module."""
+# standard library
+import hashlib
+import io
+import os
+import threading
+import time
+from uuid import uuid4
+
+# third-party
+import falcon
+from falcon import testing
+
+# first-party
+from falcon_provider_storage.dedupe import DeduplicatingStorageProvider
+from falcon_provider_storage.utils import LocalStorageProvider
+
+
+def test_local_dedupe_provider(storage_directory) -> None:
+    """Testing the content-addressed deduplicating provider
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    prefix = f'{uuid4()}'
+    local_provider = LocalStorageProvider(bucket=storage_directory)
+    provider = DeduplicatingStorageProvider(
+        local_provider, blob_prefix=f'{prefix}/blobs/', ref_prefix=f'{prefix}/refs/'
+    )
+    contents = b'deduplicated contents'
+    digest = hashlib.sha256(contents).hexdigest()
+
+    # identical contents are stored once
+    provider.save_file(io.BytesIO(contents), 'a.txt')
+    provider.save_file(contents, 'b.txt')
+    blobs = list(local_provider.list_files(f'{prefix}/blobs/'))
+    assert [file_info.key for file_info in blobs] == [f'{prefix}/blobs/{digest[:2]}/{digest}']
+    assert provider.get_file('b.txt') == contents
+    assert provider.get_file_range('a.txt', 0, 3) == (b'dedu', (0, 3, len(contents)))
+    assert provider.stat_file('a.txt').etag == digest
+    assert provider.stat_file('a.txt').content_type == 'text/plain'
+    assert sorted(file_info.key for file_info in provider.list_files()) == ['a.txt', 'b.txt']
+
+    # a known digest skips reading the contents
+    class UnreadableFile(io.BytesIO):
+        """File that must not be read."""
+
+        def read(self, size: int = -1) -> bytes:
+            raise AssertionError('contents read')
+
+    provider.save_file(UnreadableFile(), 'c.txt', digest=digest.upper())
+    assert provider.get_file('c.txt') == contents
+
+    # invalid or mismatched digests are rejected
+    for bad_digest in ['xyz', hashlib.sha256(b'other').hexdigest()]:
+        try:
+            provider.save_file(b'other contents', 'd.txt', digest=bad_digest)
+            assert False, 'invalid digest accepted'
+        except falcon.HTTPBadRequest:
+            pass
+    assert provider.is_file('d.txt') is False
+
+    # delete_file of the local provider expects the path in the bucket, unlike the provider
+    assert local_provider.storage_path('a.txt') == os.path.join(storage_directory, 'a.txt')
+    assert provider.storage_path('a.txt') == 'a.txt'
+
+    # blobs are deleted once they are no longer referenced
+    assert provider.delete_files(['a.txt', 'b.txt']) == {'a.txt': True, 'b.txt': True}
+    assert provider.collect_garbage(min_age=0) == []
+    assert provider.delete_file('c.txt') is True
+    assert provider.collect_garbage(min_age=3600) == []
+    assert provider.collect_garbage(min_age=0) == [blobs[0].key]
+    assert not list(local_provider.list_files(f'{prefix}/blobs/'))
+
+    # a reused blob deleted by a concurrent collection before the ref is written is uploaded
+    provider.save_file(contents, 'e.txt')
+    provider.delete_file('e.txt')
+    save_ref = provider._save_ref  # pylint: disable=protected-access
+
+    def collect_then_save_ref(path: str, digest_: str):
+        provider.collect_garbage(min_age=0)
+        save_ref(path, digest_)
+
+    provider._save_ref = collect_then_save_ref  # pylint: disable=protected-access
+    provider.save_file(contents, 'f.txt')
+    assert provider.get_file('f.txt') == contents
+
+
+def test_local_dedupe_provider_send_file(storage_directory) -> None:
+    """Testing the ETag and conditional requests of send_file
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    prefix = f'{uuid4()}'
+    provider = DeduplicatingStorageProvider(
+        LocalStorageProvider(bucket=storage_directory),
+        blob_prefix=f'{prefix}/blobs/',
+        ref_prefix=f'{prefix}/refs/',
+    )
+    contents = b'sent contents'
+    digest = hashlib.sha256(contents).hexdigest()
+    provider.save_file(contents, 'a.txt')
+
+    resp = falcon.Response()
+    provider.send_file(resp, 'a.txt')
+    resp.stream.close()
+    assert resp.content_type == 'text/plain'
+    assert resp.etag == f'"{digest}"'
+
+    # If-None-Match is evaluated against the digest (the ETag of stat_file)
+    resp = falcon.Response()
+    provider.send_file(resp, 'a.txt', req=testing.create_req(headers={'If-None-Match': digest}))
+    assert resp.status == falcon.HTTP_304 and resp.stream is None
+    assert resp.etag == f'"{digest}"'
+    resp = falcon.Response()
+    provider.send_file(resp, 'a.txt', req=testing.create_req(headers={'If-None-Match': '"x"'}))
+    assert resp.stream.read() == contents
+    resp.stream.close()
+
+
+def test_local_dedupe_provider_save_during_collection(storage_directory) -> None:
+    """Testing a save_file reusing a blob while the blob is deleted by collect_garbage
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    prefix = f'{uuid4()}'
+    local_provider = LocalStorageProvider(bucket=storage_directory)
+    provider = DeduplicatingStorageProvider(
+        local_provider,
+        blob_prefix=f'{prefix}/blobs/',
+        ref_prefix=f'{prefix}/refs/',
+        collect_marker=f'{prefix}/collecting',
+    )
+    contents = b'collected contents'
+    provider.save_file(contents, 'a.txt')
+    provider.delete_file('a.txt')
+
+    # the ref of b.txt is written after the second listing of the refs of the collection
+    referenced = provider._referenced  # pylint: disable=protected-access
+    calls = []
+
+    def referenced_then_save() -> set[str]:
+        result = referenced()
+        calls.append(result)
+        if len(calls) == 2:
+            thread.start()
+            deadline = time.monotonic() + 5
+            while not local_provider.is_file(f'{prefix}/refs/b.txt'):
+                assert time.monotonic() < deadline, 'ref was not written'
+                time.sleep(0.01)
+        return result
+
+    thread = threading.Thread(target=provider.save_file, args=(contents, 'b.txt'))
+    provider._referenced = referenced_then_save  # pylint: disable=protected-access
+    assert len(provider.collect_garbage(min_age=0)) == 1
+    thread.join(5)
+    assert not thread.is_alive()
+    assert provider.get_file('b.txt') == contents
+    assert not local_provider.is_file(f'{prefix}/collecting')
@@ -1,14 +1,32 @@
 """Test hooks feature of falcon_provider_memcache module."""
 # standard library
 import binascii
+import gzip
+import io
 import json
+import logging
 import os
+import subprocess  # nosec
+import sys
+import threading
+import time
 from uuid import uuid4
 
 # third-party
+import falcon
+import pytest
+from falcon import testing
 from falcon.testing import Result
 
 # first-party
+from falcon_provider_storage.cache import (
+    CachingStorageProvider,
+    ExistenceCacheStorageProvider,
+    TieredStorageProvider,
+)
+from falcon_provider_storage.compression import CompressingStorageProvider
+from falcon_provider_storage.instrumentation import LoggingListener, PrometheusListener
+from falcon_provider_storage.singleflight import SingleFlightStorageProvider
 from falcon_provider_storage.utils import LocalStorageProvider
 
 
@@ -112,6 +130,652 @@ def test_local_file_exists(client_local_storage_1, storage_directory) -> None:
     assert response.text == key
 
 
+def test_local_file_stream(client_local_storage_1, storage_directory) -> None:
+    """Testing GET resource with a streamed response
+
+    Args:
+        client_local_storage_1 (fixture): The test client.
+        storage_directory (fixture): The storage directory.
+    """
+    key = f'{uuid4()}'
+
+    # create file in storage to read
+    filename: str = os.path.join(storage_directory, f'{key}.txt')
+    with open(filename, 'w', encoding='utf-8') as fh:
+        fh.write(key * 1000)
+
+    params = {'filename': f'{key}.txt', 'stream': 'true'}
+    response: Result = client_local_storage_1.simulate_get('/middleware', params=params)
+    assert response.status_code == 200
+    assert response.text == key * 1000
+
+
+def test_local_get_file_range(storage_directory) -> None:
+    """Testing byte range reads
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    file_key = f'{uuid4()}'
+    provider = LocalStorageProvider(bucket=storage_directory)
+    provider.save_file(b'0123456789', f'{file_key}.txt')
+
+    assert provider.get_file_range(f'{file_key}.txt', 2, 4) == (b'234', (2, 4, 10))
+    assert provider.get_file_range(f'{file_key}.txt', 8) == (b'89', (8, 9, 10))
+    assert provider.get_file_range(f'{file_key}.txt', -3) == (b'789', (7, 9, 10))
+
+    contents, content_range = provider.get_file_range(f'{file_key}.txt', 3, 5, stream=True)
+    assert contents.read() == b'345'
+    assert content_range == (3, 5, 10)
+    contents.close()
+
+
+def test_local_file_not_modified(client_local_storage_1, storage_directory) -> None:
+    """Testing GET resource with conditional request headers
+
+    Args:
+        client_local_storage_1 (fixture): The test client.
+        storage_directory (fixture): The storage directory.
+    """
+    key = f'{uuid4()}'
+
+    # create file in storage to read
+    filename: str = os.path.join(storage_directory, f'{key}.txt')
+    with open(filename, 'w', encoding='utf-8') as fh:
+        fh.write(key)
+
+    params = {'filename': f'{key}.txt', 'conditional': 'true'}
+    response: Result = client_local_storage_1.simulate_get('/middleware', params=params)
+    assert response.status_code == 200
+    assert response.text == key
+    etag = response.headers.get('etag')
+    last_modified = response.headers.get('last-modified')
+
+    response: Result = client_local_storage_1.simulate_get(
+        '/middleware', params=params, headers={'If-None-Match': etag}
+    )
+    assert response.status_code == 304
+    assert response.text == ''
+
+    response: Result = client_local_storage_1.simulate_get(
+        '/middleware', params=params, headers={'If-Modified-Since': last_modified}
+    )
+    assert response.status_code == 304
+
+    response: Result = client_local_storage_1.simulate_get(
+        '/middleware', params=params, headers={'If-None-Match': '"stale"'}
+    )
+    assert response.status_code == 200
+    assert response.text == key
+
+
+def test_local_stat_file(storage_directory) -> None:
+    """Testing file metadata
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    file_key = f'{uuid4()}'
+    provider = LocalStorageProvider(bucket=storage_directory)
+    provider.save_file(b'0123456789', f'{file_key}.txt')
+
+    file_info = provider.stat_file(f'{file_key}.txt')
+    assert file_info.key == f'{file_key}.txt'
+    assert file_info.size == 10
+    assert file_info.content_type == 'text/plain'
+    assert file_info.etag and file_info.mtime.tzinfo is not None
+    assert not hasattr(file_info, '__dict__')
+
+
+def test_local_delete_files(storage_directory) -> None:
+    """Testing bulk delete
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    provider = LocalStorageProvider(bucket=storage_directory, max_workers=2)
+    filenames = [provider.save_file(b'delete me', f'{uuid4()}.txt') for _ in range(5)]
+    missing = os.path.join(storage_directory, f'{uuid4()}.txt')
+
+    results = provider.delete_files(filenames + [missing])
+    assert results == {**{filename: True for filename in filenames}, missing: False}
+    assert not any(os.path.isfile(filename) for filename in filenames)
+
+
+def test_local_get_save_files(storage_directory) -> None:
+    """Testing parallel batch get and save
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    provider = LocalStorageProvider(bucket=storage_directory, max_workers=4)
+    keys = [f'{uuid4()}' for _ in range(10)]
+
+    paths = provider.save_files([(key.encode(), f'{key}.txt') for key in keys])
+    assert paths == [os.path.join(storage_directory, f'{key}.txt') for key in keys]
+
+    # results in order
+    assert provider.get_files([f'{key}.txt' for key in keys]) == [key.encode() for key in keys]
+
+    # results as completed
+    results = dict(provider.get_files([f'{key}.txt' for key in keys], as_completed=True))
+    assert results == {f'{key}.txt': key.encode() for key in keys}
+
+
+def test_local_caching_provider(storage_directory) -> None:
+    """Testing the LRU read cache
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    keys = [f'{uuid4()}' for _ in range(4)]
+    provider = CachingStorageProvider(
+        LocalStorageProvider(bucket=storage_directory), max_bytes=100, max_item_bytes=40
+    )
+    for key in keys:
+        provider.save_file(key.encode(), f'{key}.txt')
+
+    # each key is 36 bytes, so only the two most recently used keys fit in the cache
+    for key in keys:
+        assert provider.get_file(f'{key}.txt') == key.encode()
+    assert len(provider) == 2 and provider.size == 72
+    assert provider.get_file(f'{keys[-1]}.txt') == keys[-1].encode()
+    assert provider.hits == 1 and provider.misses == 4
+
+    # files larger than max_item_bytes are not cached
+    provider.save_file(b'x' * 50, f'{keys[0]}.txt')
+    assert provider.get_file(f'{keys[0]}.txt') == b'x' * 50
+    assert len(provider) == 2
+
+    # writes invalidate the cache
+    provider.save_file(b'updated', f'{keys[-1]}.txt')
+    assert provider.get_file(f'{keys[-1]}.txt') == b'updated'
+    assert provider.get_file_range(f'{keys[-1]}.txt', 0, 2) == (b'upd', (0, 2, 7))
+
+    # deletes (with the paths of delete_file) invalidate the cache
+    assert provider.get_file(f'{keys[-2]}.txt') == keys[-2].encode()
+    assert len(provider) == 2
+    assert provider.delete_file(provider.storage_path(f'{keys[-1]}.txt')) is True
+    assert provider.delete_files([provider.storage_path(f'{keys[-2]}.txt')]) == {
+        provider.storage_path(f'{keys[-2]}.txt'): True
+    }
+    assert len(provider) == 0
+    for key in keys[-2:]:
+        try:
+            provider.get_file(f'{key}.txt')
+            assert False, 'deleted file returned from the cache'
+        except falcon.HTTPError:
+            pass
+
+
+def test_local_existence_cache_provider(storage_directory) -> None:
+    """Testing the is_file existence cache
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    key = f'{uuid4()}.txt'
+    provider = ExistenceCacheStorageProvider(
+        LocalStorageProvider(bucket=storage_directory), ttl=60, negative_ttl=60
+    )
+
+    # negative results are cached
+    assert provider.is_file(key) is False
+    assert provider.is_file(key) is False
+    assert provider.hits == 1 and provider.misses == 1
+
+    # writes invalidate the cache
+    provider.save_file(b'contents', key)
+    assert provider.is_file(key) is True
+    assert provider.is_file(key) is True
+    assert provider.hits == 2 and provider.misses == 2
+
+    # files deleted outside of the provider are reported until the ttl expires
+    os.remove(os.path.join(storage_directory, key))
+    assert provider.is_file(key) is True
+    provider.invalidate(key)
+    assert provider.is_file(key) is False
+
+    # deletes (with the paths of delete_file) invalidate the cache
+    provider.save_file(b'contents', key)
+    assert provider.is_file(key) is True
+    assert provider.delete_file(provider.storage_path(key)) is True
+    assert provider.is_file(key) is False
+    provider.save_file(b'contents', key)
+    assert provider.is_file(key) is True
+    assert provider.delete_files([provider.storage_path(key)]) == {provider.storage_path(key): True}
+    assert provider.is_file(key) is False
+
+
+def test_local_compressing_provider(storage_directory) -> None:
+    """Testing the compressing provider
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    prefix = f'{uuid4()}'
+    local_provider = LocalStorageProvider(bucket=storage_directory)
+    provider = CompressingStorageProvider(local_provider, level=9, buffer_size=1024)
+    contents = json.dumps([{'id': index, 'name': 'compressible'} for index in range(1000)])
+
+    # compressible files are stored compressed, others are stored as is
+    provider.save_file(contents, f'{prefix}/data.json')
+    provider.save_file(io.BytesIO(contents.encode()), f'{prefix}/app.log')
+    provider.save_file(contents.encode(), f'{prefix}/data.bin')
+    # text mode saves store the compressed bytes
+    provider.save_file(io.StringIO(contents), f'{prefix}/text.csv', mode='w')
+    assert provider.get_file(f'{prefix}/text.csv', mode='r') == contents
+    stored = local_provider.get_file(f'{prefix}/app.log')
+    assert stored[:2] == b'\x1f\x8b' and len(stored) < len(contents) / 10
+    assert gzip.decompress(local_provider.get_file(f'{prefix}/data.json')) == contents.encode()
+    assert local_provider.get_file(f'{prefix}/data.bin') == contents.encode()
+
+    # reads return the original contents
+    for key in ['data.json', 'app.log', 'data.bin']:
+        assert provider.get_file(f'{prefix}/{key}') == contents.encode()
+        assert provider.get_file(f'{prefix}/{key}', mode='r') == contents
+    with provider.get_file(f'{prefix}/app.log', stream=True) as fh:
+        assert fh.read() == contents.encode()
+    # closing the reader closes the stored file
+    assert fh.closed and fh.fh.closed
+    with provider.get_file(f'{prefix}/app.log', mode='r', stream=True) as fh:
+        assert fh.read() == contents
+    assert provider.get_file_range(f'{prefix}/data.json', -5) == (
+        contents[-5:].encode(),
+        (len(contents) - 5, len(contents) - 1, len(contents)),
+    )
+
+    # the compressed bytes are sent when the request accepts the encoding
+    etag = local_provider.stat_file(f'{prefix}/data.json').etag
+    for accept_encoding, encoded in [
+        ('gzip, deflate, br', True),
+        ('br;q=1.0, *;q=0.5', True),
+        ('gzip;q=0, *', False),
+        (None, False),
+    ]:
+        headers = {'Accept-Encoding': accept_encoding} if accept_encoding else {}
+        req = testing.create_req(headers=headers)
+        resp = falcon.Response()
+        provider.send_file(resp, f'{prefix}/data.json', req=req)
+        body = resp.stream.read()
+        resp.stream.close()
+        assert resp.get_header('Vary') == 'Accept-Encoding'
+        assert resp.content_type == 'application/json'
+        if encoded:
+            assert resp.get_header('Content-Encoding') == 'gzip'
+            assert resp.etag == f'"{etag}-gzip"'
+            assert gzip.decompress(body) == contents.encode()
+        else:
+            assert resp.get_header('Content-Encoding') is None
+            assert resp.etag == f'"{etag}"'
+            assert body == contents.encode()
+
+    try:
+        CompressingStorageProvider(local_provider, algorithm='brotli')
+        assert False, 'invalid algorithm accepted'
+    except ValueError:
+        pass
+
+
+def test_local_compressing_provider_not_modified(storage_directory) -> None:
+    """Testing conditional requests of the compressed and decompressed representations
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    key = f'{uuid4()}/data.json'
+    local_provider = LocalStorageProvider(bucket=storage_directory)
+    provider = CompressingStorageProvider(local_provider)
+    provider.save_file(json.dumps({'name': 'compressible'}), key)
+    etag = local_provider.stat_file(key).etag
+
+    # If-None-Match only matches the ETag of the representation that would be sent
+    for accept_encoding, if_none_match, not_modified in [
+        ('gzip', f'"{etag}-gzip"', True),
+        ('gzip', f'"{etag}"', False),
+        ('identity', f'"{etag}-gzip"', False),
+        ('identity', f'"{etag}"', True),
+    ]:
+        headers = {'Accept-Encoding': accept_encoding, 'If-None-Match': if_none_match}
+        resp = falcon.Response()
+        provider.send_file(resp, key, req=testing.create_req(headers=headers))
+        assert (resp.status == falcon.HTTP_304) is not_modified
+        if resp.stream is not None:
+            resp.stream.close()
+
+
+def test_local_compressing_provider_zstd(storage_directory) -> None:
+    """Testing the compressing provider with the zstd algorithm
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    zstandard = pytest.importorskip('zstandard')
+    prefix = f'{uuid4()}'
+    local_provider = LocalStorageProvider(bucket=storage_directory)
+    provider = CompressingStorageProvider(local_provider, algorithm='zstd', buffer_size=1024)
+    contents = json.dumps([{'id': index, 'name': 'compressible'} for index in range(1000)])
+
+    provider.save_file(contents, f'{prefix}/data.json')
+    provider.save_file(io.BytesIO(contents.encode()), f'{prefix}/app.log')
+    stored = local_provider.get_file(f'{prefix}/app.log')
+    assert stored[:4] == b'\x28\xb5\x2f\xfd' and len(stored) < len(contents) / 10
+    decompressor = zstandard.ZstdDecompressor().decompressobj()
+    assert decompressor.decompress(local_provider.get_file(f'{prefix}/data.json')) == (
+        contents.encode()
+    )
+
+    for key in ['data.json', 'app.log']:
+        assert provider.get_file(f'{prefix}/{key}') == contents.encode()
+        assert provider.get_file(f'{prefix}/{key}', mode='r') == contents
+        with provider.get_file(f'{prefix}/{key}', stream=True) as fh:
+            assert fh.read() == contents.encode()
+        assert fh.fh.closed
+
+    req = testing.create_req(headers={'Accept-Encoding': 'zstd, gzip'})
+    resp = falcon.Response()
+    provider.send_file(resp, f'{prefix}/data.json', req=req)
+    body = resp.stream.read()
+    resp.stream.close()
+    assert resp.get_header('Content-Encoding') == 'zstd'
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(body) == contents.encode()
+
+
+def test_local_list_files(storage_directory) -> None:
+    """Testing listing files
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    prefix = f'{uuid4()}'
+    provider = LocalStorageProvider(bucket=storage_directory)
+    for key in ['a.txt', 'b.json', 'sub/c.txt', 'sub/deep/d.txt']:
+        provider.save_file(b'contents', f'{prefix}/{key}')
+
+    # symlinked directories (e.g., a loop, or a directory outside of the bucket) are not walked
+    os.symlink('..', os.path.join(storage_directory, prefix, 'sub', 'loop'))
+    os.symlink(os.path.abspath('tests'), os.path.join(storage_directory, prefix, 'outside'))
+
+    files = sorted(provider.list_files(f'{prefix}/'), key=lambda f: f.key)
+    assert [f.key for f in files] == [
+        f'{prefix}/a.txt',
+        f'{prefix}/b.json',
+        f'{prefix}/sub/c.txt',
+        f'{prefix}/sub/deep/d.txt',
+    ]
+    assert files[0].size == 8 and files[0].content_type == 'text/plain'
+    assert files[0].etag == provider.stat_file(f'{prefix}/a.txt').etag
+
+    keys = sorted(f.key for f in provider.list_files(f'{prefix}/', recursive=False))
+    assert keys == [f'{prefix}/a.txt', f'{prefix}/b.json']
+
+    keys = sorted(f.key for f in provider.list_files(f'{prefix}/sub/d'))
+    assert keys == [f'{prefix}/sub/deep/d.txt']
+    assert not list(provider.list_files(f'{prefix}/missing/'))
+
+
+def test_local_single_flight_provider(storage_directory) -> None:
+    """Testing coalescing of concurrent reads
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+
+    class BlockingStorageProvider(LocalStorageProvider):
+        """Local storage provider that blocks reads until released."""
+
+        calls = 0
+        entered = threading.Event()
+        release = threading.Event()
+
+        def get_file(self, path: str, **kwargs) -> bytes:
+            """Return file from storage once released."""
+            self.calls += 1
+            self.entered.set()
+            self.release.wait(5)
+            return super().get_file(path, **kwargs)
+
+    key = f'{uuid4()}'
+    origin = BlockingStorageProvider(bucket=storage_directory)
+    origin.save_file(key.encode(), f'{key}.txt')
+    provider = SingleFlightStorageProvider(origin)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(provider.get_file(f'{key}.txt')))
+        for _ in range(5)
+    ]
+    threads[0].start()
+    origin.entered.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.1)
+    origin.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [key.encode()] * 5
+    assert origin.calls == 1
+    assert len(provider.single_flight) == 0
+
+
+def test_local_tiered_provider(storage_directory) -> None:
+    """Testing the local disk read-through cache
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    cache_name = f'cache-{uuid4()}'
+    origin_name = f'origin-{uuid4()}'
+    cache_directory = os.path.join(storage_directory, cache_name)
+    origin_directory = os.path.join(storage_directory, origin_name)
+    os.makedirs(cache_directory)
+    os.makedirs(origin_directory)
+
+    origin = LocalStorageProvider(bucket=origin_directory)
+    provider = TieredStorageProvider(
+        origin, LocalStorageProvider(bucket=cache_directory), max_bytes=100
+    )
+    keys = [f'{uuid4()}' for _ in range(4)]
+    for key in keys:
+        provider.save_file(key.encode(), f'{key}.txt')
+
+    # each key is 36 bytes, so only the two most recently used keys fit in the cache
+    for key in keys:
+        assert provider.get_file(f'{key}.txt') == key.encode()
+    assert len(provider) == 2 and provider.size == 72
+    assert sorted(os.listdir(cache_directory)) == sorted(f'{key}.txt' for key in keys[-2:])
+
+    # reads are served from the cache directory
+    os.remove(os.path.join(origin_directory, f'{keys[-1]}.txt'))
+    assert provider.get_file(f'{keys[-1]}.txt') == keys[-1].encode()
+    assert provider.get_file_range(f'{keys[-1]}.txt', 0, 2) == (keys[-1][:3].encode(), (0, 2, 36))
+    assert provider.is_file(f'{keys[-1]}.txt') is True
+
+    # writes invalidate the cache
+    provider.save_file(b'updated', f'{keys[-2]}.txt')
+    assert not os.path.isfile(os.path.join(cache_directory, f'{keys[-2]}.txt'))
+    assert provider.get_file(f'{keys[-2]}.txt') == b'updated'
+
+    # deletes (with the paths of delete_file) invalidate the cache
+    assert provider.delete_file(provider.storage_path(f'{keys[-2]}.txt')) is True
+    assert not os.path.isfile(os.path.join(cache_directory, f'{keys[-2]}.txt'))
+    # the file was removed from the origin above, but is still removed from the cache
+    assert provider.delete_files([provider.storage_path(f'{keys[-1]}.txt')]) == {
+        provider.storage_path(f'{keys[-1]}.txt'): False
+    }
+    assert len(provider) == 0 and not os.listdir(cache_directory)
+    provider.save_file(b'updated', f'{keys[-2]}.txt')
+    provider.save_file(keys[-1].encode(), f'{keys[-1]}.txt')
+    assert provider.get_file(f'{keys[-2]}.txt') == b'updated'
+    assert provider.get_file(f'{keys[-1]}.txt') == keys[-1].encode()
+
+    # the cache index is rebuilt from the cache directory
+    provider = TieredStorageProvider(origin, LocalStorageProvider(bucket=cache_directory))
+    assert len(provider) == 2 and provider.size == 43
+
+    # paths outside of the cache directory are not cached
+    assert provider.get_file(f'../{origin_name}/{keys[0]}.txt') == keys[0].encode()
+    assert len(provider) == 2
+
+    # files removed from the cache between the download and the read are read from the origin
+    download = provider._download  # pylint: disable=protected-access
+
+    def download_then_evict(path: str) -> bool:
+        cached = download(path)
+        provider.invalidate(path)
+        return cached
+
+    provider._download = download_then_evict  # pylint: disable=protected-access
+    assert provider.get_file(f'{keys[0]}.txt') == keys[0].encode()
+    assert provider.get_file_range(f'{keys[0]}.txt', 0, 3) == (keys[0][:4].encode(), (0, 3, 36))
+    resp = falcon.Response()
+    provider.send_file(resp, f'{keys[0]}.txt')
+    assert resp.stream.read() == keys[0].encode()
+    resp.stream.close()
+
+
+def test_local_tiered_provider_write_during_download(storage_directory) -> None:
+    """Testing a file written while it is downloaded is not cached with the previous contents
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    key = f'{uuid4()}.txt'
+    cache_directory = os.path.join(storage_directory, f'cache-{uuid4()}')
+    origin_directory = os.path.join(storage_directory, f'origin-{uuid4()}')
+    os.makedirs(cache_directory)
+    os.makedirs(origin_directory)
+
+    # atomic writes replace the file, so an open download stream keeps the previous contents
+    origin = LocalStorageProvider(bucket=origin_directory, atomic=True)
+    provider = TieredStorageProvider(origin, LocalStorageProvider(bucket=cache_directory))
+    origin.save_file(b'previous', key)
+    get_file = origin.get_file
+
+    def get_file_then_save(path: str, **kwargs) -> object:
+        # the download stream is opened before the write
+        fh = get_file(path, **kwargs)
+        origin.get_file = get_file
+        provider.save_file(b'current', path)
+        return fh
+
+    origin.get_file = get_file_then_save
+    assert provider.get_file(key) == b'current'
+    assert key not in provider._entries  # pylint: disable=protected-access
+    assert not os.path.isfile(os.path.join(cache_directory, key))
+    assert provider.get_file(key) == b'current'
+
+
+def test_local_binding(client_local_storage_2, storage_directory) -> None:
+    """Testing the context and registration bindings
+
+    Args:
+        client_local_storage_2 (fixture): The test client.
+        storage_directory (fixture): The storage directory.
+    """
+    key = f'{uuid4()}'
+    with open(os.path.join(storage_directory, f'{key}.txt'), 'w', encoding='utf-8') as fh:
+        fh.write(key)
+
+    params = {'filename': f'{key}.txt'}
+    for route in ['/context', '/bound']:
+        response: Result = client_local_storage_2.simulate_get(route, params=params)
+        assert response.status_code == 200
+        assert response.text == key
+
+
+def test_local_instrumentation(caplog, storage_directory) -> None:
+    """Testing the instrumentation listeners
+
+    Args:
+        caplog (fixture): The pytest log capture.
+        storage_directory (fixture): The storage directory.
+    """
+    events = []
+    key = f'{uuid4()}.txt'
+    provider = LocalStorageProvider(bucket=storage_directory)
+    provider.add_listener(events.append)
+    provider.add_listener(LoggingListener(level=logging.INFO))
+
+    with caplog.at_level(logging.INFO, logger='falcon_provider_storage'):
+        provider.save_file(io.BytesIO(b'0123456789'), key)
+        assert provider.get_file(key) == b'0123456789'
+        assert provider.is_file(key) is True
+        try:
+            provider.stat_file(f'{uuid4()}.txt')
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+    assert [(e.operation, e.path, e.bytes_transferred, e.outcome) for e in events] == [
+        ('save_file', key, 10, 'success'),
+        ('get_file', key, 10, 'success'),
+        ('is_file', key, None, 'success'),
+        ('stat_file', events[-1].path, None, 'error'),
+    ]
+    assert all(e.bucket == storage_directory and e.duration >= 0 for e in events)
+    assert (
+        f'storage get_file provider=LocalStorageProvider bucket={storage_directory}' in caplog.text
+    )
+    assert caplog.records[-1].levelno == logging.WARNING
+
+    provider.remove_listener(events.append)
+    provider.get_file(key)
+    assert len(events) == 4
+
+
+def test_local_prometheus_listener(storage_directory) -> None:
+    """Testing the Prometheus listener
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    prometheus_client = pytest.importorskip('prometheus_client')
+    key = f'{uuid4()}.txt'
+    registry = prometheus_client.CollectorRegistry()
+    provider = LocalStorageProvider(bucket=storage_directory)
+    provider.add_listener(PrometheusListener(namespace='test', registry=registry, buckets=(1,)))
+
+    provider.save_file(b'0123456789', key)
+    provider.get_file(key)
+    provider.get_file(key)
+    try:
+        provider.stat_file(f'{uuid4()}.txt')
+    except Exception:  # pylint: disable=broad-except
+        pass
+
+    labels = {'provider': 'LocalStorageProvider', 'bucket': storage_directory}
+    for operation, outcome, count in [
+        ('get_file', 'success', 2),
+        ('save_file', 'success', 1),
+        ('stat_file', 'error', 1),
+    ]:
+        assert (
+            registry.get_sample_value(
+                'test_operations_total', {**labels, 'operation': operation, 'outcome': outcome}
+            )
+            == count
+        )
+    assert registry.get_sample_value('test_bytes_total', {**labels, 'operation': 'get_file'}) == 20
+    assert (
+        registry.get_sample_value(
+            'test_operation_duration_seconds_count', {**labels, 'operation': 'save_file'}
+        )
+        == 1
+    )
+
+
+def test_local_lazy_import() -> None:
+    """Testing that the local provider, middleware, and hooks do not import botocore."""
+    code = (
+        'import sys\n'
+        'import falcon_provider_storage.hook, falcon_provider_storage.middleware\n'
+        'from falcon_provider_storage import LocalStorageProvider\n'
+        'assert "botocore" not in sys.modules'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)  # nosec
+
+
 def test_local_does_not_exists(client_local_storage_1) -> None:
     """Testing GET resource
 
@@ -150,6 +814,82 @@ def test_local_file_upload(client_local_storage_1, storage_directory) -> None:
         assert False, 'Uploaded file does not exist in storage'
 
 
+def test_local_save_file_chunked(storage_directory) -> None:
+    """Testing file-like contents are written in bounded chunks
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    file_key = f'{uuid4()}'
+    contents = io.BytesIO(os.urandom(10000))
+    read_sizes = []
+
+    def read(size: int = -1) -> bytes:
+        """Record the size of each read."""
+        read_sizes.append(size)
+        return io.BytesIO.read(contents, size)
+
+    contents.read = read
+    provider = LocalStorageProvider(bucket=storage_directory, buffer_size=1024)
+    filename = provider.save_file(contents, f'{file_key}.bin')
+
+    assert read_sizes and max(read_sizes) == 1024
+    with open(filename, 'rb') as fh:
+        assert fh.read() == contents.getvalue()
+
+
+def test_local_save_file_atomic(storage_directory) -> None:
+    """Testing atomic writes never expose a partially written file
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    file_key = f'{uuid4()}'
+    provider = LocalStorageProvider(
+        bucket=storage_directory, buffer_size=1024, atomic=True, fsync='directory'
+    )
+    filename = provider.save_file(b'original', f'{file_key}.bin')
+
+    contents = io.BytesIO(os.urandom(10000))
+    observed = []
+
+    def read(size: int = -1) -> bytes:
+        """Record the contents of the destination file during the write."""
+        with open(filename, 'rb') as fh:
+            observed.append(fh.read())
+        return io.BytesIO.read(contents, size)
+
+    contents.read = read
+    provider.save_file(contents, f'{file_key}.bin')
+
+    assert set(observed) == {b'original'}
+    with open(filename, 'rb') as fh:
+        assert fh.read() == contents.getvalue()
+
+    # the temp file was renamed into place
+    assert not [f for f in os.listdir(storage_directory) if f.startswith(f'.{file_key}')]
+
+
+def test_local_bad_fsync_policy(storage_directory) -> None:
+    """Testing an invalid fsync policy
+
+    Args:
+        storage_directory (fixture): The storage directory.
+    """
+    try:
+        LocalStorageProvider(bucket=storage_directory, fsync='always')
+        assert False, 'Bad fsync policy not caught'
+    except ValueError:
+        assert True
+
+    provider = LocalStorageProvider(bucket=storage_directory)
+    try:
+        provider.save_file(b'contents', f'{uuid4()}.bin', fsync='always')
+        assert False, 'Bad save_file fsync policy not caught'
+    except ValueError:
+        assert True
+
+
 # def test_local_file_upload_fail(client_local_storage_1) -> None:
 #     """Testing POSt resource
 #
@@ -27,6 +27,9 @@ class S3StorageResource1:
         filename: str = req.get_param('filename')
         if self.is_file(filename):  # code coverage testing of is_file
             pass
+        if req.get_param_as_bool('stream'):
+            resp.stream = self.get_file(filename, stream=True)
+            return
         resp.text = self.get_file(filename)
 
     def on_post(self, req: falcon.Request, resp: falcon.Response) -> None:
@@ -8,8 +8,14 @@ from uuid import uuid4
 
 # third-party
 import botocore
+import botocore.config
+import falcon
+from botocore.stub import Stubber
 from falcon.testing import Result
 
+# first-party
+from falcon_provider_storage.utils import S3StorageProvider
+
 
 def create_multipart_formdata(fields: list) -> tuple[str, dict]:
     """Create form data.
@@ -92,6 +98,235 @@ def test_s3_file_delete_404(client_s3_storage_1: object) -> None:
     assert response.status_code == 404
 
 
+def test_s3_file_delete_conditional(s3_bucket: str) -> None:
+    """Testing single request (conditional) delete
+
+    The S3 responses are stubbed, since S3 compatible test servers (e.g., moto) do not support
+    the ``If-Match: *`` condition of DeleteObject.
+
+    Args:
+        s3_bucket (fixture): The s3 bucket name.
+    """
+    key = f'{uuid4()}.txt'
+    provider = S3StorageProvider(
+        bucket=s3_bucket,
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+        conditional_delete=True,
+    )
+    params = {'Bucket': s3_bucket, 'Key': key, 'IfMatch': '*'}
+    with Stubber(provider.client) as stubber:
+        stubber.add_response('delete_object', {}, params)
+        # a missing file is reported as 404 (NoSuchKey) or 412 (PreconditionFailed)
+        stubber.add_client_error('delete_object', 'NoSuchKey', http_status_code=404)
+        stubber.add_client_error('delete_object', 'PreconditionFailed', http_status_code=412)
+        stubber.add_client_error('delete_object', 'AccessDenied', http_status_code=403)
+        stubber.add_client_error('delete_object', 'SlowDown', http_status_code=503)
+
+        assert provider.delete_file(key) is True
+        assert provider.delete_file(key) is False
+        assert provider.delete_file(key) is False
+        for _ in range(2):
+            try:
+                provider.delete_file(key)
+                assert False, 'delete error reported as a missing file'
+            except falcon.HTTPInternalServerError:
+                pass
+        stubber.assert_no_pending_responses()
+
+
+def test_s3_delete_files(s3_client: object, s3_resource: object, s3_bucket: str) -> None:
+    """Testing bulk delete
+
+    Args:
+        s3_client (fixture): A S3 client object.
+        s3_resource (fixture): A S3 resource object.
+        s3_bucket (fixture): The s3 bucket name.
+    """
+    keys = [f'{uuid4()}.txt' for _ in range(5)]
+    for key in keys:
+        s3_client.upload_fileobj(io.BytesIO(key.encode()), s3_bucket, key)
+
+    provider = S3StorageProvider(
+        bucket=s3_bucket,
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+    )
+    provider.delete_batch_size = 2
+    assert provider.delete_files(keys) == {key: True for key in keys}
+    for key in keys:
+        try:
+            s3_resource.Object(s3_bucket, key).load()
+            assert False, 'File was not deleted'
+        except botocore.exceptions.ClientError:
+            assert True
+
+
+def test_s3_delete_files_stubbed(s3_bucket: str) -> None:
+    """Testing bulk delete of keys S3 fails to delete and of failed requests
+
+    Args:
+        s3_bucket (fixture): The s3 bucket name.
+    """
+    provider = S3StorageProvider(
+        bucket=s3_bucket,
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+    )
+    response = {
+        'Deleted': [{'Key': 'a.txt'}],
+        'Errors': [{'Key': 'b.txt', 'Code': 'AccessDenied', 'Message': 'Access Denied'}],
+    }
+    with Stubber(provider.client) as stubber:
+        stubber.add_response('delete_objects', response)
+        stubber.add_client_error('delete_objects', 'AccessDenied', http_status_code=403)
+
+        assert provider.delete_files(['a.txt', 'b.txt']) == {'a.txt': True, 'b.txt': False}
+        try:
+            provider.delete_files(['a.txt', 'b.txt'])
+            assert False, 'failed delete request was not reported'
+        except falcon.HTTPInternalServerError:
+            pass
+        stubber.assert_no_pending_responses()
+
+
+def test_s3_list_files(s3_client: object, s3_bucket: str) -> None:
+    """Testing listing files
+
+    Args:
+        s3_client (fixture): A S3 client object.
+        s3_bucket (fixture): The s3 bucket name.
+    """
+    prefix = f'{uuid4()}'
+    keys = [f'{prefix}/a.txt', f'{prefix}/b.txt', f'{prefix}/sub/c.txt']
+    for key in keys:
+        s3_client.upload_fileobj(io.BytesIO(b'contents'), s3_bucket, key)
+
+    provider = S3StorageProvider(
+        bucket=s3_bucket,
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+    )
+    files = list(provider.list_files(f'{prefix}/', page_size=1))
+    assert [f.key for f in files] == keys
+    assert files[0].size == 8
+    assert [f.key for f in provider.list_files(f'{prefix}/', recursive=False)] == keys[:2]
+    provider.delete_files(keys)
+
+
+def test_s3_save_file_multipart(s3_resource: object, s3_bucket: str) -> None:
+    """Testing multipart upload using the provider transfer settings
+
+    Args:
+        s3_resource (fixture): A S3 resource object.
+        s3_bucket (fixture): The s3 bucket name.
+    """
+    key = f'{uuid4()}.bin'
+    contents = os.urandom(6 * 1024 * 1024)
+
+    provider = S3StorageProvider(
+        bucket=s3_bucket,
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+        max_concurrency=2,
+        multipart_chunksize=5 * 1024 * 1024,
+        multipart_threshold=5 * 1024 * 1024,
+    )
+    assert provider.save_file(io.BytesIO(contents), key) == key
+    assert provider.get_file(key) == contents
+    # multipart uploads have an ETag suffix with the number of parts
+    assert provider.stat_file(key).etag.endswith('-2')
+
+    # per call override
+    assert provider.save_file(io.BytesIO(contents), key, use_threads=False) == key
+
+    # bytes and str contents are uploaded like file-like contents
+    assert provider.save_file(contents, key) == key
+    assert provider.get_file(key) == contents
+    assert provider.save_file('contents', key) == key
+    assert provider.get_file(key) == b'contents'
+    s3_resource.Object(s3_bucket, key).delete()
+
+
+def test_s3_client_config(s3_bucket: str) -> None:
+    """Testing the botocore client settings
+
+    Args:
+        s3_bucket (fixture): The s3 bucket name.
+    """
+    provider = S3StorageProvider(
+        bucket=s3_bucket,
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+        max_workers=32,
+        max_concurrency=4,
+    )
+    # the pool is sized for the bulk operation threads plus the upload threads
+    assert provider.client.meta.config.max_pool_connections == 36
+
+    provider = S3StorageProvider(
+        bucket=s3_bucket,
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+        client_config=botocore.config.Config(
+            connect_timeout=2,
+            max_pool_connections=16,
+            read_timeout=10,
+            retries={'mode': 'adaptive', 'total_max_attempts': 5},
+            tcp_keepalive=True,
+            user_agent_extra='tests',
+        ),
+        endpoint_url='http://localhost:9000',
+        max_pool_connections=64,
+    )
+    config = provider.client.meta.config
+    assert config.connect_timeout == 2 and config.read_timeout == 10
+    assert config.max_pool_connections == 64
+    assert config.retries == {'mode': 'adaptive', 'total_max_attempts': 5}
+    assert config.tcp_keepalive is True
+    assert config.user_agent_extra == 'tests'
+    assert provider.client.meta.endpoint_url == 'http://localhost:9000'
+
+    # the pool size of client_config is used when the provider does not set one
+    provider = S3StorageProvider(
+        bucket=s3_bucket,
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+        client_config=botocore.config.Config(max_pool_connections=16),
+    )
+    assert provider.client.meta.config.max_pool_connections == 16
+
+
+def test_s3_sessions_after_fork(s3_bucket: str) -> None:
+    """Testing the shared sessions are reset in a forked child
+
+    Args:
+        s3_bucket (fixture): The s3 bucket name.
+    """
+    provider = S3StorageProvider(
+        bucket=s3_bucket,
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+    )
+    # the resource is created once and shares the client of the provider
+    resource = provider.resource
+    assert provider.resource is resource
+    assert resource.meta.client is provider.client
+    assert provider.session in S3StorageProvider._sessions.values()  # pylint: disable=W0212
+    sessions_lock = S3StorageProvider._sessions_lock  # pylint: disable=protected-access
+
+    S3StorageProvider._after_fork()  # pylint: disable=protected-access
+    assert not S3StorageProvider._sessions  # pylint: disable=protected-access
+    assert S3StorageProvider._sessions_lock is not sessions_lock  # pylint: disable=W0212
+
+    new_provider = S3StorageProvider(
+        bucket=s3_bucket,
+        aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
+        aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
+    )
+    assert new_provider.session is not provider.session
+
+
 def test_s3_file_exists(
     client_s3_storage_1: object, s3_client: object, s3_resource: object, s3_bucket: str
 ) -> None:
@@ -119,6 +354,33 @@ def test_s3_file_exists(
     s3_resource.Object(s3_bucket, f'{key}.txt').delete()
 
 
+def test_s3_file_stream(
+    client_s3_storage_1: object, s3_client: object, s3_resource: object, s3_bucket: str
+) -> None:
+    """Testing GET resource with a streamed response
+
+    Args:
+        client_s3_storage_1 (fixture): The test client.
+        s3_client (fixture): A S3 client object.
+        s3_resource (fixture): A S3 resource object.
+        s3_bucket (fixture): The s3 bucket name.
+    """
+    key = f'{uuid4()}'
+    contents = io.BytesIO((key * 1000).encode())
+
+    # create file in storage to read
+    contents.seek(0)
+    s3_client.upload_fileobj(
+        contents, s3_bucket, f'{key}.txt', ExtraArgs={'ContentType': 'text/plain'}
+    )
+
+    params = {'filename': f'{key}.txt', 'stream': 'true'}
+    response: Result = client_s3_storage_1.simulate_get('/middleware', params=params)
+    assert response.status_code == 200
+    assert response.text == key * 1000
+    s3_resource.Object(s3_bucket, f'{key}.txt').delete()
+
+
 def test_s3_does_not_exists(client_s3_storage_1: object) -> None:
     """Testing GET resource
 
@@ -1,14 +1,16 @@
 """Testing conf module."""
 # standard library
 import os
+import shutil
 
 # third-party
 import boto3
 import pytest
 from falcon import testing
 
+from .LocalAsyncMiddleware.app import app_async_local_storage_1
 from .LocalHook.app import app_hook_local_storage_1
-from .LocalMiddleware.app import app_local_storage_1
+from .LocalMiddleware.app import app_local_storage_1, app_local_storage_2
 from .S3Hook.app import app_hook_s3_storage_1
 from .S3Middleware.app import app_s3_storage_1, app_s3_storage_2
 
@@ -22,12 +24,24 @@ def client_hook_local_storage_1() -> testing.TestClient:
     return testing.TestClient(app_hook_local_storage_1)
 
 
+@pytest.fixture
+def client_async_local_storage_1() -> testing.TestClient:
+    """Create testing client"""
+    return testing.TestClient(app_async_local_storage_1)
+
+
 @pytest.fixture
 def client_local_storage_1() -> testing.TestClient:
     """Create testing client"""
     return testing.TestClient(app_local_storage_1)
 
 
+@pytest.fixture
+def client_local_storage_2() -> testing.TestClient:
+    """Create testing client"""
+    return testing.TestClient(app_local_storage_2)
+
+
 @pytest.fixture
 def client_hook_s3_storage_1() -> testing.TestClient:
     """Create testing client"""
@@ -80,5 +94,8 @@ def pytest_unconfigure(config: object) -> None:  # pylint: disable=unused-argume
     if os.path.isdir(_storage_directory):
         for log_file in os.listdir(_storage_directory):
             file_path = os.path.join(_storage_directory, log_file)
-            if os.path.isfile(file_path):
+            if os.path.isdir(file_path) and not os.path.islink(file_path):
+                # the sub directories written by the prefix, tiered, and dedupe tests
+                shutil.rmtree(file_path)
+            else:
                 os.unlink(file_path)